@@ -1,16 +1,41 @@
+from uuid import uuid4
+
 from django.core.cache import cache
+from django.db import transaction
 from django.db.models.signals import post_delete, post_save
-from django.dispatch import receiver
 
 from availability.models import Event
 from career.models import Application
 
+WIDGET_CACHE_KEY_PREFIX = "analytics_widget"
+
+
+def _widget_generation_key(user_id):
+    return f"{WIDGET_CACHE_KEY_PREFIX}:generation:{user_id}"
+
+
+def bump_widget_generations(user_ids):
+    """Retire the cached widget results of ``user_ids`` once the current transaction commits."""
+    generation_keys = [_widget_generation_key(user_id) for user_id in user_ids if user_id is not None]
+    if not generation_keys:
+        return
+
+    def bump():
+        try:
+            cache.set_many({key: uuid4().hex for key in generation_keys}, timeout=None)
+        except Exception:
+            pass
+
+    transaction.on_commit(bump)
+
+
+def bump_widget_generation(user_id):
+    bump_widget_generations([user_id])
+
 
-def _bust_widget_cache(*args, **kwargs):
-    try:
-        cache.clear()
-    except Exception:
-        pass
+def _bust_widget_cache(sender, instance, **kwargs):
+    # Only the writer's widget results go stale; other cache entries are left alone.
+    bump_widget_generation(instance.user_id)
 
 
 # Connect the same handler to all four relevant signals
@@ -0,0 +1,160 @@
+import json
+from datetime import datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.forms.models import model_to_dict
+
+from career.models import (
+    AIArtifact,
+    Application,
+    ApplicationTimelineEntry,
+    Company,
+    Document,
+    Experience,
+    Offer,
+    OfferDecisionSnapshot,
+    Task,
+)
+from career.serializers import (
+    AIArtifactSerializer,
+    ApplicationExportSerializer,
+    DocumentExportSerializer,
+    ExperienceExportSerializer,
+    OfferDecisionSnapshotSerializer,
+    OfferExportSerializer,
+    TaskSerializer,
+)
+
+from .models import (
+    AvailabilityOverride,
+    AvailabilitySetting,
+    CustomHoliday,
+    Event,
+    EventCategory,
+    PublicBooking,
+    ShareLink,
+    UserSettings,
+)
+from .serializers import (
+    AvailabilityOverrideSerializer,
+    AvailabilitySettingSerializer,
+    CustomHolidaySerializer,
+    EventCategorySerializer,
+    EventSerializer,
+    PublicBookingSerializer,
+    ShareLinkSerializer,
+    UserSettingsSerializer,
+)
+from .utils import EXPORT_CHUNK_SIZE, iter_chunks, serialized_records
+
+ACCOUNT_EXPORT_SCHEMA = 'careerhub.account_export.v1'
+ACCOUNT_EXPORT_FILENAME = 'careerhub-account-export.json'
+
+
+def model_payload(instance, exclude=()):
+    data = model_to_dict(instance, exclude=list(exclude))
+    data.pop('user', None)
+    data.pop('id', None)
+    return data
+
+
+def _timeline_records(user):
+    entries = (
+        ApplicationTimelineEntry.objects
+        .filter(user=user)
+        .select_related('application', 'application__company')
+        .prefetch_related('documents')
+    )
+    for entry in entries.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield {
+            **model_payload(entry, exclude=('documents',)),
+            'application_role': entry.application.role_title,
+            'application_company': entry.application.company.name,
+            'documents': [document.title for document in entry.documents.all() if document.user_id == user.id],
+        }
+
+
+def _offer_decision_snapshot_records(user, context):
+    snapshots = (
+        OfferDecisionSnapshot.objects
+        .filter(user=user)
+        .select_related('offer', 'offer__application', 'offer__application__company')
+        
+    )
+    for snapshot in snapshots.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield {
+            **OfferDecisionSnapshotSerializer(snapshot, context=context).data,
+            'offer_company': snapshot.offer.application.company.name,
+            'offer_role': snapshot.offer.application.role_title,
+        }
+
+
+def account_export_sections(user, context):
+    """Return ``{group: [(section, records), ...]}`` with every ``records`` a lazy generator."""
+    return {
+        'availability': [
+            ('user_settings', serialized_records(UserSettings.objects.filter(user=user), UserSettingsSerializer, context)),
+            ('categories', serialized_records(EventCategory.objects.filter(user=user), EventCategorySerializer)),
+            ('events', serialized_records(Event.objects.filter(user=user), EventSerializer, context)),
+            ('holidays', serialized_records(CustomHoliday.objects.filter(user=user), CustomHolidaySerializer)),
+            (
+                'availability_overrides',
+                serialized_records(AvailabilityOverride.objects.filter(user=user), AvailabilityOverrideSerializer),
+            ),
+            (
+                'availability_settings',
+                serialized_records(AvailabilitySetting.objects.filter(user=user), AvailabilitySettingSerializer),
+            ),
+            ('share_links', serialized_records(ShareLink.objects.filter(user=user), ShareLinkSerializer)),
+            (
+                'public_bookings',
+                serialized_records(PublicBooking.objects.filter(share_link__user=user), PublicBookingSerializer),
+            ),
+        ],
+        'career': [
+            ('companies', (model_payload(company) for company in Company.objects.filter(user=user).iterator(chunk_size=EXPORT_CHUNK_SIZE))),
+            ('applications', serialized_records(Application.objects.filter(user=user), ApplicationExportSerializer)),
+            ('offers', serialized_records(Offer.objects.filter(application__user=user), OfferExportSerializer)),
+            ('documents', serialized_records(Document.objects.filter(user=user), DocumentExportSerializer, context)),
+            ('tasks', serialized_records(Task.objects.filter(user=user), TaskSerializer)),
+            ('experiences', serialized_records(Experience.objects.filter(user=user), ExperienceExportSerializer)),
+            ('application_timeline', _timeline_records(user)),
+            ('ai_artifacts', serialized_records(AIArtifact.objects.filter(user=user), AIArtifactSerializer, context)),
+            ('offer_decision_snapshots', _offer_decision_snapshot_records(user, context)),
+        ],
+    }
+
+
+def _encode(value):
+    return json.dumps(value, cls=DjangoJSONEncoder)
+
+
+def _iter_json_array(records, indent):
+    """Yield a JSON array one chunk of encoded records at a time."""
+    opened = False
+    for chunk in iter_chunks(records):
+        separator = ',\n' if opened else '[\n'
+        yield separator + ',\n'.join(f'{indent}  {_encode(record)}' for record in chunk)
+        opened = True
+    yield f'\n{indent}]' if opened else '[]'
+
+
+def iter_account_export_json(user, context):
+    """Yield the account export as JSON text, one section and one chunk of records at a time."""
+    account = {
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'full_name': getattr(user, 'full_name', '') or f'{user.first_name} {user.last_name}'.strip(),
+    }
+    yield '{\n'
+    yield f'  "schema": {_encode(ACCOUNT_EXPORT_SCHEMA)},\n'
+    yield f'  "exported_at": {_encode(datetime.utcnow().isoformat(timespec="seconds") + "Z")},\n'
+    yield f'  "account": {_encode(account)}'
+    for group, sections in account_export_sections(user, context).items():
+        yield f',\n  {_encode(group)}: {{'
+        for index, (section, records) in enumerate(sections):
+            yield f'{"," if index else ""}\n    {_encode(section)}: '
+            yield from _iter_json_array(records, '    ')
+        yield '\n  }'
+    yield '\n}\n'
@@ -0,0 +1,528 @@
+import json
+import tempfile
+from itertools import groupby
+from operator import itemgetter
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from career.models import (
+    AIArtifact,
+    Application,
+    ApplicationTimelineEntry,
+    Company,
+    Document,
+    Experience,
+    Offer,
+    OfferDecisionSnapshot,
+    Task,
+)
+
+from .account_export import ACCOUNT_EXPORT_SCHEMA
+from .availability_engine import bump_availability_version
+from .conflict_detector import detect_all_conflicts, get_event_datetime_range
+from .models import (
+    AvailabilityOverride,
+    AvailabilitySetting,
+    ConflictAlert,
+    CustomHoliday,
+    Event,
+    EventCategory,
+    PublicBooking,
+    ShareLink,
+    UserSettings,
+)
+from .recurrence import materialize_event_occurrences, occurrence_horizon_end
+from .serializers import UserSettingsSerializer
+from .utils import iter_chunks
+
+RESTORE_CHUNK_SIZE = 500
+# Restorable sections in the order the account export writes them.
+RESTORE_SECTIONS = (
+    ('availability', 'user_settings'),
+    ('availability', 'categories'),
+    ('availability', 'events'),
+    ('availability', 'holidays'),
+    ('career', 'companies'),
+    ('career', 'applications'),
+    ('career', 'tasks'),
+    ('career', 'ai_artifacts'),
+    ('career', 'offer_decision_snapshots'),
+)
+# Sections whose records resolve against rows restored by another section.
+RESTORE_DEPENDENCIES = {
+    ('availability', 'events'): (('availability', 'categories'),),
+    ('career', 'applications'): (('career', 'companies'),),
+    ('career', 'offer_decision_snapshots'): (('career', 'applications'),),
+}
+
+CATEGORY_FIELDS = ('name', 'color', 'icon', 'is_locked')
+HOLIDAY_FIELDS = ('date', 'group_id', 'description', 'holiday_type', 'is_recurring', 'is_locked', 'tab')
+EVENT_FIELDS = (
+    'name',
+    'date',
+    'start_time',
+    'end_time',
+    'timezone',
+    'color',
+    'location_type',
+    'location',
+    'meeting_link',
+    'is_recurring',
+    'recurrence_rule',
+    'notes',
+    'reminder_minutes',
+    'is_locked',
+)
+APPLICATION_FIELDS = (
+    'status',
+    'rto_policy',
+    'rto_days_per_week',
+    'commute_cost_value',
+    'commute_cost_frequency',
+    'free_food_perk_value',
+    'free_food_perk_frequency',
+    'tax_base_rate',
+    'tax_bonus_rate',
+    'tax_equity_rate',
+    'monthly_rent_override',
+    'current_round',
+    'job_link',
+    'salary_range',
+    'location',
+    'office_location',
+    'visa_sponsorship',
+    'day_one_gc',
+    'growth_score',
+    'work_life_score',
+    'brand_score',
+    'team_score',
+    'notes',
+    'date_applied',
+)
+TASK_FIELDS = ('title', 'description', 'status', 'priority', 'due_date', 'position')
+AI_ARTIFACT_FIELDS = ('artifact_type', 'client_id', 'title', 'summary', 'payload', 'is_locked', 'saved_at')
+SNAPSHOT_FIELDS = (
+    'title',
+    'notes',
+    'decision_score',
+    'rank',
+    'total_comp',
+    'adjusted_value',
+    'monthly_rent',
+    'commute_cost_annual',
+    'tax_snapshot',
+    'score_categories',
+    'offer_snapshot',
+    'adjustment_snapshot',
+    'is_locked',
+)
+
+# Marks a key that already exists and, like get_or_create, is left untouched.
+_KEEP = object()
+
+
+def _pick(item, fields):
+    # Missing keys fall back to the model defaults rather than NULL.
+    return {key: item[key] for key in fields if key in item}
+
+
+def _as_date(value):
+    return parse_date(value) if isinstance(value, str) else value
+
+
+def _as_datetime(value):
+    return parse_datetime(value) if isinstance(value, str) else value
+
+
+class AccountRestore:
+    """Restore a CareerHub account export one section at a time.
+
+    Existing rows are preloaded into key maps once per section, so each chunk
+    of records costs one ``bulk_create`` and at most one ``bulk_update``, and
+    each chunk commits in its own transaction. Callers restore sections in
+    ``RESTORE_SECTIONS`` order, or at least after their ``RESTORE_DEPENDENCIES``.
+    """
+
+    def __init__(self, user, mode='merge', context=None, chunk_size=RESTORE_CHUNK_SIZE):
+        self.user = user
+        self.mode = mode
+        self.context = context or {}
+        self.chunk_size = chunk_size
+        self.created_counts = {
+            'settings': 0,
+            'categories': 0,
+            'holidays': 0,
+            'events': 0,
+            'companies': 0,
+            'applications': 0,
+            'tasks': 0,
+            'ai_artifacts': 0,
+            'offer_decision_snapshots': 0,
+        }
+        self.category_map = {}
+        self.company_map = None
+
+    def clear(self):
+        user = self.user
+        with transaction.atomic():
+            ApplicationTimelineEntry.objects.filter(user=user).delete()
+            AIArtifact.objects.filter(user=user).delete()
+            OfferDecisionSnapshot.objects.filter(user=user).delete()
+            Task.objects.filter(user=user).delete()
+            Offer.objects.filter(application__user=user).delete()
+            Document.objects.filter(user=user).delete()
+            Experience.objects.filter(user=user).delete()
+            Application.objects.filter(user=user).delete()
+            Company.objects.filter(user=user).delete()
+            PublicBooking.objects.filter(share_link__user=user).delete()
+            ShareLink.objects.filter(user=user).delete()
+            AvailabilityOverride.objects.filter(user=user).delete()
+            AvailabilitySetting.objects.filter(user=user).delete()
+            Event.objects.filter(user=user).delete()
+            CustomHoliday.objects.filter(user=user).delete()
+            EventCategory.objects.filter(user=user).delete()
+
+    def restore_section(self, group, section, records):
+        handler = getattr(self, f'_restore_{group}_{section}', None)
+        if handler is not None:
+            handler(records)
+
+    def finish(self):
+        if self.created_counts['events'] or self.created_counts['holidays']:
+            # Bulk writes skip the per-row signals that keep these in sync.
+            bump_availability_version(self.user.id)
+        if self.created_counts['events']:
+            self._materialize_restored_series()
+            detect_all_conflicts(self.user)
+            self._drop_resolved_conflict_duplicates()
+        return self.created_counts
+
+    def _materialize_restored_series(self):
+        # bulk_create skips the post_save hook that stores a new series' occurrences.
+        parents = Event.objects.filter(
+            user=self.user,
+            is_recurring=True,
+            parent_event__isnull=True,
+            recurrence_rule__isnull=False,
+            occurrences_through__isnull=True,
+        )
+        through = occurrence_horizon_end()
+        for parent in parents.iterator():
+            materialize_event_occurrences(parent, through)
+
+    def _drop_resolved_conflict_duplicates(self):
+        # The sweep re-derives every pair; a merge keeps alerts the user already resolved.
+        resolved = ConflictAlert.objects.filter(event1__user=self.user, resolved=True).values_list('event1_id', 'event2_id')
+        pairs = Q()
+        for event1_id, event2_id in resolved:
+            pairs |= Q(event1_id=event1_id, event2_id=event2_id)
+        if pairs:
+            ConflictAlert.objects.filter(pairs, resolved=False).delete()
+
+    def _merge_chunk(self, model, rows, existing, count_key, update_fields=(), prepare=None):
+        """Create unseen keys and, when ``update_fields`` is set, update seen ones.
+
+        ``rows`` are ``(key, values)`` pairs; ``existing`` maps keys to saved
+        instances (or ``_KEEP``) and learns every key created here, so repeated
+        keys later in the backup behave like a second get/update_or_create.
+        Returns the instance each row resolved to.
+        """
+        to_create = []
+        to_update = {}
+        resolved = []
+        for key, values in rows:
+            obj = existing.get(key)
+            if obj is None:
+                obj = model(user=self.user, **values)
+                existing[key] = obj
+                to_create.append(obj)
+            elif update_fields and obj is not _KEEP:
+                for field in update_fields:
+                    if field in values:
+                        setattr(obj, field, values[field])
+                if obj.pk:
+                    to_update[obj.pk] = obj
+            resolved.append(obj)
+
+        if prepare:
+            for obj in to_create:
+                prepare(obj)
+        fields = list(update_fields)
+        if to_update and any(field.name == 'updated_at' for field in model._meta.fields):
+            now = timezone.now()
+            for obj in to_update.values():
+                obj.updated_at = now
+            fields.append('updated_at')
+        with transaction.atomic():
+            model.objects.bulk_create(to_create, batch_size=self.chunk_size)
+            if to_update:
+                model.objects.bulk_update(list(to_update.values()), fields, batch_size=self.chunk_size)
+        self.created_counts[count_key] += len(to_create)
+        return resolved
+
+    def _restore_availability_user_settings(self, records):
+        for item in records:
+            settings_payload = dict(item)
+            for field in ('id', 'email', 'profile_picture', 'ai_provider_api_key_masked', 'ai_provider_api_key_configured'):
+                settings_payload.pop(field, None)
+            settings_obj, _ = UserSettings.objects.get_or_create(user=self.user)
+            serializer = UserSettingsSerializer(settings_obj, data=settings_payload, partial=True, context=self.context)
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+            self.created_counts['settings'] = 1
+            # Only the first settings row is restored.
+            break
+
+    def _restore_availability_categories(self, records):
+        existing = {category.name: category for category in EventCategory.objects.filter(user=self.user)}
+        for chunk in iter_chunks(records, self.chunk_size):
+            rows = []
+            for item in chunk:
+                values = _pick(item, CATEGORY_FIELDS)
+                rows.append((values.get('name'), values))
+            resolved = self._merge_chunk(EventCategory, rows, existing, 'categories', update_fields=CATEGORY_FIELDS)
+            for item, category in zip(chunk, resolved):
+                self.category_map[item.get('id')] = category
+
+    def _restore_availability_holidays(self, records):
+        existing = {
+            key: _KEEP
+            for key in CustomHoliday.objects.filter(user=self.user).values_list('date', 'description')
+        }
+        for chunk in iter_chunks(records, self.chunk_size):
+            rows = []
+            for item in chunk:
+                values = _pick(item, HOLIDAY_FIELDS)
+                values['date'] = _as_date(item.get('date'))
+                values['description'] = values.get('description') or ''
+                rows.append(((values['date'], values['description']), values))
+            self._merge_chunk(CustomHoliday, rows, existing, 'holidays')
+
+    def _restore_availability_events(self, records):
+        existing = {
+            key: _KEEP
+            for key in Event.objects.filter(user=self.user).values_list('name', 'date', 'start_time')
+        }
+        for chunk in iter_chunks(records, self.chunk_size):
+            rows = []
+            for item in chunk:
+                values = _pick(item, EVENT_FIELDS)
+                values['date'] = _as_date(item.get('date'))
+                values['category'] = self.category_map.get(item.get('category'))
+                rows.append(((values.get('name'), values['date'], values.get('start_time')), values))
+            self._merge_chunk(Event, rows, existing, 'events', prepare=self._prepare_event)
+
+    @staticmethod
+    def _prepare_event(event):
+        event.start_at, event.end_at = get_event_datetime_range({
+            'date': event.date,
+            'start_time': event.start_time,
+            'end_time': event.end_time,
+            'timezone': event.timezone,
+        })
+
+    def _companies(self):
+        if self.company_map is None:
+            self.company_map = {company.name: company for company in Company.objects.filter(user=self.user)}
+        return self.company_map
+
+    def _restore_career_companies(self, records):
+        existing = self._companies()
+        for chunk in iter_chunks(records, self.chunk_size):
+            rows = [
+                (
+                    item.get('name') or 'Imported Company',
+                    {
+                        'name': item.get('name') or 'Imported Company',
+                        'website': item.get('website') or None,
+                        'industry': item.get('industry') or '',
+                    },
+                )
+                for item in chunk
+            ]
+            self._merge_chunk(Company, rows, existing, 'companies', update_fields=('website', 'industry'))
+
+    def _restore_career_applications(self, records):
+        companies = self._companies()
+        existing = {
+            (application.company_id, application.role_title): application
+            for application in Application.objects.filter(user=self.user)
+        }
+        for chunk in iter_chunks(records, self.chunk_size):
+            company_names = {item.get('company') or 'Imported Company' for item in chunk}
+            self._merge_chunk(
+                Company,
+                [(name, {'name': name}) for name in sorted(company_names) if name not in companies],
+                companies,
+                'companies',
+            )
+            rows = []
+            for item in chunk:
+                company = companies[item.get('company') or 'Imported Company']
+                role_title = item.get('role_title') or 'Imported Role'
+                values = _pick(item, APPLICATION_FIELDS)
+                values.update(company=company, role_title=role_title)
+                rows.append(((company.pk, role_title), values))
+            self._merge_chunk(Application, rows, existing, 'applications', update_fields=APPLICATION_FIELDS)
+
+    def _restore_career_tasks(self, records):
+        existing = {title: _KEEP for title in Task.objects.filter(user=self.user).values_list('title', flat=True)}
+        for chunk in iter_chunks(records, self.chunk_size):
+            rows = []
+            for item in chunk:
+                values = _pick(item, TASK_FIELDS)
+                values['title'] = values.get('title') or 'Imported Task'
+                rows.append((values['title'], values))
+            self._merge_chunk(Task, rows, existing, 'tasks')
+
+    def _restore_career_ai_artifacts(self, records):
+        existing = {artifact.client_id: artifact for artifact in AIArtifact.objects.filter(user=self.user)}
+        update_fields = tuple(field for field in AI_ARTIFACT_FIELDS if field != 'client_id')
+        for chunk in iter_chunks(records, self.chunk_size):
+            rows = []
+            for item in chunk:
+                values = _pick(item, AI_ARTIFACT_FIELDS)
+                if not values.get('artifact_type') or not values.get('client_id'):
+                    continue
+                rows.append((values['client_id'], values))
+            self._merge_chunk(AIArtifact, rows, existing, 'ai_artifacts', update_fields=update_fields)
+
+    def _restore_career_offer_decision_snapshots(self, records):
+        offers = {}
+        for offer in (
+            Offer.objects.filter(application__user=self.user)
+            .select_related('application__company')
+            .order_by('id')
+        ):
+            offers.setdefault((offer.application.company.name, offer.application.role_title), offer)
+        applications = {}
+        for application in Application.objects.filter(user=self.user).select_related('company').order_by('id'):
+            applications.setdefault((application.company.name, application.role_title), application)
+        existing = {
+            (offer_id, title, captured_at): _KEEP
+            for offer_id, title, captured_at in OfferDecisionSnapshot.objects.filter(user=self.user).values_list(
+                'offer_id', 'title', 'captured_at'
+            )
+        }
+
+        for chunk in iter_chunks(records, self.chunk_size):
+            new_offers = {}
+            for item in chunk:
+                key = (
+                    item.get('offer_company') or item.get('company_name'),
+                    item.get('offer_role') or item.get('role_title'),
+                )
+                application = applications.get(key)
+                if key in offers or key in new_offers or not application:
+                    continue
+                offer_snapshot = item.get('offer_snapshot') or {}
+                new_offers[key] = Offer(
+                    application=application,
+                    base_salary=offer_snapshot.get('base_salary') or 0,
+                    bonus=offer_snapshot.get('bonus') or 0,
+                    equity=offer_snapshot.get('equity') or 0,
+                    sign_on=offer_snapshot.get('sign_on') or 0,
+                    benefits_value=offer_snapshot.get('benefits_value') or 0,
+                    benefit_items=offer_snapshot.get('benefit_items') or [],
+                    pto_days=offer_snapshot.get('pto_days') or 15,
+                    is_unlimited_pto=offer_snapshot.get('is_unlimited_pto') or False,
+                    holiday_days=offer_snapshot.get('holiday_days') or 11,
+                )
+            if new_offers:
+                with transaction.atomic():
+                    Offer.objects.bulk_create(list(new_offers.values()))
+                offers.update(new_offers)
+
+            rows = []
+            for item in chunk:
+                offer = offers.get(
+                    (
+                        item.get('offer_company') or item.get('company_name'),
+                        item.get('offer_role') or item.get('role_title'),
+                    )
+                )
+                if not offer:
+                    continue
+                values = _pick(item, SNAPSHOT_FIELDS)
+                values.update(offer=offer, title=values.get('title') or '')
+                # captured_at is stamped on create, so it only matches rows restored earlier by key.
+                rows.append(((offer.pk, values['title'], _as_datetime(item.get('captured_at'))), values))
+            self._merge_chunk(OfferDecisionSnapshot, rows, existing, 'offer_decision_snapshots')
+
+
+class BackupFormatError(Exception):
+    pass
+
+
+class _SectionSpool:
+    """Park a section's records on disk until the sections it depends on are restored."""
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile('w+', encoding='utf-8')
+
+    def write(self, records):
+        for record in records:
+            self._file.write(json.dumps(record))
+            self._file.write('\n')
+
+    def records(self):
+        self._file.seek(0)
+        try:
+            for line in self._file:
+                yield json.loads(line)
+        finally:
+            self._file.close()
+
+
+def restore_account_backup(user, items, mode='merge', context=None):
+    """Restore ``(path, record)`` pairs read by ``iter_json_items`` from an account export.
+
+    Sections are restored as they stream past, so memory tracks the chunk size
+    rather than the backup size. A section that arrives before the schema or
+    before a section it depends on is spooled to disk and replayed afterwards.
+
+    A replace restore clears the account and writes the backup in one
+    transaction, so a truncated or malformed upload leaves the old data in
+    place. Merge restores commit chunk by chunk and are safe to re-run.
+    """
+    if mode == 'replace':
+        with transaction.atomic():
+            return _restore_items(user, items, mode, context)
+    return _restore_items(user, items, mode, context)
+
+
+def _restore_items(user, items, mode, context):
+    restore = AccountRestore(user, mode=mode, context=context)
+    schema_checked = False
+    restored = set()
+    spooled = {}
+
+    for path, group in groupby(items, key=itemgetter(0)):
+        records = (record for _, record in group if isinstance(record, dict))
+        if path == ('schema',):
+            if next(group)[1] != ACCOUNT_EXPORT_SCHEMA:
+                raise BackupFormatError('Unsupported backup format. Please upload a CareerHub account export.')
+            if mode == 'replace' and not schema_checked:
+                restore.clear()
+            schema_checked = True
+            continue
+        if path not in RESTORE_SECTIONS:
+            continue
+        ready = schema_checked and all(
+            dependency in restored for dependency in RESTORE_DEPENDENCIES.get(path, ())
+        )
+        if ready and path not in spooled:
+            restore.restore_section(*path, records)
+            restored.add(path)
+        else:
+            spooled.setdefault(path, _SectionSpool()).write(records)
+
+    if not schema_checked:
+        raise BackupFormatError('Unsupported backup format. Please upload a CareerHub account export.')
+    for path in RESTORE_SECTIONS:
+        if path in spooled:
+            restore.restore_section(*path, spooled.pop(path).records())
+    return restore.finish()
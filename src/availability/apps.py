@@ -6,4 +6,4 @@ class AvailabilityConfig(AppConfig):
     name = "availability"
 
     def ready(self):
-        import availability.signals  # noqa: F401  registers UserSettings cache-invalidation handler
+        import availability.signals  # noqa: F401  registers settings and availability-bitmap cache-invalidation handlers
@@ -0,0 +1,278 @@
+from datetime import date as date_cls, datetime, time, timedelta
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import holidays
+import numpy as np
+from django.core.cache import cache
+from django.db.models import Q
+
+from .conflict_detector import TZ_MAPPING, get_event_datetime_range
+from .models import AvailabilityOverride, CustomHoliday, Event, UserSettings
+from .recurrence import generate_recurring_instances_for_user
+
+MINUTES_PER_DAY = 24 * 60
+MIN_FREE_MINUTES = 15
+BITMAP_HORIZON_DAYS = 90
+BITMAP_CACHE_TIMEOUT = 60 * 60 * 24
+BITMAP_CACHE_KEY_PREFIX = "availability_bitmap"
+
+DEFAULT_WORK_RANGES = [(9 * 60, 17 * 60)]
+DEFAULT_WORK_DAYS = [0, 1, 2, 3, 4]
+
+_CLOSED_DAY = b""
+
+
+def _day_cache_key(user_id, versions, day):
+    return f"{BITMAP_CACHE_KEY_PREFIX}:{user_id}:{':'.join(versions)}:{day.isoformat()}"
+
+
+def get_availability_versions(user_id):
+    """Return the host's ``(availability, bookings)`` version tokens.
+
+    ``availability`` changes whenever the host's bookable time may have changed;
+    ``bookings`` changes when a public booking claims inventory slots in place.
+    Both live on ``UserSettings`` so they commit with the write that rotated them.
+    """
+    row = (
+        UserSettings.objects.filter(user_id=user_id)
+        .values_list('availability_version', 'bookings_version')
+        .first()
+    )
+    return row or ('', '')
+
+
+def get_availability_version(user_id):
+    return get_availability_versions(user_id)[0]
+
+
+def _rotate_version(user_id, field):
+    if user_id is None:
+        return
+    token = uuid4().hex
+    if not UserSettings.objects.filter(user_id=user_id).update(**{field: token}):
+        UserSettings.objects.get_or_create(user_id=user_id, defaults={field: token})
+
+
+def bump_availability_version(user_id):
+    _rotate_version(user_id, 'availability_version')
+
+
+def bump_bookings_version(user_id):
+    _rotate_version(user_id, 'bookings_version')
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    return value
+
+
+def _is_cacheable(day, today):
+    return today <= day <= today + timedelta(days=BITMAP_HORIZON_DAYS)
+
+
+def time_to_minute(value):
+    from .utils import parse_time_str
+
+    parsed = parse_time_str(value)
+    if parsed is None:
+        return None
+    return parsed.hour * 60 + parsed.minute
+
+
+def format_minute(minute):
+    hour, remainder = divmod(int(minute), 60)
+    suffix = "AM" if hour % 24 < 12 else "PM"
+    return f"{(hour % 12) or 12}:{remainder:02d} {suffix}"
+
+
+def parse_availability_text(text):
+    ranges = []
+    for part in str(text or "").split(","):
+        if " - " not in part:
+            continue
+        start_str, end_str = [item.strip() for item in part.split(" - ", 1)]
+        try:
+            start = datetime.strptime(start_str, "%I:%M %p")
+            end = datetime.strptime(end_str, "%I:%M %p")
+        except ValueError:
+            continue
+        ranges.append((start.hour * 60 + start.minute, end.hour * 60 + end.minute))
+    return ranges
+
+
+def pack_day_bitmap(work_ranges, busy_ranges):
+    free = np.zeros(MINUTES_PER_DAY, dtype=bool)
+    for start, end in work_ranges:
+        free[start:end] = True
+    for start, end in busy_ranges:
+        free[start:end] = False
+    if not free.any():
+        return _CLOSED_DAY
+    return np.packbits(free).tobytes()
+
+
+def free_ranges_from_bitmap(packed, min_minutes=MIN_FREE_MINUTES):
+    if not packed:
+        return []
+    free = np.unpackbits(np.frombuffer(packed, dtype=np.uint8))[:MINUTES_PER_DAY].astype(np.int8)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], free, [0]))))
+    starts, ends = edges[0::2], edges[1::2]
+    keep = (ends - starts) >= min_minutes
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+
+def _host_timezone(settings):
+    value = str(getattr(settings, "primary_timezone", "") or "").strip()
+    tz_name = TZ_MAPPING.get(value.upper()) or (value if value in TZ_MAPPING.values() else TZ_MAPPING["PT"])
+    return ZoneInfo(tz_name)
+
+
+def _work_schedule(settings):
+    work_ranges = list(DEFAULT_WORK_RANGES)
+    work_days = list(DEFAULT_WORK_DAYS)
+    if not settings:
+        return work_ranges, work_days
+
+    start = time_to_minute(settings.work_start_time) if settings.work_start_time else None
+    end = time_to_minute(settings.work_end_time) if settings.work_end_time else None
+    work_ranges = [(start if start is not None else DEFAULT_WORK_RANGES[0][0], end if end is not None else DEFAULT_WORK_RANGES[0][1])]
+    if settings.work_days:
+        work_days = settings.work_days
+    if settings.work_time_ranges:
+        custom_ranges = []
+        for item in settings.work_time_ranges:
+            range_start = time_to_minute(item.get("start", ""))
+            range_end = time_to_minute(item.get("end", ""))
+            if range_start is not None and range_end is not None:
+                custom_ranges.append((range_start, range_end))
+        if custom_ranges:
+            work_ranges = custom_ranges
+    return work_ranges, work_days
+
+
+def _build_day_states(user, days):
+    start_date = min(days)
+    end_date = max(days)
+    settings = UserSettings.objects.filter(user=user).first() if user else None
+    work_ranges, work_days = _work_schedule(settings)
+    host_tz = _host_timezone(settings)
+
+    overrides = {
+        item.date: item.availability_text
+        for item in AvailabilityOverride.objects.filter(user=user, date__range=[start_date, end_date])
+    }
+    custom_holidays = set(
+        CustomHoliday.objects.filter(user=user, date__range=[start_date, end_date]).values_list("date", flat=True)
+    )
+    fed_holidays = {}
+    for year in {day.year for day in days}:
+        fed_holidays.update(holidays.US(years=year))
+
+    busy_by_date = {day: [] for day in days}
+
+    def add_busy(busy_date, start_value, end_value):
+        if busy_date not in busy_by_date:
+            return
+        start = time_to_minute(start_value)
+        end = time_to_minute(end_value)
+        if start is not None and end is not None and end > start:
+            busy_by_date[busy_date].append((start, end))
+
+    def add_busy_span(start_at, end_at):
+        local_start = start_at.astimezone(host_tz)
+        local_end = end_at.astimezone(host_tz)
+        busy_date = local_start.date()
+        while busy_date <= local_end.date():
+            day_start = datetime.combine(busy_date, time.min, tzinfo=host_tz)
+            start = max(int((local_start - day_start).total_seconds() // 60), 0)
+            end = min(int((local_end - day_start).total_seconds() // 60), MINUTES_PER_DAY)
+            if busy_date in busy_by_date and end > start:
+                busy_by_date[busy_date].append((start, end))
+            busy_date += timedelta(days=1)
+
+    window_start = datetime.combine(start_date, time.min, tzinfo=host_tz)
+    window_end = datetime.combine(end_date + timedelta(days=1), time.min, tzinfo=host_tz)
+    events = Event.objects.filter(
+        Q(start_at__lt=window_end, end_at__gt=window_start)
+        | Q(start_at__isnull=True, date__range=[start_date, end_date]),
+        user=user,
+        parent_event__isnull=True,
+        is_recurring=False,
+    ).values_list("date", "start_time", "end_time", "start_at", "end_at")
+    for event_date, start_value, end_value, start_at, end_at in events:
+        if start_at and end_at:
+            add_busy_span(start_at, end_at)
+        else:
+            add_busy(event_date, start_value, end_value)
+
+    # A day either side, since an occurrence in another timezone can spill across midnight.
+    for instance in generate_recurring_instances_for_user(
+        user, start_date - timedelta(days=1), end_date + timedelta(days=1)
+    ):
+        start_at, end_at = get_event_datetime_range(instance)
+        if start_at and end_at:
+            add_busy_span(start_at, end_at)
+        else:
+            add_busy(instance["date"], instance["start_time"], instance["end_time"])
+
+    states = {}
+    for day in days:
+        if day in overrides:
+            states[day] = (overrides[day], pack_day_bitmap(parse_availability_text(overrides[day]), []))
+        elif day in fed_holidays or day in custom_holidays or day.weekday() not in work_days:
+            states[day] = (None, _CLOSED_DAY)
+        else:
+            states[day] = (None, pack_day_bitmap(work_ranges, busy_by_date[day]))
+    return states
+
+
+def get_day_states(user, dates):
+    """Return ``{date: (override_text, packed_free_bitmap)}`` for ``dates``.
+
+    Days inside the rolling horizon are cached under the host's version tokens,
+    which every schedule write rotates in the database. Each instance reads the
+    tokens per call, so a local (per-process) cache never serves a day built
+    before a write another instance committed.
+    """
+    days = sorted({_as_date(day) for day in dates})
+    if not days:
+        return {}
+
+    user_id = getattr(user, "id", None)
+    if user_id is None:
+        return _build_day_states(user, days)
+
+    today = date_cls.today()
+    versions = get_availability_versions(user_id)
+    keys = {day: _day_cache_key(user_id, versions, day) for day in days if _is_cacheable(day, today)}
+    cached = cache.get_many(list(keys.values())) if keys else {}
+
+    states = {}
+    missing = []
+    for day in days:
+        key = keys.get(day)
+        if key is not None and key in cached:
+            states[day] = cached[key]
+        else:
+            missing.append(day)
+
+    if missing:
+        built = _build_day_states(user, missing)
+        states.update(built)
+        to_cache = {keys[day]: state for day, state in built.items() if day in keys}
+        if to_cache:
+            cache.set_many(to_cache, timeout=BITMAP_CACHE_TIMEOUT)
+    return states
+
+
+def get_free_ranges(user, dates):
+    """Return ``{date: [(start_minute, end_minute), ...]}`` of bookable free time."""
+    return {day: free_ranges_from_bitmap(bitmap) for day, (_text, bitmap) in get_day_states(user, dates).items()}
+
+
+def format_free_ranges(ranges):
+    return ", ".join(f"{format_minute(start)} - {format_minute(end)}" for start, end in ranges)
@@ -1,7 +1,11 @@
+import heapq
 from datetime import datetime, timedelta, date
+from operator import itemgetter
+
 import pytz
+from django.db.models import Q
 from django.utils import timezone as django_timezone
-from .models import Event, ConflictAlert
+from .models import Event, EventOccurrence, ConflictAlert
 
 TZ_MAPPING = {
     'PT': 'America/Los_Angeles',
@@ -74,73 +78,187 @@ def events_overlap(event1, event2):
 
     return start1 < end2 and start2 < end1
 
-def detect_conflicts_for_event(event):
-    target_date = event.date
+def _overlap_filter(event_data, target_date):
+    # Rows with a UTC range are matched in SQL; legacy rows whose times could
+    # not be parsed on save fall back to the old date window and Python check.
+    start_at, end_at = get_event_datetime_range(event_data)
+    if not (start_at and end_at):
+        return None
     if isinstance(target_date, str):
         target_date = datetime.strptime(target_date, '%Y-%m-%d').date()
-        
-    start_window = target_date - timedelta(days=1)
-    end_window = target_date + timedelta(days=1)
-    
+    return (
+        Q(start_at__lt=end_at, end_at__gt=start_at)
+        | Q(start_at__isnull=True, date__range=[target_date - timedelta(days=1), target_date + timedelta(days=1)])
+    )
+
+def _overlapping_events(event_data, user, overlap, exclude_id=None):
+    candidate_events = Event.objects.filter(overlap, user=user)
+    if exclude_id:
+        candidate_events = candidate_events.exclude(id=exclude_id)
+
+    return [
+        other_event
+        for other_event in candidate_events
+        if other_event.start_at or events_overlap(event_data, other_event)
+    ]
+
+def _overlapping_series(event_data, user, overlap, exclude_ids=()):
+    occurrences = EventOccurrence.objects.filter(overlap, user=user).select_related('parent_event')
+    exclude_ids = [item for item in exclude_ids if item]
+    if exclude_ids:
+        occurrences = occurrences.exclude(parent_event_id__in=exclude_ids)
+
+    return [
+        occurrence.parent_event
+        for occurrence in occurrences
+        if occurrence.start_at or events_overlap(event_data, occurrence)
+    ]
+
+def _unique_events(events):
+    seen = set()
+    unique = []
+    for event in events:
+        if event.id not in seen:
+            seen.add(event.id)
+            unique.append(event)
+    return unique
+
+def detect_conflicts_for_event(event):
+    overlap = _overlap_filter(event, event.date)
+    if overlap is None:
+        return []
+
     event_user = getattr(event, 'user', None)
-    candidate_events = Event.objects.filter(
-        user=event_user,
-        date__range=[start_window, end_window]
-    ).exclude(id=event.id)
-    
-    conflicts = []
-    for other_event in candidate_events:
-        if events_overlap(event, other_event):
-            conflicts.append(other_event)
-    
-    return conflicts
+    conflicts = _overlapping_events(event, event_user, overlap, exclude_id=event.id)
+    conflicts.extend(_overlapping_series(event, event_user, overlap, exclude_ids=(event.id, event.parent_event_id)))
+    return _unique_events(conflicts)
 
 def check_for_conflicts(data, user, exclude_id=None):
     d = data.get('date')
     if not d: return []
-    
-    if isinstance(d, str):
-        target_date = datetime.strptime(d, '%Y-%m-%d').date()
-    else:
-        target_date = d
 
-    start_window = target_date - timedelta(days=1)
-    end_window = target_date + timedelta(days=1)
+    overlap = _overlap_filter(data, d)
+    if overlap is None:
+        return []
 
-    candidate_events = Event.objects.filter(user=user, date__range=[start_window, end_window])
-    if exclude_id:
-        candidate_events = candidate_events.exclude(id=exclude_id)
-        
-    conflicts = []
-    for other_event in candidate_events:
-        if events_overlap(data, other_event):
-            conflicts.append(other_event)
-            
-    return conflicts
+    conflicts = _overlapping_events(data, user, overlap, exclude_id=exclude_id)
+    conflicts.extend(_overlapping_series(data, user, overlap, exclude_ids=(exclude_id,)))
+    return _unique_events(conflicts)
+
+def _utc_interval(row):
+    if row['start_at'] and row['end_at']:
+        return row['start_at'], row['end_at']
+    return get_event_datetime_range(row)
+
+def _overlapping_pairs(intervals):
+    """Return ``{(event_id, event_id)}`` for every overlapping pair of intervals.
+
+    ``intervals`` are ``(start, end, event_id, series_id)`` tuples; pairs from
+    the same recurring series are skipped.
+    """
+    intervals.sort(key=itemgetter(0))
+    active = []
+    pairs = set()
+    for position, (start, end, event_id, series_id) in enumerate(intervals):
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for _end, _position, other_id, other_series_id in active:
+            if other_id != event_id and other_series_id != series_id:
+                pairs.add((min(event_id, other_id), max(event_id, other_id)))
+        heapq.heappush(active, (end, position, event_id, series_id))
+    return pairs
 
 def detect_all_conflicts(user):
     ConflictAlert.objects.filter(resolved=False, event1__user=user).delete()
-    
-    all_events = Event.objects.filter(user=user).order_by('date', 'start_time')
-    conflicts_created = 0
-    checked_pairs = set()
-    
-    for event in all_events:
-        conflicts = detect_conflicts_for_event(event)
-        
-        for conflicting_event in conflicts:
-            p1, p2 = sorted([event.id, conflicting_event.id])
-            pair = (p1, p2)
-            
-            if pair not in checked_pairs:
-                ConflictAlert.objects.create(
-                    event1_id=p1,
-                    event2_id=p2
-                )
-                checked_pairs.add(pair)
-                conflicts_created += 1
-    
-    return conflicts_created
+
+    fields = ('date', 'start_time', 'end_time', 'timezone', 'start_at', 'end_at')
+    intervals = []
+    for row in Event.objects.filter(user=user).values('id', 'parent_event_id', *fields):
+        start, end = _utc_interval(row)
+        if start and end:
+            intervals.append((start, end, row['id'], row['parent_event_id'] or row['id']))
+    for row in EventOccurrence.objects.filter(user=user).values('parent_event_id', *fields):
+        start, end = _utc_interval(row)
+        if start and end:
+            intervals.append((start, end, row['parent_event_id'], row['parent_event_id']))
+
+    pairs = sorted(_overlapping_pairs(intervals))
+    ConflictAlert.objects.bulk_create(
+        [ConflictAlert(event1_id=p1, event2_id=p2) for p1, p2 in pairs],
+        batch_size=500,
+    )
+    return len(pairs)
+
+def _series_conflict_ids(parent_event, since=None):
+    fields = ('date', 'start_time', 'end_time', 'timezone', 'start_at', 'end_at')
+    series_intervals = []
+    own_events = Event.objects.filter(Q(id=parent_event.id) | Q(parent_event_id=parent_event.id))
+    own_occurrences = EventOccurrence.objects.filter(parent_event_id=parent_event.id)
+    if since is not None:
+        own_events = own_events.filter(date__gte=since)
+        own_occurrences = own_occurrences.filter(date__gte=since)
+    own_rows = list(own_events.values('id', *fields))
+    own_rows += list(own_occurrences.values(*fields))
+    for row in own_rows:
+        start, end = _utc_interval(row)
+        if start and end:
+            series_intervals.append((start, end, row.get('id', parent_event.id), parent_event.id))
+    if not series_intervals:
+        return set()
+
+    window_start = min(item[0] for item in series_intervals)
+    window_end = max(item[1] for item in series_intervals)
+    overlap = Q(start_at__lt=window_end, end_at__gt=window_start)
+    intervals = list(series_intervals)
+    other_events = (
+        Event.objects.filter(overlap, user_id=parent_event.user_id)
+        .exclude(Q(id=parent_event.id) | Q(parent_event_id=parent_event.id))
+        .values_list('start_at', 'end_at', 'id', 'parent_event_id')
+    )
+    for start, end, event_id, series_id in other_events:
+        intervals.append((start, end, event_id, series_id or event_id))
+    other_occurrences = (
+        EventOccurrence.objects.filter(overlap, user_id=parent_event.user_id)
+        .exclude(parent_event_id=parent_event.id)
+        .values_list('start_at', 'end_at', 'parent_event_id')
+    )
+    for start, end, series_id in other_occurrences:
+        intervals.append((start, end, series_id, series_id))
+
+    return {
+        pair[0] if pair[1] == parent_event.id else pair[1]
+        for pair in _overlapping_pairs(intervals)
+        if parent_event.id in pair
+    }
+
+def refresh_conflicts_for_event(event):
+    """Re-derive the unresolved alerts involving ``event`` after it changed.
+
+    Alerts the user already resolved are left alone and never recreated.
+    """
+    involving = Q(event1_id=event.id) | Q(event2_id=event.id)
+    ConflictAlert.objects.filter(involving, resolved=False).delete()
+
+    if event.is_recurring and not event.parent_event_id:
+        conflict_ids = _series_conflict_ids(event)
+    else:
+        conflict_ids = {other.id for other in detect_conflicts_for_event(event)}
+    return _create_missing_alerts(event, conflict_ids)
+
+def add_series_conflicts_since(parent_event, since):
+    """Add alerts for the series' occurrences from ``since`` on, keeping existing ones."""
+    return _create_missing_alerts(parent_event, _series_conflict_ids(parent_event, since))
+
+def _create_missing_alerts(event, conflict_ids):
+    involving = Q(event1_id=event.id) | Q(event2_id=event.id)
+    pairs = {tuple(sorted((event.id, other_id))) for other_id in conflict_ids}
+    pairs -= set(ConflictAlert.objects.filter(involving).values_list('event1_id', 'event2_id'))
+
+    ConflictAlert.objects.bulk_create(
+        [ConflictAlert(event1_id=p1, event2_id=p2) for p1, p2 in sorted(pairs)],
+        batch_size=500,
+    )
+    return len(pairs)
 
 def get_upcoming_events(days_ahead=7, user=None):
     today = datetime.now().date()
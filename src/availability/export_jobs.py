@@ -0,0 +1,305 @@
+import hashlib
+import tempfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Max, Q
+from django.utils import timezone
+
+from career.models import (
+    AIArtifact,
+    Application,
+    ApplicationTimelineEntry,
+    Company,
+    Document,
+    Experience,
+    Offer,
+    OfferDecisionSnapshot,
+    Task,
+)
+from career.serializers import ApplicationExportSerializer, DocumentExportSerializer, ExperienceExportSerializer
+from career.services.document_storage import delete_document_asset, store_export_file
+
+from .account_export import ACCOUNT_EXPORT_FILENAME, iter_account_export_json
+from .models import (
+    AvailabilityOverride,
+    AvailabilitySetting,
+    CustomHoliday,
+    Event,
+    EventCategory,
+    ExportJob,
+    PublicBooking,
+    ShareLink,
+    UserSettings,
+)
+from .serializers import CustomHolidaySerializer, EventCategorySerializer, EventSerializer, UserSettingsSerializer
+from .utils import iter_export_chunks, serialized_records, stream_zip, write_xlsx
+
+EXPORT_JOB_BATCH_SIZE = 5
+EXPORT_JOB_MAX_ATTEMPTS = 3
+# A running job that has not finished by then is assumed to have lost its worker.
+EXPORT_JOB_STALE_AFTER = timedelta(minutes=15)
+
+EXPORT_JOB_FORMATS = {
+    ExportJob.SCOPE_ACCOUNT: ('json', 'zip'),
+    ExportJob.SCOPE_ALL: ('json', 'csv', 'xlsx'),
+    ExportJob.SCOPE_EVENTS: ('csv', 'json', 'xlsx'),
+    ExportJob.SCOPE_HOLIDAYS: ('csv', 'json', 'xlsx'),
+    ExportJob.SCOPE_APPLICATIONS: ('csv', 'json', 'xlsx'),
+    ExportJob.SCOPE_EXPERIENCES: ('csv', 'json', 'xlsx'),
+    ExportJob.SCOPE_DOCUMENTS: ('csv', 'json', 'xlsx'),
+}
+EXPORT_CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'json': 'application/json',
+    'zip': 'application/zip',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+
+def normalize_export_format(scope, export_format):
+    export_format = (export_format or '').strip().lower()
+    if export_format == 'excel':
+        export_format = 'xlsx'
+    return export_format if export_format in EXPORT_JOB_FORMATS.get(scope, ()) else None
+
+
+def export_all_sections(user):
+    return {
+        'events': (Event.objects.filter(user=user), EventSerializer),
+        'holidays': (CustomHoliday.objects.filter(user=user), CustomHolidaySerializer),
+        'applications': (Application.objects.filter(user=user).select_related('company'), ApplicationExportSerializer),
+        'user_settings': (UserSettings.objects.filter(user=user), UserSettingsSerializer),
+        'categories': (EventCategory.objects.filter(user=user), EventCategorySerializer),
+    }
+
+
+def _resource_source(user, scope):
+    return {
+        ExportJob.SCOPE_EVENTS: (Event.objects.filter(user=user), EventSerializer),
+        ExportJob.SCOPE_HOLIDAYS: (CustomHoliday.objects.filter(user=user), CustomHolidaySerializer),
+        ExportJob.SCOPE_APPLICATIONS: (
+            Application.objects.filter(user=user).select_related('company'),
+            ApplicationExportSerializer,
+        ),
+        ExportJob.SCOPE_EXPERIENCES: (
+            Experience.objects.filter(user=user).order_by('-start_date', '-created_at'),
+            ExperienceExportSerializer,
+        ),
+        ExportJob.SCOPE_DOCUMENTS: (
+            Document.objects.filter(user=user, is_current=True).order_by('-updated_at'),
+            DocumentExportSerializer,
+        ),
+    }[scope]
+
+
+def _fingerprint_querysets(user, scope):
+    resources = {
+        ExportJob.SCOPE_EVENTS: [Event.objects.filter(user=user)],
+        ExportJob.SCOPE_HOLIDAYS: [CustomHoliday.objects.filter(user=user)],
+        ExportJob.SCOPE_APPLICATIONS: [Application.objects.filter(user=user), Company.objects.filter(user=user)],
+        ExportJob.SCOPE_EXPERIENCES: [Experience.objects.filter(user=user)],
+        ExportJob.SCOPE_DOCUMENTS: [Document.objects.filter(user=user)],
+    }
+    if scope in resources:
+        return resources[scope]
+    querysets = [
+        *resources[ExportJob.SCOPE_EVENTS],
+        *resources[ExportJob.SCOPE_HOLIDAYS],
+        *resources[ExportJob.SCOPE_APPLICATIONS],
+        UserSettings.objects.filter(user=user),
+        EventCategory.objects.filter(user=user),
+    ]
+    if scope == ExportJob.SCOPE_ACCOUNT:
+        querysets.extend(
+            [
+                AvailabilityOverride.objects.filter(user=user),
+                AvailabilitySetting.objects.filter(user=user),
+                ShareLink.objects.filter(user=user),
+                PublicBooking.objects.filter(share_link__user=user),
+                Offer.objects.filter(application__user=user),
+                Document.objects.filter(user=user),
+                Task.objects.filter(user=user),
+                Experience.objects.filter(user=user),
+                ApplicationTimelineEntry.objects.filter(user=user),
+                AIArtifact.objects.filter(user=user),
+                OfferDecisionSnapshot.objects.filter(user=user),
+            ]
+        )
+    return querysets
+
+
+def export_fingerprint(user, scope, export_format):
+    """Digest the row count and newest change of everything an export reads.
+
+    Every model listed in ``_fingerprint_querysets`` keeps an ``auto_now``
+    ``updated_at``; queryset ``update()`` calls on them must set it too, or an
+    edit would leave a stale artifact in reuse.
+    """
+    parts = [scope, export_format, str(user.pk), user.email or '']
+    for queryset in _fingerprint_querysets(user, scope):
+        summary = queryset.order_by().aggregate(total=Count('id'), latest=Max('updated_at'))
+        parts.append(f'{queryset.model._meta.label}:{summary["total"]}:{summary["latest"]}')
+    return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def export_filename(scope, export_format, when=None):
+    stamp = (when or timezone.now()).strftime('%Y%m%d_%H%M%S')
+    if scope == ExportJob.SCOPE_ACCOUNT:
+        return f'careerhub_account_export_{stamp}.{export_format}'
+    if scope == ExportJob.SCOPE_ALL:
+        if export_format == 'xlsx':
+            return f'availability_manager_export_{stamp}.xlsx'
+        return f'availability_manager_backup_{stamp}.zip'
+    return f'{scope}_{stamp}.{export_format}'
+
+
+def export_content_type(scope, export_format):
+    if scope == ExportJob.SCOPE_ALL and export_format != 'xlsx':
+        return EXPORT_CONTENT_TYPES['zip']
+    return EXPORT_CONTENT_TYPES[export_format]
+
+
+def iter_export_all_zip(user, export_format):
+    """Yield the multi-section export as a zip with one CSV or JSON file per section."""
+    return stream_zip(
+        (f'{name}.{export_format}', iter_export_chunks(serialized_records(queryset, serializer_cls), export_format))
+        for name, (queryset, serializer_cls) in export_all_sections(user).items()
+    )
+
+
+def write_export_all_xlsx(user, target):
+    write_xlsx(
+        (
+            (name, serialized_records(queryset, serializer_cls))
+            for name, (queryset, serializer_cls) in export_all_sections(user).items()
+        ),
+        target,
+    )
+
+
+def _write_chunks(chunks, target):
+    for chunk in chunks:
+        target.write(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+
+
+def write_export_file(user, scope, export_format, target):
+    if scope == ExportJob.SCOPE_ACCOUNT:
+        chunks = iter_account_export_json(user, {})
+        if export_format == 'zip':
+            chunks = stream_zip([(ACCOUNT_EXPORT_FILENAME, chunks)])
+        _write_chunks(chunks, target)
+    elif scope == ExportJob.SCOPE_ALL:
+        if export_format == 'xlsx':
+            write_export_all_xlsx(user, target)
+        else:
+            _write_chunks(iter_export_all_zip(user, export_format), target)
+    else:
+        queryset, serializer_cls = _resource_source(user, scope)
+        records = serialized_records(queryset, serializer_cls)
+        if export_format == 'xlsx':
+            write_xlsx([('Sheet1', records)], target)
+        else:
+            _write_chunks(iter_export_chunks(records, export_format), target)
+
+
+def request_export_job(user, scope, export_format):
+    """Return ``(job, created)``, reusing a queued or finished job for unchanged data."""
+    fingerprint = export_fingerprint(user, scope, export_format)
+    existing = (
+        ExportJob.objects
+        .filter(
+            user=user,
+            scope=scope,
+            format=export_format,
+            fingerprint=fingerprint,
+            status__in=ExportJob.ACTIVE_STATUSES,
+        )
+        .filter(Q(expires_at__isnull=True) | Q(expires_at__gt=timezone.now()))
+        .first()
+    )
+    if existing:
+        return existing, False
+    job = ExportJob.objects.create(user=user, scope=scope, format=export_format, fingerprint=fingerprint)
+    return job, True
+
+
+def claim_export_job(now=None):
+    now = now or timezone.now()
+    with transaction.atomic():
+        job = (
+            ExportJob.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=ExportJob.STATUS_PENDING)
+                | Q(status=ExportJob.STATUS_RUNNING, started_at__lt=now - EXPORT_JOB_STALE_AFTER)
+            )
+            .order_by('created_at', 'id')
+            .first()
+        )
+        if job is None:
+            return None
+        ExportJob.objects.filter(pk=job.pk).update(
+            status=ExportJob.STATUS_RUNNING,
+            started_at=now,
+            attempts=F('attempts') + 1,
+        )
+    job.refresh_from_db()
+    return job
+
+
+def build_export_job(job):
+    """Generate ``job``'s artifact into storage and mark it completed or failed."""
+    user = job.user
+    try:
+        # Taken before reading so a change made mid-export forces a rebuild next time.
+        fingerprint = export_fingerprint(user, job.scope, job.format)
+        started = timezone.now()
+        filename = export_filename(job.scope, job.format, started)
+        content_type = export_content_type(job.scope, job.format)
+        with tempfile.TemporaryFile() as target:
+            write_export_file(user, job.scope, job.format, target)
+            size = target.tell()
+            stored_value = store_export_file(
+                target,
+                user_id=user.pk,
+                job_id=job.pk,
+                filename=filename,
+                content_type=content_type,
+            )
+    except Exception as exc:
+        job.error = str(exc)[:1000]
+        job.status = ExportJob.STATUS_FAILED if job.attempts >= EXPORT_JOB_MAX_ATTEMPTS else ExportJob.STATUS_PENDING
+        job.save(update_fields=['status', 'error'])
+        return job
+
+    superseded = list(
+        ExportJob.objects
+        .filter(user=user, scope=job.scope, format=job.format, status=ExportJob.STATUS_COMPLETED)
+        .exclude(pk=job.pk)
+    )
+    now = timezone.now()
+    job.fingerprint = fingerprint
+    job.file = stored_value
+    job.filename = filename
+    job.content_type = content_type
+    job.size = size
+    job.error = ''
+    job.status = ExportJob.STATUS_COMPLETED
+    job.completed_at = now
+    job.expires_at = now + timedelta(days=settings.EXPORT_JOB_RETENTION_DAYS)
+    job.save()
+    for old_job in superseded:
+        delete_document_asset(old_job.file)
+    ExportJob.objects.filter(pk__in=[old_job.pk for old_job in superseded]).delete()
+    return job
+
+
+def purge_expired_export_files(now=None):
+    now = now or timezone.now()
+    expired = list(ExportJob.objects.filter(expires_at__lte=now).only('id', 'file'))
+    for job in expired:
+        if job.file:
+            delete_document_asset(job.file)
+    ExportJob.objects.filter(pk__in=[job.pk for job in expired]).delete()
+    return len(expired)
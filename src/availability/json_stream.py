@@ -0,0 +1,123 @@
+import codecs
+import json
+
+JSON_STREAM_READ_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+class _JSONReader:
+    """Buffered cursor over a binary stream of JSON text.
+
+    Only the unread tail of the document is kept; ``raw_decode`` decodes one
+    value at a time and the buffer is refilled whenever a value runs past it.
+    """
+
+    def __init__(self, stream, read_size):
+        self._stream = stream
+        self._read_size = read_size
+        self._text = codecs.getincrementaldecoder('utf-8-sig')()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, read_size=None):
+        if self._eof:
+            return False
+        data = self._stream.read(read_size or self._read_size)
+        if not data:
+            self._eof = True
+        self._buffer = self._buffer[self._pos:] + self._text.decode(data or b'', final=self._eof)
+        self._pos = 0
+        return True
+
+    def _error(self, message):
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it, or ``''`` at the end."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def take(self, expected):
+        char = self.peek()
+        if char not in expected:
+            raise self._error(f'Expected one of {expected!r}')
+        self._pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        # Each retry reparses the value from its start, so reads double while it
+        # is incomplete to keep a large value linear rather than quadratic.
+        read_size = self._read_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill(read_size):
+                    read_size *= 2
+                    continue
+                raise
+            # A number ending at the buffer edge may continue in the next read.
+            if end == len(self._buffer) and self._fill(read_size):
+                read_size *= 2
+                continue
+            self._pos = end
+            return value
+
+
+def _iter_array(reader, path):
+    if reader.peek() == ']':
+        reader.take(']')
+        return
+    while True:
+        yield path, reader.value()
+        if reader.take(',]') == ']':
+            return
+
+
+def _iter_object(reader, path, depth):
+    if reader.peek() == '}':
+        reader.take('}')
+        return
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise reader._error('Expected an object key')
+        reader.take(':')
+        key_path = (*path, key)
+        char = reader.peek()
+        if char == '[':
+            reader.take('[')
+            yield from _iter_array(reader, key_path)
+        elif char == '{' and len(key_path) < depth:
+            reader.take('{')
+            yield from _iter_object(reader, key_path, depth)
+        else:
+            yield key_path, reader.value()
+        if reader.take(',}') == '}':
+            return
+
+
+def iter_json_items(stream, depth=2, read_size=JSON_STREAM_READ_SIZE):
+    """Yield ``(path, value)`` pairs from a JSON document without loading all of it.
+
+    Objects are walked down to ``depth`` keys, so ``path`` is a tuple such as
+    ``('availability', 'events')``. Arrays yield one pair per element and any
+    other value is yielded whole; a top-level array yields under ``()``.
+    """
+    reader = _JSONReader(stream, read_size)
+    char = reader.take('{[')
+    if char == '[':
+        yield from _iter_array(reader, ())
+    else:
+        yield from _iter_object(reader, (), depth)
+    if reader.peek():
+        raise reader._error('Extra data')
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from availability.tasks import BOOKING_EMAIL_BATCH_SIZE, dispatch_booking_emails
+
+
+class Command(BaseCommand):
+    help = "Send queued public booking emails from the outbox."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=BOOKING_EMAIL_BATCH_SIZE)
+        parser.add_argument("--max-batches", type=int, default=20)
+
+    def handle(self, *args, **options):
+        result = dispatch_booking_emails(
+            batch_size=max(1, options["batch_size"]),
+            max_batches=max(1, options["max_batches"]),
+        )
+        self.stdout.write(result)
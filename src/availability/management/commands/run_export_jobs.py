@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from availability.export_jobs import EXPORT_JOB_BATCH_SIZE
+from availability.tasks import run_export_jobs
+
+
+class Command(BaseCommand):
+    help = "Build queued export jobs and store their artifacts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=EXPORT_JOB_BATCH_SIZE)
+        parser.add_argument("--time-budget", type=float, default=None)
+
+    def handle(self, *args, **options):
+        result = run_export_jobs(
+            batch_size=max(1, options["batch_size"]),
+            time_budget=options["time_budget"],
+        )
+        self.stdout.write(result)
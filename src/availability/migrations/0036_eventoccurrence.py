@@ -0,0 +1,41 @@
+# Generated by Django 5.0.3 on 2026-10-17 02:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('availability', '0035_publicbooking_event'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='occurrences_through',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='EventOccurrence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('start_time', models.CharField(max_length=20)),
+                ('end_time', models.CharField(max_length=20)),
+                ('timezone', models.CharField(default='PT', max_length=2)),
+                ('parent_event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='occurrences', to='availability.event')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='event_occurrences', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['date', 'start_time'],
+                'indexes': [models.Index(fields=['user', 'date'], name='event_occurrence_user_date')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='eventoccurrence',
+            constraint=models.UniqueConstraint(fields=('parent_event', 'date'), name='unique_event_occurrence_per_day'),
+        ),
+    ]
@@ -0,0 +1,140 @@
+# Generated by Django 5.0.3 on 2026-10-17 02:36
+
+from datetime import datetime, timedelta
+
+import pytz
+from django.conf import settings
+from django.db import migrations, models
+
+# Frozen copies of the conversion in availability.conflict_detector, so this
+# migration keeps producing the same values if that module changes.
+TZ_MAPPING = {
+    'PT': 'America/Los_Angeles',
+    'MT': 'America/Denver',
+    'CT': 'America/Chicago',
+    'ET': 'America/New_York',
+    'UTC': 'UTC',
+}
+TIME_FORMATS = ('%H:%M:%S', '%H:%M', '%I:%M %p')
+
+
+def _parse_time(value):
+    if not isinstance(value, str):
+        return value
+    for time_format in TIME_FORMATS:
+        try:
+            return datetime.strptime(value, time_format).time()
+        except ValueError:
+            continue
+    return None
+
+
+def get_event_datetime_range(row):
+    def get_val(attr):
+        return row.get(attr) if isinstance(row, dict) else getattr(row, attr, None)
+
+    day = get_val('date')
+    start_time = _parse_time(get_val('start_time'))
+    end_time = _parse_time(get_val('end_time'))
+    if isinstance(day, str):
+        day = datetime.strptime(day, '%Y-%m-%d').date()
+    if not (day and start_time and end_time):
+        return None, None
+
+    local_tz = pytz.timezone(TZ_MAPPING.get(get_val('timezone') or 'PT', 'America/Los_Angeles'))
+    start = datetime.combine(day, start_time)
+    end = datetime.combine(day, end_time)
+    if end <= start:
+        end += timedelta(days=1)
+    return local_tz.localize(start).astimezone(pytz.UTC), local_tz.localize(end).astimezone(pytz.UTC)
+
+
+def _timezone_code(value):
+    value = str(value or '').strip()
+    if value.upper() in TZ_MAPPING:
+        return value.upper()
+    return next((code for code, tz_name in TZ_MAPPING.items() if tz_name == value), 'PT')
+
+
+def backfill_utc_ranges(apps, schema_editor):
+    Event = apps.get_model('availability', 'Event')
+    EventOccurrence = apps.get_model('availability', 'EventOccurrence')
+    PublicBooking = apps.get_model('availability', 'PublicBooking')
+    UserSettings = apps.get_model('availability', 'UserSettings')
+
+    for model in (Event, EventOccurrence):
+        rows = []
+        for row in model.objects.all().iterator():
+            row.start_at, row.end_at = get_event_datetime_range(row)
+            rows.append(row)
+        model.objects.bulk_update(rows, ['start_at', 'end_at'], batch_size=500)
+
+    host_timezones = {
+        user_id: _timezone_code(primary_timezone)
+        for user_id, primary_timezone in UserSettings.objects.values_list('user_id', 'primary_timezone')
+    }
+    bookings = []
+    for booking in PublicBooking.objects.select_related('event', 'share_link').iterator():
+        timezone_code = booking.event.timezone if booking.event_id else host_timezones.get(booking.share_link.user_id, 'PT')
+        booking.start_at, booking.end_at = get_event_datetime_range({
+            'date': booking.date,
+            'start_time': booking.start_time,
+            'end_time': booking.end_time,
+            'timezone': timezone_code,
+        })
+        bookings.append(booking)
+    PublicBooking.objects.bulk_update(bookings, ['start_at', 'end_at'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('availability', '0036_eventoccurrence'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='end_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='start_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='eventoccurrence',
+            name='end_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='eventoccurrence',
+            name='start_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='publicbooking',
+            name='end_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='publicbooking',
+            name='start_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['user', 'start_at', 'end_at'], name='event_user_start_end'),
+        ),
+        migrations.AddIndex(
+            model_name='eventoccurrence',
+            index=models.Index(fields=['user', 'start_at', 'end_at'], name='event_occurrence_user_start'),
+        ),
+        migrations.AddIndex(
+            model_name='publicbooking',
+            index=models.Index(fields=['share_link', 'start_at', 'end_at'], name='public_booking_link_start_end'),
+        ),
+        migrations.RunPython(backfill_utc_ranges, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.0.3 on 2026-10-17 02:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('availability', '0037_event_publicbooking_utc_range'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingInventoryDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('timezone', models.CharField(default='PT', max_length=2)),
+                ('version', models.CharField(max_length=64)),
+                ('generated_at', models.DateTimeField(auto_now=True)),
+                ('share_link', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inventory_days', to='availability.sharelink')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='BookingSlot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('start_minute', models.SmallIntegerField()),
+                ('end_minute', models.SmallIntegerField()),
+                ('is_available', models.BooleanField(default=True)),
+                ('booking', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='claimed_slots', to='availability.publicbooking')),
+                ('day', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='slots', to='availability.bookinginventoryday')),
+            ],
+            options={
+                'ordering': ['day', 'start_minute'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='bookinginventoryday',
+            constraint=models.UniqueConstraint(fields=('share_link', 'date'), name='unique_booking_inventory_day'),
+        ),
+        migrations.AddConstraint(
+            model_name='bookingslot',
+            constraint=models.UniqueConstraint(fields=('day', 'start_minute'), name='unique_booking_slot_start'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.3 on 2026-10-17 02:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('availability', '0039_bookingemailoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usersettings',
+            name='calendar_feed_token',
+            field=models.CharField(blank=True, help_text='Secret token for the subscribable ICS calendar feed.', max_length=64, null=True, unique=True),
+        ),
+    ]
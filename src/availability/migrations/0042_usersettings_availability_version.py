@@ -0,0 +1,23 @@
+# Generated by Django 5.0.3 on 2026-10-17 03:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('availability', '0041_export_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usersettings',
+            name='availability_version',
+            field=models.CharField(blank=True, default='', editable=False, max_length=32),
+        ),
+        migrations.AddField(
+            model_name='usersettings',
+            name='bookings_version',
+            field=models.CharField(blank=True, default='', editable=False, max_length=32),
+        ),
+    ]
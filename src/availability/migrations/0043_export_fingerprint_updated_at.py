@@ -0,0 +1,38 @@
+# Generated by Django 5.0.3 on 2026-10-17 04:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('availability', '0042_usersettings_availability_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='availabilitysetting',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='customholiday',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='eventcategory',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='publicbooking',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='sharelink',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
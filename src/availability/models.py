@@ -15,12 +15,31 @@ from .ai_provider import (
     mask_ai_provider_secret,
 )
 
+SCHEDULE_FIELDS = {'date', 'start_time', 'end_time', 'timezone'}
+
+
+def _sync_utc_range(instance, timezone_code, save_kwargs):
+    from .conflict_detector import get_event_datetime_range
+
+    update_fields = save_kwargs.get('update_fields')
+    if update_fields is not None and not SCHEDULE_FIELDS & set(update_fields):
+        return
+    instance.start_at, instance.end_at = get_event_datetime_range({
+        'date': instance.date,
+        'start_time': instance.start_time,
+        'end_time': instance.end_time,
+        'timezone': timezone_code,
+    })
+    if update_fields is not None:
+        save_kwargs['update_fields'] = {*update_fields, 'start_at', 'end_at'}
+
 class EventCategory(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True, blank=True, related_name='event_categories')
     name = models.CharField(max_length=50)
     color = models.CharField(max_length=7)
     icon = models.CharField(max_length=50, blank=True)
     is_locked = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = 'Event Categories'
@@ -40,6 +59,7 @@ class CustomHoliday(models.Model):
     is_recurring = models.BooleanField(default=False)
     is_locked = models.BooleanField(default=False, help_text="Locked holidays cannot be deleted")
     tab = models.CharField(max_length=100, blank=True, null=True, help_text="Custom tab id this holiday belongs to")
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.date} - {self.description or 'Holiday'}"
@@ -84,11 +104,25 @@ class Event(models.Model):
     
     is_locked = models.BooleanField(default=False, help_text="Locked events cannot be deleted")
     
+    # Last date materialized into EventOccurrence for a recurring parent
+    occurrences_through = models.DateField(null=True, blank=True, editable=False)
+    
+    # UTC copies of date/start_time/end_time/timezone, kept in sync on save
+    start_at = models.DateTimeField(null=True, blank=True, editable=False)
+    end_at = models.DateTimeField(null=True, blank=True, editable=False)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['date', 'start_time']
+        indexes = [
+            models.Index(fields=['user', 'start_at', 'end_at'], name='event_user_start_end'),
+        ]
+
+    def save(self, *args, **kwargs):
+        _sync_utc_range(self, self.timezone, kwargs)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.name} ({self.date})"
@@ -157,6 +191,17 @@ class UserSettings(models.Model):
     # Profile information
     display_name = models.CharField(max_length=120, blank=True, help_text="Public display name for booking links")
     profile_picture = models.ImageField(upload_to='profile_pics/', null=True, blank=True, help_text="Public profile picture for booking links")
+    calendar_feed_token = models.CharField(
+        max_length=64,
+        unique=True,
+        null=True,
+        blank=True,
+        help_text="Secret token for the subscribable ICS calendar feed.",
+    )
+
+    # Tokens behind public slot ETags and booking inventory; rotated, never edited.
+    availability_version = models.CharField(max_length=32, blank=True, default='', editable=False)
+    bookings_version = models.CharField(max_length=32, blank=True, default='', editable=False)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -200,6 +245,29 @@ class UserSettings(models.Model):
         self.account_deletion_requested_at = None
         self.account_deletion_scheduled_for = None
 
+class EventOccurrence(models.Model):
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True, blank=True, related_name='event_occurrences')
+    parent_event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='occurrences')
+    date = models.DateField()
+    start_time = models.CharField(max_length=20)
+    end_time = models.CharField(max_length=20)
+    timezone = models.CharField(max_length=2, default='PT')
+    start_at = models.DateTimeField(null=True, blank=True)
+    end_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['date', 'start_time']
+        indexes = [
+            models.Index(fields=['user', 'date'], name='event_occurrence_user_date'),
+            models.Index(fields=['user', 'start_at', 'end_at'], name='event_occurrence_user_start'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['parent_event', 'date'], name='unique_event_occurrence_per_day'),
+        ]
+
+    def __str__(self):
+        return f"{self.parent_event_id} on {self.date}"
+
 class ConflictAlert(models.Model):
     event1 = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='conflicts_as_event1')
     event2 = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='conflicts_as_event2')
@@ -227,6 +295,7 @@ class ShareLink(models.Model):
         help_text="Custom questions for booking intake [{id, label, type, required}]",
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     expires_at = models.DateTimeField()
     is_active = models.BooleanField(default=True)
     is_locked = models.BooleanField(default=False, help_text="Locked links cannot be deleted")
@@ -260,10 +329,17 @@ class PublicBooking(models.Model):
     intake_answers = models.JSONField(default=dict, blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_ACTIVE)
     is_locked = models.BooleanField(default=False, help_text="Locked bookings cannot be deleted")
+    # UTC range of the slot; date/start_time/end_time are stored in the host's timezone
+    start_at = models.DateTimeField(null=True, blank=True, editable=False)
+    end_at = models.DateTimeField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['date', 'start_time']
+        indexes = [
+            models.Index(fields=['share_link', 'start_at', 'end_at'], name='public_booking_link_start_end'),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=['share_link', 'date', 'start_time', 'end_time'],
@@ -275,6 +351,96 @@ class PublicBooking(models.Model):
     def __str__(self):
         return f"{self.name} booking on {self.date} {self.start_time}-{self.end_time}"
 
+    def host_timezone_code(self):
+        from .conflict_detector import TZ_MAPPING
+
+        if self.event_id:
+            return self.event.timezone
+        # Links resolved by the public booking views already carry the host's timezone.
+        if PublicBooking.share_link.is_cached(self) and getattr(self.share_link, 'host_timezone_code', None):
+            return self.share_link.host_timezone_code
+        primary_timezone = (
+            UserSettings.objects.filter(user_id=self.share_link.user_id)
+            .values_list('primary_timezone', flat=True)
+            .first()
+        )
+        value = str(primary_timezone or '').strip()
+        if value.upper() in TZ_MAPPING:
+            return value.upper()
+        return next((code for code, tz_name in TZ_MAPPING.items() if tz_name == value), 'PT')
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or SCHEDULE_FIELDS & set(update_fields):
+            _sync_utc_range(self, self.host_timezone_code(), kwargs)
+        super().save(*args, **kwargs)
+
+class BookingInventoryDay(models.Model):
+    share_link = models.ForeignKey(ShareLink, on_delete=models.CASCADE, related_name='inventory_days')
+    date = models.DateField()
+    timezone = models.CharField(max_length=2, default='PT')
+    # Host availability version the slots were generated from
+    version = models.CharField(max_length=64)
+    generated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['share_link', 'date'], name='unique_booking_inventory_day'),
+        ]
+
+    def __str__(self):
+        return f"Inventory {self.share_link_id} on {self.date}"
+
+class BookingSlot(models.Model):
+    day = models.ForeignKey(BookingInventoryDay, on_delete=models.CASCADE, related_name='slots')
+    start_minute = models.SmallIntegerField()
+    end_minute = models.SmallIntegerField()
+    is_available = models.BooleanField(default=True)
+    booking = models.ForeignKey(PublicBooking, on_delete=models.SET_NULL, null=True, blank=True, related_name='claimed_slots')
+
+    class Meta:
+        ordering = ['day', 'start_minute']
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'start_minute'], name='unique_booking_slot_start'),
+        ]
+
+    def __str__(self):
+        return f"Slot {self.start_minute}-{self.end_minute} ({'open' if self.is_available else 'taken'})"
+
+class BookingEmailOutbox(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    booking = models.ForeignKey(PublicBooking, on_delete=models.SET_NULL, null=True, blank=True, related_name='email_outbox')
+    action = models.CharField(max_length=20)
+    recipient = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    attachment_name = models.CharField(max_length=255, blank=True)
+    attachment_content = models.TextField(blank=True)
+    attachment_mimetype = models.CharField(max_length=100, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['next_attempt_at', 'id']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='booking_email_due'),
+        ]
+
+    def __str__(self):
+        return f"{self.action} email to {self.recipient} ({self.status})"
+
 class AvailabilityOverride(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True, blank=True, related_name='availability_overrides')
     date = models.DateField()
@@ -293,6 +459,7 @@ class AvailabilitySetting(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True, blank=True, related_name='availability_key_settings')
     key = models.CharField(max_length=100)
     value = models.CharField(max_length=255)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         constraints = [
@@ -301,3 +468,59 @@ class AvailabilitySetting(models.Model):
     
     def __str__(self):
         return f"{self.key}: {self.value}"
+
+class ExportJob(models.Model):
+    SCOPE_ACCOUNT = 'account'
+    SCOPE_ALL = 'all'
+    SCOPE_EVENTS = 'events'
+    SCOPE_HOLIDAYS = 'holidays'
+    SCOPE_APPLICATIONS = 'applications'
+    SCOPE_EXPERIENCES = 'experiences'
+    SCOPE_DOCUMENTS = 'documents'
+    SCOPE_CHOICES = [
+        (SCOPE_ACCOUNT, 'Account export'),
+        (SCOPE_ALL, 'Availability data export'),
+        (SCOPE_EVENTS, 'Events'),
+        (SCOPE_HOLIDAYS, 'Holidays'),
+        (SCOPE_APPLICATIONS, 'Applications'),
+        (SCOPE_EXPERIENCES, 'Experiences'),
+        (SCOPE_DOCUMENTS, 'Documents'),
+    ]
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_COMPLETED = 'completed'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_COMPLETED, 'Completed'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+    ACTIVE_STATUSES = (STATUS_PENDING, STATUS_RUNNING, STATUS_COMPLETED)
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='export_jobs')
+    scope = models.CharField(max_length=20, choices=SCOPE_CHOICES)
+    format = models.CharField(max_length=10)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    # Digest of the row counts and last-modified stamps the artifact was built from.
+    fingerprint = models.CharField(max_length=64, blank=True)
+    file = models.CharField(max_length=500, blank=True)
+    filename = models.CharField(max_length=255, blank=True)
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.PositiveBigIntegerField(default=0)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='export_job_queue'),
+            models.Index(fields=['user', 'scope', 'format', 'status'], name='export_job_lookup'),
+        ]
+
+    def __str__(self):
+        return f"{self.scope} {self.format} export ({self.status})"
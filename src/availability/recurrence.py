@@ -1,6 +1,17 @@
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import datetime, time, timedelta
+
+from dateutil.relativedelta import relativedelta
 from dateutil.rrule import rrule, DAILY, WEEKLY, MONTHLY, YEARLY
-from .models import Event
+from django.db import transaction
+from django.utils import timezone
+
+from .conflict_detector import add_series_conflicts_since, get_event_datetime_range, refresh_conflicts_for_event
+from .models import SCHEDULE_FIELDS, Event, EventOccurrence
+
+COMPILED_RULE_CACHE_SIZE = 2048
+OCCURRENCE_HORIZON_DAYS = 365
+_COMPILED_RULE_CACHE = OrderedDict()
 
 def parse_recurrence_rule(rule_dict):
     freq_map = {
@@ -31,54 +42,223 @@ def parse_recurrence_rule(rule_dict):
     
     return kwargs
 
+def _excluded_dates(rule_dict):
+    excluded_dates = set()
+    for d_str in rule_dict.get('excluded_dates') or []:
+        try:
+            excluded_dates.add(datetime.strptime(d_str, '%Y-%m-%d').date())
+        except (TypeError, ValueError):
+            pass
+    return excluded_dates
+
+
+def compile_recurrence(parent_event):
+    """Return the cached ``(dtstart, rule_kwargs, excluded_dates)`` for a parent event.
+
+    Entries are keyed by ``(event_id, updated_at)`` so any save of the parent
+    naturally retires the previously compiled rule.
+    """
+    cache_key = (parent_event.id, parent_event.updated_at) if parent_event.id else None
+    if cache_key is not None:
+        compiled = _COMPILED_RULE_CACHE.get(cache_key)
+        if compiled is not None:
+            _COMPILED_RULE_CACHE.move_to_end(cache_key)
+            return compiled
+
+    dtstart = datetime.strptime(parent_event.date, '%Y-%m-%d') if isinstance(parent_event.date, str) else parent_event.date
+    if not isinstance(dtstart, datetime):
+        dtstart = datetime.combine(dtstart, time.min)
+    compiled = (
+        dtstart,
+        parse_recurrence_rule(parent_event.recurrence_rule),
+        _excluded_dates(parent_event.recurrence_rule),
+    )
+
+    if cache_key is not None:
+        _COMPILED_RULE_CACHE[cache_key] = compiled
+        while len(_COMPILED_RULE_CACHE) > COMPILED_RULE_CACHE_SIZE:
+            _COMPILED_RULE_CACHE.popitem(last=False)
+    return compiled
+
+
+def _rebased_dtstart(dtstart, rule_kwargs, window_start):
+    # Counted series must be walked from their real start; open-ended and
+    # ``until`` series can jump forward by whole periods so expansion cost
+    # tracks the window rather than the age of the series.
+    if rule_kwargs.get('count') or window_start <= dtstart:
+        return dtstart
+
+    freq = rule_kwargs['freq']
+    interval = max(int(rule_kwargs.get('interval') or 1), 1)
+    if freq in (DAILY, WEEKLY):
+        period = timedelta(days=interval * (7 if freq == WEEKLY else 1))
+        periods = (window_start - dtstart) // period - 1
+        return dtstart + period * periods if periods > 0 else dtstart
+
+    months_per_period = interval * (12 if freq == YEARLY else 1)
+    elapsed_months = (window_start.year - dtstart.year) * 12 + window_start.month - dtstart.month
+    periods = elapsed_months // months_per_period - 1
+    while periods > 0:
+        candidate = dtstart + relativedelta(months=periods * months_per_period)
+        if candidate.day == dtstart.day:
+            return candidate
+        periods -= 1
+    return dtstart
+
+
 def generate_recurring_instances(parent_event, start_date, end_date):
     if not parent_event.is_recurring or not parent_event.recurrence_rule:
         return []
-    
-    rule_kwargs = parse_recurrence_rule(parent_event.recurrence_rule)
-    
-    # Start from the parent event's date
-    dtstart = datetime.strptime(parent_event.date, '%Y-%m-%d') if isinstance(parent_event.date, str) else parent_event.date
-    
-    # Generate occurrences
-    rule = rrule(dtstart=dtstart, **rule_kwargs)
-    
-    # Get excluded dates set for O(1) lookup
-    excluded_dates = set()
-    if parent_event.recurrence_rule.get('excluded_dates'):
-        for d_str in parent_event.recurrence_rule['excluded_dates']:
-            try:
-                excluded_dates.add(datetime.strptime(d_str, '%Y-%m-%d').date())
-            except ValueError:
-                pass
+
+    dtstart, rule_kwargs, excluded_dates = compile_recurrence(parent_event)
+    window_start = datetime.combine(start_date, time.min)
+    window_end = datetime.combine(end_date, time.max)
+    rule = rrule(dtstart=_rebased_dtstart(dtstart, rule_kwargs, window_start), **rule_kwargs)
 
     instances = []
-    for occurrence_date in rule:
+    for occurrence_date in rule.between(window_start, window_end, inc=True):
         occ_date = occurrence_date.date()
-        
-        # Skip if excluded
         if occ_date in excluded_dates:
             continue
-            
-        # Only include dates within the requested range
-        if start_date <= occ_date <= end_date:
-            instances.append({
-                'name': parent_event.name,
-                'date': occ_date,
-                'start_time': parent_event.start_time,
-                'end_time': parent_event.end_time,
-                'timezone': parent_event.timezone,
-                'category': parent_event.category_id if parent_event.category else None,
-                'location_type': parent_event.location_type,
-                'location': parent_event.location,
-                'meeting_link': parent_event.meeting_link,
-                'notes': parent_event.notes,
-                'parent_event_id': parent_event.id,
-                'is_recurring': False,  # Instances are not recurring themselves
-            })
-    
+        instances.append({
+            'name': parent_event.name,
+            'date': occ_date,
+            'start_time': parent_event.start_time,
+            'end_time': parent_event.end_time,
+            'timezone': parent_event.timezone,
+            'category': parent_event.category_id,
+            'location_type': parent_event.location_type,
+            'location': parent_event.location,
+            'meeting_link': parent_event.meeting_link,
+            'notes': parent_event.notes,
+            'parent_event_id': parent_event.id,
+            'is_recurring': False,  # Instances are not recurring themselves
+        })
+
     return instances
 
+
+def expand_recurring_events(parent_events, start_date, end_date):
+    instances = []
+    for parent_event in parent_events:
+        instances.extend(generate_recurring_instances(parent_event, start_date, end_date))
+    instances.sort(key=lambda item: (item['date'], str(item['start_time'])))
+    return instances
+
+
+def occurrence_horizon_end(today=None):
+    return (today or timezone.localdate()) + timedelta(days=OCCURRENCE_HORIZON_DAYS)
+
+
+def _occurrence_rows(parent_event, instances):
+    rows = []
+    for instance in instances:
+        start_at, end_at = get_event_datetime_range(instance)
+        rows.append(EventOccurrence(
+            user_id=parent_event.user_id,
+            parent_event=parent_event,
+            date=instance['date'],
+            start_time=instance['start_time'],
+            end_time=instance['end_time'],
+            timezone=instance['timezone'],
+            start_at=start_at,
+            end_at=end_at,
+        ))
+    return rows
+
+
+def materialize_event_occurrences(parent_event, through=None):
+    """Rebuild the stored occurrences of ``parent_event`` up to ``through``."""
+    through = through or occurrence_horizon_end()
+    with transaction.atomic():
+        EventOccurrence.objects.filter(parent_event=parent_event).delete()
+        if not parent_event.is_recurring or not parent_event.recurrence_rule or parent_event.parent_event_id:
+            through = None
+            rows = []
+        else:
+            dtstart, _rule_kwargs, _excluded = compile_recurrence(parent_event)
+            rows = _occurrence_rows(
+                parent_event,
+                generate_recurring_instances(parent_event, dtstart.date(), through),
+            )
+            EventOccurrence.objects.bulk_create(rows, batch_size=500)
+        Event.objects.filter(pk=parent_event.pk).update(occurrences_through=through)
+    parent_event.occurrences_through = through
+    if rows:
+        refresh_conflicts_for_event(parent_event)
+    return len(rows)
+
+
+def extend_event_occurrences(parent_event, through):
+    """Append occurrences after ``parent_event.occurrences_through`` up to ``through``."""
+    if parent_event.occurrences_through is None:
+        return materialize_event_occurrences(parent_event, through)
+    if parent_event.occurrences_through >= through:
+        return 0
+
+    start_date = parent_event.occurrences_through + timedelta(days=1)
+    rows = _occurrence_rows(parent_event, generate_recurring_instances(parent_event, start_date, through))
+    with transaction.atomic():
+        EventOccurrence.objects.bulk_create(rows, batch_size=500, ignore_conflicts=True)
+        Event.objects.filter(pk=parent_event.pk).update(occurrences_through=through)
+    parent_event.occurrences_through = through
+    if rows:
+        # Earlier occurrences are unchanged, so only the appended range is checked.
+        add_series_conflicts_since(parent_event, start_date)
+    return len(rows)
+
+
+def _instance_from_occurrence(occurrence, parent_event):
+    return {
+        'name': parent_event.name,
+        'date': occurrence.date,
+        'start_time': occurrence.start_time,
+        'end_time': occurrence.end_time,
+        'timezone': occurrence.timezone,
+        'category': parent_event.category_id,
+        'location_type': parent_event.location_type,
+        'location': parent_event.location,
+        'meeting_link': parent_event.meeting_link,
+        'notes': parent_event.notes,
+        'parent_event_id': parent_event.id,
+        'is_recurring': False,
+    }
+
+
+def recurring_instances_for_range(parent_events, start_date, end_date):
+    """Return instances of ``parent_events`` between ``start_date`` and ``end_date``.
+
+    Parents whose stored occurrences cover the range are read from
+    ``EventOccurrence``; anything past the horizon falls back to rrule expansion.
+    """
+    parents = {parent.id: parent for parent in parent_events}
+    covered = {
+        parent_id for parent_id, parent in parents.items()
+        if parent.occurrences_through and parent.occurrences_through >= end_date
+    }
+    instances = [
+        _instance_from_occurrence(occurrence, parents[occurrence.parent_event_id])
+        for occurrence in EventOccurrence.objects.filter(
+            parent_event_id__in=covered,
+            date__range=[start_date, end_date],
+        )
+    ] if covered else []
+
+    stale = [parent for parent_id, parent in parents.items() if parent_id not in covered]
+    instances.extend(expand_recurring_events(stale, start_date, end_date))
+    instances.sort(key=lambda item: (item['date'], str(item['start_time'])))
+    return instances
+
+
+def generate_recurring_instances_for_user(user, start_date, end_date):
+    parents = Event.objects.filter(
+        user=user,
+        is_recurring=True,
+        parent_event__isnull=True,
+        date__lte=end_date,
+    ).exclude(recurrence_rule__isnull=True)
+    return recurring_instances_for_range(parents, start_date, end_date)
+
 def update_recurring_series(parent_event, updates):
     # Update the parent event
     for key, value in updates.items():
@@ -91,6 +271,14 @@ def update_recurring_series(parent_event, updates):
     instances = Event.objects.filter(parent_event=parent_event, date__gte=today)
     
     count = instances.update(**updates)
+    if SCHEDULE_FIELDS & set(updates):
+        # queryset.update() skips Event.save(), so refresh the UTC columns here
+        changed = list(Event.objects.filter(parent_event=parent_event, date__gte=today))
+        for instance in changed:
+            instance.start_at, instance.end_at = get_event_datetime_range(instance)
+        Event.objects.bulk_update(changed, ['start_at', 'end_at'], batch_size=500)
+        for instance in changed:
+            refresh_conflicts_for_event(instance)
     return count + 1  # +1 for parent
 
 def delete_recurring_series(parent_event):
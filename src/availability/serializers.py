@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from django.conf import settings
+from django.urls import reverse
 
 from .ai_provider import validate_ai_provider_endpoint
-from .models import Event, CustomHoliday, AvailabilityOverride, AvailabilitySetting, EventCategory, UserSettings, ConflictAlert, ShareLink, PublicBooking
+from .models import Event, CustomHoliday, AvailabilityOverride, AvailabilitySetting, EventCategory, UserSettings, ConflictAlert, ShareLink, PublicBooking, ExportJob
 from career.models import Application
 
 class EventCategorySerializer(serializers.ModelSerializer):
@@ -157,6 +158,24 @@ class ConflictAlertSerializer(serializers.ModelSerializer):
         fields = ['id', 'event1', 'event2', 'event1_details', 'event2_details', 'detected_at', 'resolved']
         read_only_fields = ['detected_at']
 
+class ExportJobSerializer(serializers.ModelSerializer):
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExportJob
+        fields = [
+            'id', 'scope', 'format', 'status', 'filename', 'content_type', 'size', 'error',
+            'download_url', 'created_at', 'started_at', 'completed_at', 'expires_at',
+        ]
+        read_only_fields = fields
+
+    def get_download_url(self, obj):
+        if obj.status != ExportJob.STATUS_COMPLETED:
+            return None
+        request = self.context.get('request')
+        path = reverse('export-job-download', kwargs={'pk': obj.pk})
+        return request.build_absolute_uri(path) if request else path
+
 class ShareLinkSerializer(serializers.ModelSerializer):
     is_expired = serializers.BooleanField(read_only=True)
 
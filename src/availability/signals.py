@@ -1,19 +1,122 @@
 from django.core.cache import cache
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from .models import UserSettings
+from .availability_engine import bump_availability_version, bump_bookings_version
+from .conflict_detector import refresh_conflicts_for_event
+from .recurrence import materialize_event_occurrences
+from .models import (
+    SCHEDULE_FIELDS,
+    AvailabilityOverride,
+    CustomHoliday,
+    Event,
+    PublicBooking,
+    ShareLink,
+    UserSettings,
+)
 
 USER_SETTINGS_TZ_CACHE_KEY_PREFIX = "user_settings:primary_timezone"
+SHARE_LINK_CACHE_KEY_PREFIX = "share_link:resolved"
+# Changing any of these on a series parent rebuilds its stored occurrences.
+RECURRENCE_FIELDS = ('is_recurring', 'recurrence_rule', 'date', 'start_time', 'end_time', 'timezone')
 
 
 def get_user_settings_tz_cache_key(user_id):
     return f"{USER_SETTINGS_TZ_CACHE_KEY_PREFIX}:{user_id or 'anonymous'}"
 
 
+def get_share_link_cache_key(uuid_value):
+    return f"{SHARE_LINK_CACHE_KEY_PREFIX}:{uuid_value}"
+
+
 @receiver(post_save, sender=UserSettings)
 def invalidate_user_settings_cache(sender, instance, **kwargs):
+    keys = [get_user_settings_tz_cache_key(instance.user_id)]
+    if instance.user_id:
+        # Resolved share links carry the host's timezone and profile picture.
+        keys.extend(
+            get_share_link_cache_key(uuid_value)
+            for uuid_value in ShareLink.objects.filter(user_id=instance.user_id).values_list('uuid', flat=True)
+        )
+    try:
+        cache.delete_many(keys)
+    except Exception:
+        pass
+
+
+@receiver(post_save, sender=ShareLink)
+@receiver(post_delete, sender=ShareLink)
+def invalidate_share_link_cache(sender, instance, **kwargs):
     try:
-        cache.delete(get_user_settings_tz_cache_key(instance.user_id))
+        cache.delete(get_share_link_cache_key(instance.uuid))
     except Exception:
         pass
+
+
+@receiver(pre_save, sender=Event)
+def remember_previous_event_schedule(sender, instance, **kwargs):
+    previous = (
+        Event.objects.filter(pk=instance.pk).values_list(*RECURRENCE_FIELDS).first()
+        if instance.pk
+        else None
+    )
+    instance._previous_recurrence = _recurrence_signature(*previous) if previous else None
+
+
+def _recurrence_signature(is_recurring, recurrence_rule, date, start_time, end_time, timezone):
+    return (bool(is_recurring), recurrence_rule, str(date), str(start_time), str(end_time), timezone)
+
+
+@receiver(post_save, sender=Event)
+def rematerialize_event_occurrences(sender, instance, created=False, update_fields=None, raw=False, **kwargs):
+    # Covers every writer (views, admin, sheet sync), not just the events API.
+    if raw or instance.parent_event_id:
+        return
+    if update_fields is not None and not set(RECURRENCE_FIELDS) & set(update_fields):
+        return
+    previous = getattr(instance, '_previous_recurrence', None)
+    if not instance.is_recurring and not (previous and previous[0]):
+        return
+    current = _recurrence_signature(*(getattr(instance, field) for field in RECURRENCE_FIELDS))
+    if created or current != previous:
+        materialize_event_occurrences(instance)
+
+
+@receiver(post_save, sender=Event)
+def refresh_event_conflict_alerts(sender, instance, created=False, update_fields=None, raw=False, **kwargs):
+    # Recurring parents are refreshed once their occurrences are materialized;
+    # deleted events drop their alerts through the cascade.
+    if raw or (instance.is_recurring and not instance.parent_event_id):
+        return
+    if not created and update_fields is not None and not SCHEDULE_FIELDS & set(update_fields):
+        return
+    refresh_conflicts_for_event(instance)
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=AvailabilityOverride)
+@receiver(post_delete, sender=AvailabilityOverride)
+@receiver(post_save, sender=CustomHoliday)
+@receiver(post_delete, sender=CustomHoliday)
+@receiver(post_save, sender=UserSettings)
+@receiver(post_save, sender=ShareLink)
+def bump_host_availability_version(sender, instance, **kwargs):
+    # The version also keys the host's cached day bitmaps, so this is their invalidation too.
+    # A public booking claims its inventory slots in place; see bump_booking_host_availability_version.
+    if getattr(instance, '_from_public_booking', False):
+        return
+    bump_availability_version(instance.user_id)
+
+
+@receiver(post_save, sender=PublicBooking)
+@receiver(post_delete, sender=PublicBooking)
+def bump_booking_host_availability_version(sender, instance, **kwargs):
+    if PublicBooking.share_link.is_cached(instance):
+        user_id = instance.share_link.user_id
+    else:
+        user_id = ShareLink.objects.filter(pk=instance.share_link_id).values_list('user_id', flat=True).first()
+    if getattr(instance, '_from_public_booking', False):
+        bump_bookings_version(user_id)
+    else:
+        bump_availability_version(user_id)
@@ -0,0 +1,130 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from .availability_engine import MINUTES_PER_DAY, format_minute, parse_availability_text
+
+
+def parse_clock_minutes(value):
+    """Return minutes after midnight for an ``'HH:MM'`` or ``'HH:MM:SS'`` string, or ``None``."""
+    try:
+        hours, minutes = str(value).split(':')[:2]
+        return int(hours) * 60 + int(minutes)
+    except (TypeError, ValueError):
+        return None
+
+
+def format_clock(minute):
+    hours, minutes = divmod(minute % MINUTES_PER_DAY, 60)
+    return f'{hours:02d}:{minutes:02d}:00'
+
+
+def _offset_minutes(moment):
+    return int(moment.utcoffset().total_seconds() // 60)
+
+
+def _day_offset_delta(date_obj, from_tz, to_tz):
+    # One shift for the whole day unless either zone changes offset during it.
+    day_start = datetime.combine(date_obj, time.min)
+    day_end = day_start + timedelta(days=1)
+    from_offsets = {_offset_minutes(day_start.replace(tzinfo=from_tz)), _offset_minutes(day_end.replace(tzinfo=from_tz))}
+    to_offsets = {_offset_minutes(day_start.replace(tzinfo=to_tz)), _offset_minutes(day_end.replace(tzinfo=to_tz))}
+    if len(from_offsets) > 1 or len(to_offsets) > 1:
+        return None
+    return to_offsets.pop() - from_offsets.pop()
+
+
+def _shift_minute(date_obj, minute, from_tz, to_tz):
+    local = (datetime.combine(date_obj, time.min) + timedelta(minutes=minute)).replace(tzinfo=from_tz)
+    shifted = local.astimezone(to_tz)
+    return (shifted.date() - date_obj).days * MINUTES_PER_DAY + shifted.hour * 60 + shifted.minute
+
+
+class SlotGrid:
+    """Bookable slots for one day as parallel lists of minute offsets from midnight.
+
+    Offsets may fall outside ``0..1440`` after a timezone shift; they are only
+    wrapped back to clock times when formatted for a response.
+    """
+
+    __slots__ = ('date', 'starts', 'ends')
+
+    def __init__(self, date_obj, starts=(), ends=()):
+        self.date = date_obj
+        self.starts = list(starts)
+        self.ends = list(ends)
+
+    @classmethod
+    def from_ranges(cls, date_obj, ranges):
+        ranges = list(ranges)
+        return cls(date_obj, [start for start, _end in ranges], [end for _start, end in ranges])
+
+    @classmethod
+    def from_availability_text(cls, date_obj, availability_text):
+        return cls.from_ranges(date_obj, parse_availability_text(availability_text))
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def split(self, block_minutes):
+        if block_minutes <= 0:
+            return self
+        starts = []
+        ends = []
+        for start, end in self:
+            for cursor in range(start, end - block_minutes + 1, block_minutes):
+                starts.append(cursor)
+                ends.append(cursor + block_minutes)
+        return SlotGrid(self.date, starts, ends)
+
+    def without(self, blocked):
+        """Drop slots overlapping any ``(start, end)`` minute range in ``blocked``."""
+        if not blocked:
+            return self
+        return SlotGrid.from_ranges(
+            self.date,
+            [
+                (start, end)
+                for start, end in self
+                if not any(start < blocked_end and end > blocked_start for blocked_start, blocked_end in blocked)
+            ],
+        )
+
+    def shifted(self, from_tz_name, to_tz_name):
+        """Re-express the slots as wall-clock minutes in ``to_tz_name``."""
+        if from_tz_name == to_tz_name or not self.starts:
+            return self
+        from_tz = ZoneInfo(from_tz_name)
+        to_tz = ZoneInfo(to_tz_name)
+        delta = _day_offset_delta(self.date, from_tz, to_tz)
+        if delta is not None:
+            return SlotGrid(
+                self.date,
+                [start + delta for start in self.starts],
+                [end + delta for end in self.ends],
+            )
+        return SlotGrid(
+            self.date,
+            [_shift_minute(self.date, start, from_tz, to_tz) for start in self.starts],
+            [_shift_minute(self.date, end, from_tz, to_tz) for end in self.ends],
+        )
+
+    def contains(self, start, end):
+        start %= MINUTES_PER_DAY
+        end %= MINUTES_PER_DAY
+        return any(
+            slot_start % MINUTES_PER_DAY == start and slot_end % MINUTES_PER_DAY == end
+            for slot_start, slot_end in self
+        )
+
+    def as_response(self):
+        return [
+            {
+                'start_time': format_clock(start),
+                'end_time': format_clock(end),
+                'label': f'{format_minute(start % MINUTES_PER_DAY)} - {format_minute(end % MINUTES_PER_DAY)}',
+            }
+            for start, end in self
+        ]
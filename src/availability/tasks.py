@@ -1,16 +1,30 @@
-from django.core.cache import cache
+from datetime import timedelta
+
 from django.utils import timezone
 
 
 def expire_stale_share_links():
     from availability.models import ShareLink
 
-    count = ShareLink.objects.filter(is_active=True, expires_at__lte=timezone.now()).update(
-        is_active=False
+    now = timezone.now()
+    count = ShareLink.objects.filter(is_active=True, expires_at__lte=now).update(
+        is_active=False, updated_at=now
     )
     return f"Deactivated {count} expired share link(s)."
 
 
+def purge_stale_booking_inventory():
+    from django.db.models import Q
+    from availability.models import BookingInventoryDay
+
+    # A day back, since a host's local date can trail the server's.
+    cutoff = timezone.now().date() - timedelta(days=1)
+    deleted_count = BookingInventoryDay.objects.filter(
+        Q(date__lt=cutoff) | Q(share_link__expires_at__lte=timezone.now())
+    ).delete()[1].get("availability.BookingInventoryDay", 0)
+    return f"Deleted {deleted_count} stale booking inventory day(s)."
+
+
 def purge_expired_account_deletions():
     from django.contrib.auth import get_user_model
     from availability.models import UserSettings
@@ -31,6 +45,179 @@ def purge_expired_account_deletions():
     return f"Deleted {deleted_count} expired account(s)."
 
 
+def extend_event_occurrence_horizon(time_budget=None):
+    """Extend stored occurrences to the horizon, furthest-behind series first, until the time budget runs out."""
+    from time import monotonic
+
+    from django.conf import settings
+    from django.db.models import F, Q
+    from availability.models import Event
+    from availability.recurrence import extend_event_occurrences, occurrence_horizon_end
+
+    if time_budget is None:
+        time_budget = getattr(settings, "EVENT_OCCURRENCE_TIME_BUDGET_SECONDS", 5)
+    deadline = monotonic() + time_budget
+
+    through = occurrence_horizon_end()
+    parents = Event.objects.filter(
+        is_recurring=True,
+        parent_event__isnull=True,
+        recurrence_rule__isnull=False,
+    ).filter(
+        Q(occurrences_through__isnull=True) | Q(occurrences_through__lt=through)
+    ).order_by(F("occurrences_through").asc(nulls_first=True), "id")
+
+    series_count = 0
+    created_count = 0
+    for parent in parents.iterator():
+        if monotonic() >= deadline:
+            break
+        created_count += extend_event_occurrences(parent, through)
+        series_count += 1
+    return f"Extended {series_count} recurring series with {created_count} occurrence(s) through {through.isoformat()}."
+
+
+BOOKING_EMAIL_BATCH_SIZE = 50
+BOOKING_EMAIL_MAX_ATTEMPTS = 6
+BOOKING_EMAIL_MAX_BACKOFF_MINUTES = 6 * 60
+# A claimed batch is hidden from other dispatchers this long while it sends.
+BOOKING_EMAIL_CLAIM_MINUTES = 10
+
+
+def _claim_booking_emails(batch_size):
+    from django.db import transaction
+    from availability.models import BookingEmailOutbox
+
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            BookingEmailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(status=BookingEmailOutbox.STATUS_PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        if rows:
+            BookingEmailOutbox.objects.filter(id__in=[row.id for row in rows]).update(
+                next_attempt_at=now + timedelta(minutes=BOOKING_EMAIL_CLAIM_MINUTES)
+            )
+    return rows
+
+
+def dispatch_booking_emails(batch_size=BOOKING_EMAIL_BATCH_SIZE, max_batches=20):
+    from django.conf import settings
+    from django.core.mail import EmailMessage, get_connection
+    from availability.models import BookingEmailOutbox
+
+    sent_count = 0
+    retry_count = 0
+    failed_count = 0
+    for _batch in range(max_batches):
+        rows = _claim_booking_emails(batch_size)
+        if not rows:
+            break
+
+        connection = get_connection(fail_silently=False)
+        try:
+            connection.open()
+        except Exception as exc:
+            connection = None
+            open_error = str(exc)
+        for row in rows:
+            row.attempts += 1
+            try:
+                if connection is None:
+                    raise RuntimeError(open_error)
+                email = EmailMessage(
+                    subject=row.subject,
+                    body=row.body,
+                    from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
+                    to=[row.recipient],
+                    connection=connection,
+                )
+                if row.attachment_name:
+                    email.attach(row.attachment_name, row.attachment_content, row.attachment_mimetype or None)
+                email.send()
+            except Exception as exc:
+                row.last_error = str(exc)[:1000]
+                if row.attempts >= BOOKING_EMAIL_MAX_ATTEMPTS:
+                    row.status = BookingEmailOutbox.STATUS_FAILED
+                    failed_count += 1
+                else:
+                    backoff = min(2 ** row.attempts, BOOKING_EMAIL_MAX_BACKOFF_MINUTES)
+                    row.next_attempt_at = timezone.now() + timedelta(minutes=backoff)
+                    retry_count += 1
+            else:
+                row.status = BookingEmailOutbox.STATUS_SENT
+                row.sent_at = timezone.now()
+                row.last_error = ""
+                sent_count += 1
+        if connection is not None:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+        BookingEmailOutbox.objects.bulk_update(
+            rows, ["status", "attempts", "next_attempt_at", "last_error", "sent_at"]
+        )
+        if len(rows) < batch_size:
+            break
+
+    return (
+        f"Sent {sent_count} booking email(s); "
+        f"{retry_count} scheduled for retry, {failed_count} failed permanently."
+    )
+
+
+def run_export_jobs(batch_size=None, time_budget=None):
+    """Build queued export artifacts until the batch or the time budget runs out."""
+    from time import monotonic
+
+    from django.conf import settings
+    from availability.export_jobs import EXPORT_JOB_BATCH_SIZE, build_export_job, claim_export_job
+    from availability.models import ExportJob
+
+    batch_size = batch_size or EXPORT_JOB_BATCH_SIZE
+    if time_budget is None:
+        time_budget = getattr(settings, "EXPORT_JOB_TIME_BUDGET_SECONDS", 20)
+    deadline = monotonic() + time_budget
+
+    completed_count = 0
+    failed_count = 0
+    retry_count = 0
+    for _job in range(batch_size):
+        if monotonic() >= deadline:
+            break
+        job = claim_export_job()
+        if job is None:
+            break
+        build_export_job(job)
+        if job.status == ExportJob.STATUS_COMPLETED:
+            completed_count += 1
+        elif job.status == ExportJob.STATUS_FAILED:
+            failed_count += 1
+        else:
+            retry_count += 1
+
+    return (
+        f"Built {completed_count} export(s); "
+        f"{retry_count} scheduled for retry, {failed_count} failed permanently."
+    )
+
+
+def purge_expired_export_jobs():
+    from availability.export_jobs import purge_expired_export_files
+
+    return f"Deleted {purge_expired_export_files()} expired export(s)."
+
+
 def clear_widget_cache():
-    cache.clear()
-    return "Widget cache cleared."
+    from django.contrib.auth import get_user_model
+    from analytics.signals import bump_widget_generations
+    from availability.utils import iter_chunks
+
+    user_ids = get_user_model().objects.order_by().values_list("id", flat=True).iterator()
+    count = 0
+    for chunk in iter_chunks(user_ids, 500):
+        bump_widget_generations(chunk)
+        count += len(chunk)
+    return f"Widget cache cleared for {count} user(s)."
@@ -1,15 +1,52 @@
+import csv
+import io
 import json
-from datetime import timedelta
+import tempfile
+import zipfile
+from datetime import datetime, time, timedelta, timezone as dt_timezone
 from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import holidays
+from dateutil.rrule import rrule
+from openpyxl import load_workbook
 
 from django.core import mail
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
-from django.test import override_settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from availability.models import Event, PublicBooking, ShareLink, UserSettings
+from availability.availability_engine import bump_availability_version
+from availability.conflict_detector import check_for_conflicts, detect_all_conflicts
+from availability.export_jobs import export_fingerprint
+from availability.json_stream import iter_json_items
+from availability.models import BookingEmailOutbox, BookingInventoryDay, BookingSlot, ConflictAlert, CustomHoliday, Event, EventOccurrence, ExportJob, PublicBooking, ShareLink, UserSettings
+from availability.recurrence import (
+    generate_recurring_instances,
+    generate_recurring_instances_for_user,
+    materialize_event_occurrences,
+    occurrence_horizon_end,
+    parse_recurrence_rule,
+)
+from availability.signals import get_share_link_cache_key
+from availability.slots import SlotGrid
+from availability.tasks import (
+    BOOKING_EMAIL_MAX_ATTEMPTS,
+    clear_widget_cache,
+    dispatch_booking_emails,
+    expire_stale_share_links,
+    extend_event_occurrence_horizon,
+    purge_expired_export_jobs,
+    purge_stale_booking_inventory,
+    run_export_jobs,
+)
+from availability.utils import calculate_availability_for_dates
 
 
 def available_9_to_10(dates, timezone_code, user=None):
@@ -25,6 +62,7 @@ def available_9_to_10(dates, timezone_code, user=None):
 @override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
 class PublicBookingEnhancementTests(APITestCase):
     def setUp(self):
+        cache.clear()
         self.user = get_user_model().objects.create_user(
             username='booking-host',
             email='host-account@example.com',
@@ -94,11 +132,66 @@ class PublicBookingEnhancementTests(APITestCase):
             response.data['booking']['reschedule_url'].startswith('https://careerhub-frontend.vercel.app/book/')
         )
         self.assertTrue(response.data['booking']['ics_url'].startswith('http://testserver/api/booking/'))
+        self.assertEqual(len(mail.outbox), 0)
+        queued = BookingEmailOutbox.objects.get(booking=booking)
+        self.assertEqual(queued.status, BookingEmailOutbox.STATUS_PENDING)
+
+        self.assertIn('Sent 1 booking email(s)', dispatch_booking_emails())
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, BookingEmailOutbox.STATUS_SENT)
         self.assertEqual(len(mail.outbox), 1)
         self.assertEqual(mail.outbox[0].to, ['host@example.com'])
         self.assertEqual(mail.outbox[0].attachments[0][2], 'text/calendar')
         self.assertIn('https://careerhub-frontend.vercel.app/book/', mail.outbox[0].body)
 
+    @patch('availability.views.booking.calculate_availability_for_dates', side_effect=available_9_to_10)
+    def test_booking_requests_only_queue_host_emails(self, _mock_availability):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f'/api/booking/{self.link.uuid}/book/',
+                {
+                    'name': 'Recruiter',
+                    'email': 'recruiter@example.com',
+                    'date': timezone.now().date().strftime('%Y-%m-%d'),
+                    'start_time': '09:00:00',
+                    'end_time': '09:30:00',
+                    'timezone': 'PT',
+                    'intake_answers': {'company': 'Acme'},
+                },
+                format='json',
+            )
+            booking = PublicBooking.objects.get()
+            self.client.post(f'/api/booking/{self.link.uuid}/manage/{booking.uuid}/cancel/')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(
+            sorted(BookingEmailOutbox.objects.values_list('action', 'status')),
+            [('canceled', BookingEmailOutbox.STATUS_PENDING), ('created', BookingEmailOutbox.STATUS_PENDING)],
+        )
+
+    def test_booking_email_dispatch_backs_off_and_gives_up_after_max_attempts(self):
+        queued = BookingEmailOutbox.objects.create(
+            action='created', recipient='host@example.com', subject='CareerHub', body='Hello'
+        )
+
+        with patch('django.core.mail.EmailMessage.send', side_effect=OSError('smtp down')):
+            self.assertIn('1 scheduled for retry', dispatch_booking_emails())
+            queued.refresh_from_db()
+            self.assertEqual(queued.attempts, 1)
+            self.assertEqual(queued.status, BookingEmailOutbox.STATUS_PENDING)
+            self.assertGreater(queued.next_attempt_at, timezone.now() + timedelta(minutes=1))
+            self.assertIn('Sent 0', dispatch_booking_emails())
+
+            BookingEmailOutbox.objects.filter(pk=queued.pk).update(
+                attempts=BOOKING_EMAIL_MAX_ATTEMPTS - 1, next_attempt_at=timezone.now()
+            )
+            self.assertIn('1 failed permanently', dispatch_booking_emails())
+        queued.refresh_from_db()
+        self.assertEqual(queued.status, BookingEmailOutbox.STATUS_FAILED)
+        self.assertEqual(queued.last_error, 'smtp down')
+        self.assertEqual(len(mail.outbox), 0)
+
     @patch('availability.views.booking.calculate_availability_for_dates', side_effect=available_9_to_10)
     def test_cancel_marks_booking_canceled_and_removes_locked_event(self, _mock_availability):
         create_response = self.client.post(
@@ -157,6 +250,928 @@ class PublicBookingEnhancementTests(APITestCase):
         self.assertEqual(booking.start_time, '09:30:00')
         self.assertEqual(booking.event.start_time, '09:30:00')
 
+    @patch('availability.views.booking.calculate_availability_for_dates', side_effect=available_9_to_10)
+    def test_slots_use_constant_queries_and_honor_bookings_and_limits(self, _mock_availability):
+        today = timezone.now().date()
+        self.link.buffer_minutes = 15
+        self.link.max_bookings_per_day = 2
+        self.link.save()
+        for day_offset, start_time, end_time in [(0, '09:00:00', '09:30:00'), (1, '09:00:00', '09:30:00'), (1, '09:30:00', '10:00:00')]:
+            PublicBooking.objects.create(
+                share_link=self.link,
+                name='Guest',
+                email='guest@example.com',
+                date=today + timedelta(days=day_offset),
+                start_time=start_time,
+                end_time=end_time,
+            )
+
+        self.client.get(f'/api/booking/{self.link.uuid}/slots/?days=30&timezone=PT')
+        with self.assertNumQueries(4):
+            short_response = self.client.get(f'/api/booking/{self.link.uuid}/slots/?days=2&timezone=PT')
+        with self.assertNumQueries(4):
+            long_response = self.client.get(f'/api/booking/{self.link.uuid}/slots/?days=30&timezone=PT')
+
+        self.assertEqual(len(long_response.data['days']), 30)
+        self.assertEqual(short_response.data['days'][0]['slots'], [])
+        self.assertEqual(short_response.data['days'][1]['slots'], [])
+        self.assertEqual(
+            [slot['start_time'] for slot in long_response.data['days'][2]['slots']],
+            ['09:00:00', '09:30:00'],
+        )
+
+    @patch('availability.views.booking.calculate_availability_for_dates', side_effect=available_9_to_10)
+    def test_booking_rechecks_a_link_deactivated_on_another_instance(self, _mock_availability):
+        self.client.get(f'/api/booking/{self.link.uuid}/slots/?days=1&timezone=PT')
+        # A bulk update skips the signals, like a save whose cache delete only ran elsewhere.
+        ShareLink.objects.filter(pk=self.link.pk).update(is_active=False)
+
+        response = self.client.post(
+            f'/api/booking/{self.link.uuid}/book/',
+            {
+                'name': 'Recruiter',
+                'email': 'recruiter@example.com',
+                'date': timezone.now().date().strftime('%Y-%m-%d'),
+                'start_time': '09:00:00',
+                'end_time': '09:30:00',
+                'timezone': 'PT',
+                'intake_answers': {'company': 'Acme'},
+            },
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['error'], 'This booking link is invalid or expired.')
+        self.assertFalse(PublicBooking.objects.exists())
+
+    @patch('availability.views.booking.calculate_availability_for_dates', side_effect=available_9_to_10)
+    def test_cached_share_link_is_invalidated_on_save_and_honors_expiry(self, _mock_availability):
+        url = f'/api/booking/{self.link.uuid}/slots/?days=1&timezone=PT'
+        self.assertEqual(self.client.get(url).data['title'], self.link.title)
+
+        self.link.title = 'Renamed'
+        self.link.save()
+        self.assertEqual(self.client.get(url).data['title'], 'Renamed')
+
+        UserSettings.objects.update_or_create(user=self.user, defaults={'primary_timezone': 'ET'})
+        self.assertIsNone(cache.get(get_share_link_cache_key(self.link.uuid)))
+
+        self.client.get(url)
+        with patch('django.utils.timezone.now', return_value=self.link.expires_at):
+            self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+        self.link.refresh_from_db()
+        self.assertFalse(self.link.is_active)
+
+    @patch('availability.views.booking.calculate_availability_for_dates', side_effect=available_9_to_10)
+    def test_booking_claims_inventory_slot_and_buffered_neighbours(self, _mock_availability):
+        self.link.buffer_minutes = 15
+        self.link.save()
+        payload = {
+            'name': 'Recruiter',
+            'email': 'recruiter@example.com',
+            'date': timezone.now().date().strftime('%Y-%m-%d'),
+            'start_time': '12:00:00',
+            'end_time': '12:30:00',
+            'timezone': 'ET',
+            'intake_answers': {'company': 'Acme'},
+        }
+
+        first = self.client.post(f'/api/booking/{self.link.uuid}/book/', payload, format='json')
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        booking = PublicBooking.objects.get()
+        self.assertEqual((booking.start_time, booking.end_time), ('09:00:00', '09:30:00'))
+        self.assertEqual(
+            list(BookingSlot.objects.order_by('start_minute').values_list('start_minute', 'is_available', 'booking_id')),
+            [(540, False, booking.id), (570, False, booking.id)],
+        )
+
+        neighbour = self.client.post(
+            f'/api/booking/{self.link.uuid}/book/',
+            {**payload, 'start_time': '12:30:00', 'end_time': '13:00:00'},
+            format='json',
+        )
+        self.assertEqual(neighbour.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(PublicBooking.objects.count(), 1)
+        self.assertEqual(Event.objects.count(), 1)
+
+    @patch('availability.views.booking.calculate_availability_for_dates', side_effect=available_9_to_10)
+    def test_unchanged_slot_polls_are_answered_with_not_modified(self, mock_availability):
+        url = f'/api/booking/{self.link.uuid}/slots/?days=3&timezone=ET'
+        first = self.client.get(url)
+        etag = first['ETag']
+        self.assertIn('s-maxage=', first['Cache-Control'])
+
+        repeat = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(repeat.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(repeat['ETag'], etag)
+        self.assertEqual(mock_availability.call_count, 1)
+
+        Event.objects.create(
+            user=self.user, name='Busy', date=timezone.now().date(), start_time='09:00:00', end_time='10:00:00'
+        )
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed['ETag'], etag)
+
+    @patch('availability.views.booking.calculate_availability_for_dates', side_effect=available_9_to_10)
+    def test_slot_inventory_stays_inside_the_link_window(self, _mock_availability):
+        today = timezone.now().date()
+        response = self.client.get(f'/api/booking/{self.link.uuid}/slots/?days=30&timezone=PT')
+        self.assertTrue(response.data['days'][1]['slots'])
+        self.assertEqual(response.data['days'][20]['slots'], [])
+        self.assertFalse(BookingInventoryDay.objects.exists())
+
+        beyond_expiry = self.client.post(
+            f'/api/booking/{self.link.uuid}/book/',
+            {
+                'name': 'Recruiter',
+                'email': 'recruiter@example.com',
+                'date': (today + timedelta(days=400)).strftime('%Y-%m-%d'),
+                'start_time': '09:00:00',
+                'end_time': '09:30:00',
+                'timezone': 'PT',
+                'intake_answers': {'company': 'Acme'},
+            },
+            format='json',
+        )
+        self.assertEqual(beyond_expiry.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(BookingInventoryDay.objects.exists())
+
+        BookingInventoryDay.objects.create(share_link=self.link, date=today - timedelta(days=3), version='old')
+        BookingInventoryDay.objects.create(share_link=self.link, date=today, version='current')
+        self.assertEqual(purge_stale_booking_inventory(), 'Deleted 1 stale booking inventory day(s).')
+        self.assertEqual(list(BookingInventoryDay.objects.values_list('date', flat=True)), [today])
+
+    @patch('availability.views.booking.calculate_availability_for_dates', side_effect=available_9_to_10)
+    def test_bookings_claim_slots_without_regenerating_inventory(self, mock_availability):
+        today = timezone.now().date()
+        other_link = ShareLink.objects.create(
+            user=self.user, uuid='public-link-2', title='Second', expires_at=timezone.now() + timedelta(days=14)
+        )
+        BookingInventoryDay.objects.create(share_link=other_link, date=today, version='built-earlier')
+        url = f'/api/booking/{self.link.uuid}/slots/?days=1&timezone=PT'
+        etag = self.client.get(url)['ETag']
+        calls = mock_availability.call_count
+        payload = {
+            'name': 'Recruiter',
+            'email': 'recruiter@example.com',
+            'date': today.strftime('%Y-%m-%d'),
+            'timezone': 'PT',
+            'intake_answers': {'company': 'Acme'},
+        }
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for start_time, end_time in [('09:00:00', '09:30:00'), ('09:30:00', '10:00:00')]:
+                response = self.client.post(
+                    f'/api/booking/{self.link.uuid}/book/',
+                    {**payload, 'start_time': start_time, 'end_time': end_time},
+                    format='json',
+                )
+                self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # Only the first booking builds the day's inventory; the second claims from it.
+        self.assertEqual(mock_availability.call_count, calls + 1)
+        calls = mock_availability.call_count
+        self.assertFalse(BookingInventoryDay.objects.filter(share_link=other_link).exists())
+        cache.clear()
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data['days'][0]['slots'], [])
+        self.assertEqual(mock_availability.call_count, calls)
+
+
+class SlotGridTests(SimpleTestCase):
+    def test_split_filter_and_shift_on_integer_minutes(self):
+        day = datetime(2026, 6, 1).date()
+        grid = SlotGrid.from_availability_text(day, '9:00 AM - 10:30 AM, 11:45 PM - 12:00 AM').split(30)
+        self.assertEqual(list(grid), [(540, 570), (570, 600), (600, 630)])
+
+        shifted = grid.without([(555, 585)]).shifted('America/Los_Angeles', 'America/New_York')
+        self.assertEqual(
+            shifted.as_response(),
+            [{'start_time': '13:00:00', 'end_time': '13:30:00', 'label': '1:00 PM - 1:30 PM'}],
+        )
+        self.assertTrue(shifted.contains(13 * 60, 13 * 60 + 30))
+
+    def test_shift_is_exact_across_daylight_saving_change(self):
+        day = datetime(2026, 3, 8).date()
+        grid = SlotGrid(day, [60, 9 * 60], [90, 9 * 60 + 30]).shifted('America/Los_Angeles', 'UTC')
+        self.assertEqual(list(grid), [(9 * 60, 9 * 60 + 30), (16 * 60, 16 * 60 + 30)])
+
+
+class AvailabilityBitmapEngineTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username='bitmap-user',
+            email='bitmap@example.com',
+            password='test-pass-123',
+        )
+        UserSettings.objects.create(user=self.user, work_days=[0, 1, 2, 3, 4, 5, 6])
+        self.day = timezone.now().date() + timedelta(days=3)
+        while self.day in holidays.US(years=self.day.year):
+            self.day += timedelta(days=1)
+        self.day_key = self.day.strftime('%Y-%m-%d')
+
+    def test_free_ranges_subtract_events_from_work_hours(self):
+        Event.objects.create(user=self.user, name='Screen', date=self.day, start_time='10:00:00', end_time='11:30:00')
+
+        availability = calculate_availability_for_dates([self.day], user=self.user)
+
+        self.assertEqual(availability[self.day_key]['availability'], '9:00 AM - 10:00 AM, 11:30 AM - 5:00 PM')
+
+    def test_busy_time_follows_each_events_own_timezone(self):
+        # The host works 9-5 Pacific; these are written in Eastern time.
+        Event.objects.create(
+            user=self.user, name='Screen', date=self.day, start_time='12:00:00', end_time='13:30:00', timezone='ET'
+        )
+        Event.objects.create(
+            user=self.user,
+            name='Standup',
+            date=self.day,
+            start_time='16:00:00',
+            end_time='16:30:00',
+            timezone='ET',
+            is_recurring=True,
+            recurrence_rule={'frequency': 'daily', 'interval': 1},
+        )
+
+        availability = calculate_availability_for_dates([self.day], user=self.user)
+
+        self.assertEqual(availability[self.day_key]['availability'], '10:30 AM - 1:00 PM, 1:30 PM - 5:00 PM')
+
+    def test_event_writes_invalidate_cached_day(self):
+        self.assertEqual(
+            calculate_availability_for_dates([self.day], user=self.user)[self.day_key]['availability'],
+            '9:00 AM - 5:00 PM',
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            event = Event.objects.create(user=self.user, name='Onsite', date=self.day, start_time='09:00:00', end_time='17:00:00')
+        self.assertNotIn(self.day_key, calculate_availability_for_dates([self.day], user=self.user))
+
+        event.date = self.day + timedelta(days=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            event.save()
+        self.assertEqual(
+            calculate_availability_for_dates([self.day], user=self.user)[self.day_key]['availability'],
+            '9:00 AM - 5:00 PM',
+        )
+
+    def test_cached_days_follow_writes_committed_by_other_instances(self):
+        calculate_availability_for_dates([self.day], user=self.user)
+        # Another instance's write reaches this process only through the database.
+        Event.objects.bulk_create(
+            [Event(user=self.user, name='Onsite', date=self.day, start_time='09:00:00', end_time='17:00:00')]
+        )
+        bump_availability_version(self.user.id)
+
+        self.assertNotIn(self.day_key, calculate_availability_for_dates([self.day], user=self.user))
+
+    def test_other_users_writes_keep_cached_days(self):
+        calculate_availability_for_dates([self.day], user=self.user)
+        other = get_user_model().objects.create_user(username='bitmap-other', email='other@example.com', password='x')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Event.objects.create(user=other, name='Elsewhere', date=self.day, start_time='09:00:00', end_time='17:00:00')
+        self.assertEqual(clear_widget_cache(), 'Widget cache cleared for 2 user(s).')
+
+        with patch('availability.availability_engine._build_day_states') as build:
+            availability = calculate_availability_for_dates([self.day], user=self.user)
+        build.assert_not_called()
+        self.assertEqual(availability[self.day_key]['availability'], '9:00 AM - 5:00 PM')
+
+
+class RecurrenceExpansionTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='recurrence-user',
+            email='recurrence@example.com',
+            password='test-pass-123',
+        )
+
+    def _parent(self, rule, start):
+        return Event.objects.create(
+            user=self.user,
+            name='Standup',
+            date=start,
+            start_time='09:00:00',
+            end_time='09:15:00',
+            is_recurring=True,
+            recurrence_rule=rule,
+        )
+
+    def test_windowed_expansion_matches_full_walk_for_old_series(self):
+        start = timezone.now().date().replace(year=2015, month=1, day=31)
+        window_start = timezone.now().date()
+        window_end = window_start + timedelta(days=120)
+        rules = [
+            {'frequency': 'daily', 'interval': 3},
+            {'frequency': 'weekly', 'interval': 2, 'byweekday': [0, 3]},
+            {'frequency': 'monthly', 'interval': 1},
+            {'frequency': 'yearly', 'interval': 1},
+        ]
+        for rule in rules:
+            parent = self._parent(rule, start)
+            expected = [
+                occurrence.date()
+                for occurrence in rrule(dtstart=start, **parse_recurrence_rule(rule))
+                .between(datetime.combine(window_start, time.min), datetime.combine(window_end, time.max), inc=True)
+            ]
+            actual = [item['date'] for item in generate_recurring_instances(parent, window_start, window_end)]
+            self.assertEqual(actual, expected, rule)
+
+    def test_user_batch_expansion_honors_excluded_dates(self):
+        start = timezone.now().date()
+        excluded = start + timedelta(days=7)
+        self._parent({'frequency': 'weekly', 'interval': 1, 'excluded_dates': [excluded.isoformat()]}, start)
+        self._parent({'frequency': 'daily', 'interval': 1, 'count': 2}, start)
+
+        instances = generate_recurring_instances_for_user(self.user, start, start + timedelta(days=14))
+
+        self.assertEqual(
+            [item['date'] for item in instances],
+            [start, start, start + timedelta(days=1), start + timedelta(days=14)],
+        )
+
+    def test_series_actions_keep_stored_occurrences_in_sync(self):
+        self.client.force_login(self.user)
+        start = timezone.now().date()
+        parent = Event.objects.create(
+            user=self.user, name='Standup', date=start, start_time='09:00:00', end_time='09:15:00'
+        )
+
+        response = self.client.post(
+            f'/api/events/{parent.id}/set_recurrence/',
+            {'recurrence_rule': {'frequency': 'weekly', 'interval': 1}},
+            format='json',
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        parent.refresh_from_db()
+        self.assertEqual(parent.occurrences_through, occurrence_horizon_end())
+        self.assertTrue(EventOccurrence.objects.filter(parent_event=parent, date=start + timedelta(days=7)).exists())
+
+        self.client.post(
+            f'/api/events/{parent.id}/delete_instance/',
+            {'date': (start + timedelta(days=7)).isoformat()},
+            format='json',
+        )
+        self.assertFalse(EventOccurrence.objects.filter(parent_event=parent, date=start + timedelta(days=7)).exists())
+
+        conflicts = check_for_conflicts(
+            {'date': start + timedelta(days=14), 'start_time': '09:05:00', 'end_time': '09:30:00'},
+            self.user,
+        )
+        self.assertEqual([event.id for event in conflicts], [parent.id])
+
+        self.client.delete(f'/api/events/{parent.id}/delete_series/')
+        self.assertFalse(EventOccurrence.objects.exists())
+
+    def test_saving_a_series_outside_the_api_rematerializes_its_occurrences(self):
+        start = timezone.now().date()
+        parent = Event.objects.create(
+            user=self.user,
+            name='Standup',
+            date=start,
+            start_time='09:00:00',
+            end_time='09:15:00',
+            is_recurring=True,
+            recurrence_rule={'frequency': 'weekly', 'interval': 1},
+        )
+        parent.refresh_from_db()
+        self.assertEqual(parent.occurrences_through, occurrence_horizon_end())
+        weekly = EventOccurrence.objects.filter(parent_event=parent).count()
+
+        parent.recurrence_rule = {'frequency': 'daily', 'interval': 1}
+        parent.save()
+        self.assertGreater(EventOccurrence.objects.filter(parent_event=parent).count(), weekly)
+
+        parent.is_recurring = False
+        parent.save()
+        parent.refresh_from_db()
+        self.assertFalse(EventOccurrence.objects.filter(parent_event=parent).exists())
+        self.assertIsNone(parent.occurrences_through)
+
+    def test_horizon_extension_backfills_unmaterialized_series(self):
+        start = timezone.now().date()
+        parent = self._parent({'frequency': 'daily', 'interval': 1}, start)
+        # As left by a writer that bypasses Event.save(), such as a bulk insert.
+        EventOccurrence.objects.filter(parent_event=parent).delete()
+        Event.objects.filter(pk=parent.pk).update(occurrences_through=start + timedelta(days=2))
+        parent.refresh_from_db()
+
+        extend_event_occurrence_horizon()
+
+        parent.refresh_from_db()
+        self.assertEqual(parent.occurrences_through, occurrence_horizon_end())
+        self.assertEqual(
+            EventOccurrence.objects.filter(parent_event=parent).count(),
+            (occurrence_horizon_end() - start).days - 2,
+        )
+        self.assertEqual(
+            [item['date'] for item in generate_recurring_instances_for_user(self.user, start + timedelta(days=3), start + timedelta(days=4))],
+            [start + timedelta(days=3), start + timedelta(days=4)],
+        )
+
+    def test_horizon_extension_resumes_with_the_furthest_behind_series(self):
+        start = timezone.now().date()
+        behind = self._parent({'frequency': 'daily', 'interval': 1}, start)
+        ahead = self._parent({'frequency': 'daily', 'interval': 1}, start)
+        for parent, days in [(behind, 100), (ahead, 200)]:
+            EventOccurrence.objects.filter(parent_event=parent, date__gt=start + timedelta(days=days)).delete()
+            Event.objects.filter(pk=parent.pk).update(occurrences_through=start + timedelta(days=days))
+        one_off = Event.objects.create(
+            user=self.user, name='Onsite', date=start + timedelta(days=150), start_time='09:00:00', end_time='10:00:00'
+        )
+
+        with patch('time.monotonic', side_effect=[0, 0, 100]):
+            extend_event_occurrence_horizon(time_budget=1)
+
+        behind.refresh_from_db()
+        ahead.refresh_from_db()
+        self.assertEqual(behind.occurrences_through, occurrence_horizon_end())
+        self.assertEqual(ahead.occurrences_through, start + timedelta(days=200))
+        self.assertTrue(ConflictAlert.objects.filter(event1=behind, event2=one_off).exists())
+
+
+class EventUtcRangeTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='utc-user',
+            email='utc@example.com',
+            password='test-pass-123',
+        )
+
+    def test_utc_range_is_kept_in_sync_and_used_for_conflicts(self):
+        day = timezone.now().date() + timedelta(days=30)
+        event = Event.objects.create(
+            user=self.user, name='East coast call', date=day, start_time='12:00:00', end_time='13:00:00', timezone='ET'
+        )
+        self.assertEqual(event.end_at - event.start_at, timedelta(hours=1))
+
+        conflicts = check_for_conflicts(
+            {'date': day, 'start_time': '09:30:00', 'end_time': '10:30:00', 'timezone': 'PT'},
+            self.user,
+        )
+        self.assertEqual([item.id for item in conflicts], [event.id])
+
+        event.start_time = '14:00:00'
+        event.end_time = '15:00:00'
+        event.save(update_fields=['start_time', 'end_time'])
+        event.refresh_from_db()
+        self.assertEqual(event.end_at - event.start_at, timedelta(hours=1))
+        self.assertEqual(
+            check_for_conflicts(
+                {'date': day, 'start_time': '09:30:00', 'end_time': '10:30:00', 'timezone': 'PT'},
+                self.user,
+            ),
+            [],
+        )
+
+    def test_booking_utc_range_uses_the_resolved_link_timezone(self):
+        link = ShareLink.objects.create(
+            user=self.user, uuid='utc-link', title='Intro', expires_at=timezone.now() + timedelta(days=7)
+        )
+        link.host_timezone_code = 'ET'
+        day = timezone.now().date() + timedelta(days=30)
+
+        with CaptureQueriesContext(connection) as queries:
+            booking = PublicBooking.objects.create(
+                share_link=link, name='Guest', email='guest@example.com', date=day, start_time='09:00:00', end_time='09:30:00'
+            )
+
+        self.assertFalse(any('primary_timezone' in query['sql'] for query in queries.captured_queries))
+        self.assertEqual(
+            booking.start_at,
+            datetime.combine(day, time(9, 0), tzinfo=ZoneInfo('America/New_York')).astimezone(dt_timezone.utc),
+        )
+
+
+    def test_detect_all_conflicts_sweeps_events_and_series_in_bulk(self):
+        day = timezone.now().date() + timedelta(days=30)
+        first = Event.objects.create(user=self.user, name='A', date=day, start_time='09:00:00', end_time='10:00:00')
+        second = Event.objects.create(user=self.user, name='B', date=day, start_time='09:30:00', end_time='11:00:00')
+        third = Event.objects.create(user=self.user, name='C', date=day, start_time='10:30:00', end_time='12:00:00')
+        Event.objects.create(user=self.user, name='D', date=day, start_time='12:00:00', end_time='13:00:00')
+        late = Event.objects.create(
+            user=self.user, name='E', date=day, start_time='23:30:00', end_time='00:30:00'
+        )
+        series = Event.objects.create(
+            user=self.user, name='Weekly', date=day - timedelta(days=6), start_time='00:00:00', end_time='00:15:00'
+        )
+        self.client.force_login(self.user)
+        self.client.post(
+            f'/api/events/{series.id}/set_recurrence/',
+            {'recurrence_rule': {'frequency': 'weekly', 'interval': 1}},
+            format='json',
+        )
+        ConflictAlert.objects.create(event1=first, event2=third)
+
+        with self.assertNumQueries(4):
+            count = detect_all_conflicts(self.user)
+
+        self.assertEqual(count, 3)
+        self.assertEqual(
+            set(ConflictAlert.objects.values_list('event1_id', 'event2_id')),
+            {(first.id, second.id), (second.id, third.id), tuple(sorted((late.id, series.id)))},
+        )
+
+
+    def test_conflict_alerts_follow_event_changes(self):
+        day = timezone.now().date() + timedelta(days=30)
+        first = Event.objects.create(user=self.user, name='A', date=day, start_time='09:00:00', end_time='10:00:00')
+        second = Event.objects.create(user=self.user, name='B', date=day, start_time='09:30:00', end_time='10:30:00')
+        self.assertEqual(
+            list(ConflictAlert.objects.values_list('event1_id', 'event2_id', 'resolved')),
+            [(first.id, second.id, False)],
+        )
+
+        second.start_time = '11:00:00'
+        second.end_time = '12:00:00'
+        second.save()
+        self.assertFalse(ConflictAlert.objects.exists())
+
+        second.start_time = '09:45:00'
+        second.save()
+        ConflictAlert.objects.update(resolved=True)
+        first.save()
+        self.assertEqual(list(ConflictAlert.objects.values_list('resolved', flat=True)), [True])
+
+        second.delete()
+        self.assertFalse(ConflictAlert.objects.exists())
+
+
+class CalendarFeedTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='feed-user',
+            email='feed@example.com',
+            password='test-pass-123',
+        )
+        self.client.force_authenticate(self.user)
+
+    def test_feed_streams_events_and_recurring_instances_and_revalidates(self):
+        day = timezone.now().date() + timedelta(days=3)
+        event = Event.objects.create(user=self.user, name='Onsite', date=day, start_time='10:00:00', end_time='11:00:00')
+        parent = Event.objects.create(
+            user=self.user,
+            name='Standup',
+            date=day,
+            start_time='09:00:00',
+            end_time='09:15:00',
+            is_recurring=True,
+            recurrence_rule={'frequency': 'daily', 'interval': 1, 'count': 3},
+        )
+        materialize_event_occurrences(parent)
+
+        feed_url = self.client.post('/api/user-settings/calendar_feed/').data['url']
+        self.client.force_authenticate(None)
+        response = self.client.get(feed_url, HTTP_ACCEPT='text/calendar')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        body = b''.join(response.streaming_content).decode()
+        self.assertIn(f'UID:event-{event.id}@careerhub', body)
+        self.assertEqual(body.count(f'UID:event-{parent.id}-'), 3)
+        self.assertTrue(body.endswith('END:VCALENDAR\r\n'))
+
+        with self.assertNumQueries(2):
+            cached = self.client.get(feed_url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        event.delete()
+        self.assertEqual(self.client.get(feed_url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(self.user)
+        self.client.delete('/api/user-settings/calendar_feed/')
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(feed_url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_feed_ends_overnight_events_on_the_next_day(self):
+        day = timezone.now().date() + timedelta(days=3)
+        Event.objects.create(user=self.user, name='Red-eye', date=day, start_time='22:00:00', end_time='01:00:00')
+
+        feed_url = self.client.post('/api/user-settings/calendar_feed/').data['url']
+        self.client.force_authenticate(None)
+        body = b''.join(self.client.get(feed_url).streaming_content).decode()
+
+        self.assertIn(f'DTSTART;TZID=America/Los_Angeles:{day:%Y%m%d}T220000', body)
+        self.assertIn(f'DTEND;TZID=America/Los_Angeles:{day + timedelta(days=1):%Y%m%d}T010000', body)
+
+
+class EventExportTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='export-user',
+            email='export@example.com',
+            password='test-pass-123',
+        )
+        self.client.force_authenticate(self.user)
+        day = timezone.now().date()
+        for index in range(3):
+            Event.objects.create(
+                user=self.user,
+                name=f'Interview {index}',
+                date=day,
+                start_time='10:00:00',
+                end_time='11:00:00',
+            )
+
+    def test_csv_and_json_exports_stream_every_row(self):
+        with patch('availability.utils.EXPORT_CHUNK_SIZE', 2):
+            csv_response = self.client.get('/api/events/export/', {'fmt': 'csv'})
+            self.assertTrue(csv_response.streaming)
+            rows = list(csv.DictReader(io.StringIO(csv_response.getvalue().decode())))
+
+            json_response = self.client.get('/api/events/export/', {'fmt': 'json'})
+            self.assertTrue(json_response.streaming)
+            records = json.loads(json_response.getvalue())
+
+        self.assertEqual(sorted(row['name'] for row in rows), ['Interview 0', 'Interview 1', 'Interview 2'])
+        self.assertEqual(sorted(record['name'] for record in records), ['Interview 0', 'Interview 1', 'Interview 2'])
+
+    def test_xlsx_export_uses_write_only_workbook(self):
+        response = self.client.get('/api/events/export/', {'fmt': 'xlsx'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        workbook = load_workbook(io.BytesIO(response.getvalue()), read_only=True)
+        values = list(workbook.active.iter_rows(values_only=True))
+        self.assertEqual(len(values), 4)
+        self.assertIn('name', values[0])
+
+    def test_export_all_streams_one_file_per_section(self):
+        response = self.client.get('/api/user-settings/export_all/', {'fmt': 'csv'})
+
+        self.assertTrue(response.streaming)
+        with zipfile.ZipFile(io.BytesIO(response.getvalue())) as archive:
+            self.assertIn('events.csv', archive.namelist())
+            rows = list(csv.DictReader(io.StringIO(archive.read('events.csv').decode())))
+        self.assertEqual(len(rows), 3)
+
+        workbook_response = self.client.get('/api/user-settings/export_all/', {'fmt': 'xlsx'})
+        workbook = load_workbook(io.BytesIO(workbook_response.getvalue()), read_only=True)
+        self.assertEqual(workbook.sheetnames, ['events', 'holidays', 'applications', 'user_settings', 'categories'])
+
+    def test_empty_export_is_valid_json(self):
+        Event.objects.filter(user=self.user).delete()
+
+        response = self.client.get('/api/events/export/', {'fmt': 'json'})
+
+        self.assertEqual(json.loads(response.getvalue()), [])
+
+
+class ExportJobTests(APITestCase):
+    def setUp(self):
+        self.media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media_root.cleanup)
+        media_override = override_settings(MEDIA_ROOT=self.media_root.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        self.user = get_user_model().objects.create_user(
+            username='export-job-user',
+            email='export-job@example.com',
+            password='test-pass-123',
+        )
+        self.client.force_authenticate(self.user)
+        Event.objects.create(user=self.user, name='Onsite', date=timezone.now().date(), start_time='10:00:00', end_time='11:00:00')
+
+    def test_job_is_built_by_worker_polled_downloaded_and_reused_until_data_changes(self):
+        queued = self.client.post('/api/export-jobs/', {'scope': 'events', 'format': 'csv'}, format='json')
+        self.assertEqual(queued.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(queued.data['status'], ExportJob.STATUS_PENDING)
+        self.assertIsNone(queued.data['download_url'])
+        not_ready = self.client.get(f'/api/export-jobs/{queued.data["id"]}/download/')
+        self.assertEqual(not_ready.status_code, status.HTTP_409_CONFLICT)
+
+        self.assertIn('Built 1 export(s)', run_export_jobs())
+
+        polled = self.client.get(f'/api/export-jobs/{queued.data["id"]}/')
+        self.assertEqual(polled.data['status'], ExportJob.STATUS_COMPLETED)
+        download = self.client.get(polled.data['download_url'])
+        self.assertEqual(download.status_code, status.HTTP_200_OK)
+        self.assertIn(b'Onsite', download.getvalue())
+
+        reused = self.client.get('/api/events/export/', {'fmt': 'csv', 'async': '1'})
+        self.assertEqual(reused.status_code, status.HTTP_200_OK)
+        self.assertEqual(reused.data['id'], queued.data['id'])
+
+        Event.objects.create(user=self.user, name='Debrief', date=timezone.now().date(), start_time='12:00:00', end_time='12:30:00')
+        rebuilt = self.client.post('/api/export-jobs/', {'scope': 'events', 'format': 'csv'}, format='json')
+        self.assertEqual(rebuilt.status_code, status.HTTP_202_ACCEPTED)
+        run_export_jobs()
+        self.assertEqual(list(ExportJob.objects.filter(user=self.user).values_list('id', flat=True)), [rebuilt.data['id']])
+
+    def test_fingerprint_changes_when_rows_without_other_timestamps_are_edited(self):
+        holiday = CustomHoliday.objects.create(user=self.user, date=timezone.now().date(), description='Offsite')
+        link = ShareLink.objects.create(user=self.user, uuid='export-link', title='Screen', expires_at=timezone.now() + timedelta(days=7))
+        holidays_before = export_fingerprint(self.user, ExportJob.SCOPE_HOLIDAYS, 'csv')
+
+        holiday.description = 'Team offsite'
+        holiday.save()
+        self.assertNotEqual(export_fingerprint(self.user, ExportJob.SCOPE_HOLIDAYS, 'csv'), holidays_before)
+
+        ShareLink.objects.filter(pk=link.pk).update(expires_at=timezone.now() - timedelta(minutes=1))
+        account_before = export_fingerprint(self.user, ExportJob.SCOPE_ACCOUNT, 'zip')
+        expire_stale_share_links()
+        self.assertNotEqual(export_fingerprint(self.user, ExportJob.SCOPE_ACCOUNT, 'zip'), account_before)
+
+    def test_account_export_job_and_validation(self):
+        invalid = self.client.post('/api/export-jobs/', {'scope': 'account', 'format': 'csv'}, format='json')
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+
+        queued = self.client.get('/api/user-settings/account-export/', {'fmt': 'zip', 'async': 'true'})
+        self.assertEqual(queued.status_code, status.HTTP_202_ACCEPTED)
+        run_export_jobs()
+
+        download = self.client.get(f'/api/export-jobs/{queued.data["id"]}/download/')
+        with zipfile.ZipFile(io.BytesIO(download.getvalue())) as archive:
+            payload = json.loads(archive.read('careerhub-account-export.json'))
+        self.assertEqual(payload['availability']['events'][0]['name'], 'Onsite')
+
+        ExportJob.objects.update(expires_at=timezone.now() - timedelta(minutes=1))
+        self.assertEqual(purge_expired_export_jobs(), 'Deleted 1 expired export(s).')
+
+
+class BackupRestoreTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='restore-user',
+            email='restore@example.com',
+            password='test-pass-123',
+        )
+        self.client.force_authenticate(self.user)
+
+    def _backup(self, event_count):
+        day = timezone.now().date()
+        return {
+            'schema': 'careerhub.account_export.v1',
+            'availability': {
+                'categories': [{'id': 7, 'name': 'Interviews', 'color': '#123456', 'icon': '', 'is_locked': False}],
+                'holidays': [{'date': day.isoformat(), 'description': 'Offsite', 'holiday_type': 'custom', 'is_recurring': False, 'is_locked': False}],
+                'events': [
+                    {
+                        'name': f'Event {index}',
+                        'date': (day + timedelta(days=max(index - 1, 0))).isoformat(),
+                        'start_time': '10:00:00' if index else '10:30:00',
+                        'end_time': '11:00:00',
+                        'timezone': 'PT',
+                        'location_type': 'virtual',
+                        'location': '',
+                        'meeting_link': '',
+                        'is_recurring': False,
+                        'notes': '',
+                        'reminder_minutes': 15,
+                        'is_locked': False,
+                        'category': 7,
+                    }
+                    for index in range(event_count)
+                ],
+            },
+            'career': {
+                'companies': [{'name': 'Acme', 'website': 'https://acme.example', 'industry': 'Tools'}],
+                'applications': [
+                    {'company': 'Acme', 'role_title': 'Engineer', 'status': 'APPLIED', 'notes': 'first'},
+                    {'company': 'Globex', 'role_title': 'Analyst', 'status': 'APPLIED', 'notes': ''},
+                ],
+                'tasks': [{'title': 'Follow up', 'status': 'TODO', 'priority': 'MEDIUM', 'position': 0}],
+                'ai_artifacts': [
+                    {'artifact_type': 'COVER_LETTER', 'client_id': 'letter-1', 'title': 'Letter', 'payload': {}},
+                    {'artifact_type': 'COVER_LETTER', 'client_id': '', 'title': 'Skipped'},
+                ],
+                'offer_decision_snapshots': [
+                    {'offer_company': 'Acme', 'offer_role': 'Engineer', 'title': 'Week 1', 'offer_snapshot': {'base_salary': 100000}},
+                ],
+            },
+        }
+
+    def _restore(self, payload, mode='merge'):
+        backup_file = SimpleUploadedFile('backup.json', json.dumps(payload).encode('utf-8'), content_type='application/json')
+        return self.client.post('/api/user-settings/restore-backup/', {'file': backup_file, 'mode': mode}, format='multipart')
+
+    def test_restore_writes_in_bulk_chunks_and_merges_idempotently(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self._restore(self._backup(event_count=600))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLess(len(queries), 100)
+        counts = response.data['created_counts']
+        self.assertEqual(counts['events'], 600)
+        self.assertEqual(counts['companies'], 2)
+        self.assertEqual(counts['applications'], 2)
+        self.assertEqual(counts['ai_artifacts'], 1)
+        self.assertEqual(counts['offer_decision_snapshots'], 1)
+        event = Event.objects.get(user=self.user, name='Event 1')
+        self.assertEqual(event.category.name, 'Interviews')
+        self.assertIsNotNone(event.start_at)
+        self.assertTrue(ConflictAlert.objects.filter(event1__user=self.user).exists())
+
+        payload = self._backup(event_count=600)
+        payload['career']['applications'][0]['notes'] = 'updated'
+        rerun = self._restore(payload)
+
+        counts = rerun.data['created_counts']
+        self.assertEqual([counts[key] for key in ('categories', 'holidays', 'events', 'companies', 'applications', 'tasks', 'ai_artifacts')], [0] * 7)
+        self.assertEqual(Event.objects.filter(user=self.user).count(), 600)
+        self.assertEqual(self.user.applications.get(role_title='Engineer').notes, 'updated')
+
+    def test_replace_restore_clears_existing_rows_first(self):
+        Event.objects.create(user=self.user, name='Stale', date=timezone.now().date(), start_time='09:00:00', end_time='09:30:00')
+
+        response = self._restore(self._backup(event_count=3), mode='replace')
+
+        self.assertEqual(response.data['created_counts']['events'], 3)
+        self.assertFalse(Event.objects.filter(user=self.user, name='Stale').exists())
+
+    def test_restored_recurring_series_get_their_occurrences(self):
+        payload = self._backup(event_count=1)
+        payload['availability']['events'][0].update(
+            is_recurring=True, recurrence_rule={'frequency': 'daily', 'interval': 1, 'count': 3}
+        )
+
+        response = self._restore(payload)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        parent = Event.objects.get(user=self.user, name='Event 0')
+        self.assertIsNotNone(parent.occurrences_through)
+        self.assertEqual(EventOccurrence.objects.filter(parent_event=parent).count(), 3)
+
+    def test_truncated_replace_restore_keeps_existing_rows(self):
+        Event.objects.create(user=self.user, name='Keep', date=timezone.now().date(), start_time='09:00:00', end_time='09:30:00')
+        content = json.dumps(self._backup(event_count=50)).encode('utf-8')
+        upload = SimpleUploadedFile('backup.json', content[: len(content) // 2], content_type='application/json')
+
+        response = self.client.post('/api/user-settings/restore-backup/', {'file': upload, 'mode': 'replace'}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(list(Event.objects.filter(user=self.user).values_list('name', flat=True)), ['Keep'])
+
+    def test_restore_streams_sections_and_replays_ones_ahead_of_their_dependencies(self):
+        backup = self._backup(event_count=3)
+        availability = backup.pop('availability')
+        payload = {
+            'career': backup.pop('career'),
+            'availability': {'events': availability['events'], 'categories': availability['categories']},
+            **backup,
+        }
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w') as zip_file:
+            zip_file.writestr('careerhub-account-export.json', json.dumps(payload))
+        upload = SimpleUploadedFile('backup.zip', archive.getvalue(), content_type='application/zip')
+
+        response = self.client.post('/api/user-settings/restore-backup/', {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['created_counts']['events'], 3)
+        self.assertEqual(response.data['created_counts']['offer_decision_snapshots'], 1)
+        self.assertEqual(Event.objects.get(user=self.user, name='Event 2').category.name, 'Interviews')
+
+    def test_restore_rejects_unknown_schema_before_writing(self):
+        payload = self._backup(event_count=3)
+        payload['schema'] = 'something.else'
+
+        response = self._restore(payload)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Event.objects.filter(user=self.user).exists())
+
+
+class JSONStreamTests(SimpleTestCase):
+    def test_iter_json_items_yields_section_records_across_small_reads(self):
+        document = {
+            'schema': 'v1',
+            'account': {'email': 'a@example.com'},
+            'availability': {'events': [{'name': 'Café', 'reminder_minutes': 15}, {'name': 'Sync'}], 'holidays': []},
+            'total': 12345,
+        }
+        raw = json.dumps(document, ensure_ascii=False).encode('utf-8')
+
+        items = list(iter_json_items(io.BytesIO(raw), read_size=3))
+
+        self.assertEqual(
+            items,
+            [
+                (('schema',), 'v1'),
+                (('account', 'email'), 'a@example.com'),
+                (('availability', 'events'), {'name': 'Café', 'reminder_minutes': 15}),
+                (('availability', 'events'), {'name': 'Sync'}),
+                (('total',), 12345),
+            ],
+        )
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_items(io.BytesIO(b'{"events": [1, 2'), read_size=3))
+
+    def test_large_values_are_read_in_growing_chunks(self):
+        raw = json.dumps({'notes': 'x' * 100_000, 'total': 1}).encode('utf-8')
+        stream = io.BytesIO(raw)
+        reads = []
+        original_read = stream.read
+        stream.read = lambda size: reads.append(size) or original_read(size)
+
+        items = list(iter_json_items(stream, read_size=64))
+
+        self.assertEqual(items, [(('notes',), 'x' * 100_000), (('total',), 1)])
+        self.assertLess(len(reads), 20)
+
 
 class AIProviderSettingsTests(APITestCase):
     def setUp(self):
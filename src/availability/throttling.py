@@ -23,5 +23,16 @@ class PublicBookingCreateThrottle(SimpleRateThrottle):
         }
 
 
+class CalendarFeedThrottle(SimpleRateThrottle):
+    scope = "calendar_feed"
+    rate = "30/min"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
 class AIProviderRelayThrottle(UserRateThrottle):
     scope = "ai_provider_relay"
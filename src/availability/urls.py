@@ -15,6 +15,7 @@ router.register(r'categories', views.EventCategoryViewSet, basename='category')
 router.register(r'user-settings', views.UserSettingsViewSet, basename='user-settings')
 router.register(r'conflicts', views.ConflictAlertViewSet, basename='conflict')
 router.register(r'public-bookings', views.PublicBookingViewSet, basename='public-booking')
+router.register(r'export-jobs', views.ExportJobViewSet, basename='export-job')
 
 urlpatterns = [
     path('booking/<str:uuid>/slots/', views.PublicBookingSlotsView.as_view(), name='booking-slots'),
@@ -24,5 +25,6 @@ urlpatterns = [
         views.PublicBookingManageView.as_view(),
         name='booking-manage',
     ),
+    path('calendar/feed/<str:token>.ics', views.CalendarFeedView.as_view(), name='calendar-feed'),
     path('', include(router.urls)),
 ]
@@ -1,11 +1,8 @@
 from datetime import datetime, timedelta, date, time
-import pandas as pd
-from django.http import HttpResponse, JsonResponse
+from django.http import FileResponse, JsonResponse, StreamingHttpResponse
 import json
-import io
+import tempfile
 import holidays
-from .models import UserSettings, AvailabilityOverride, CustomHoliday, Event
-from .recurrence import generate_recurring_instances
 
 def get_next_two_weeks_weekdays(start_date=None):
     if start_date is None:
@@ -64,112 +61,22 @@ def subtract_intervals(base_start, base_end, intervals):
     return available
 
 def calculate_availability_for_dates(dates, timezone_str='America/Los_Angeles', user=None):
+    from .availability_engine import format_free_ranges, free_ranges_from_bitmap, get_day_states
+
     availability = {}
     if not dates: return availability
 
     date_list = [d.date() if isinstance(d, datetime) else d for d in dates]
-    start_date = min(date_list)
-    end_date = max(date_list)
-
-    settings = UserSettings.objects.filter(user=user).first() if user else None
-    
-    work_start_time = time(9, 0)
-    work_end_time = time(17, 0)
-    work_days = [0, 1, 2, 3, 4] # Mon-Fri
-    
-    work_time_ranges = []
-
-    if settings:
-        if settings.work_start_time: work_start_time = settings.work_start_time
-        if settings.work_end_time: work_end_time = settings.work_end_time
-        if settings.work_days: work_days = settings.work_days
-        if settings.work_time_ranges:
-            for r in settings.work_time_ranges:
-                s = parse_time_str(r.get('start', ''))
-                e = parse_time_str(r.get('end', ''))
-                if s and e:
-                    work_time_ranges.append((s, e))
-
-    overrides = {
-        o.date: o.availability_text 
-        for o in AvailabilityOverride.objects.filter(user=user, date__range=[start_date, end_date])
-    }
-    
-    custom_holidays = set(
-        CustomHoliday.objects.filter(user=user, date__range=[start_date, end_date]).values_list('date', flat=True)
-    )
-    
-    years = set(d.year for d in date_list)
-    fed_holidays = {}
-    for year in years:
-        fed_holidays.update(holidays.US(years=year))
-        
-    events = Event.objects.filter(
-        user=user,
-        date__range=[start_date, end_date],
-        parent_event__isnull=True
-    )
-    
-    recurring_parents = Event.objects.filter(user=user, is_recurring=True, parent_event__isnull=True)
-    generated_instances = []
-    for p in recurring_parents:
-        generated_instances.extend(generate_recurring_instances(p, start_date, end_date))
-
-    events_by_date = {d: [] for d in date_list}
-    
-    def add_to_map(evt_date, s_time, e_time):
-        if evt_date in events_by_date:
-            events_by_date[evt_date].append((s_time, e_time))
-
-    for e in events:
-        s = parse_time_str(e.start_time)
-        e_t = parse_time_str(e.end_time)
-        if s and e_t and not e.is_recurring:
-            add_to_map(e.date, s, e_t)
-
-    for inst in generated_instances:
-        s = parse_time_str(inst['start_time'])
-        e_t = parse_time_str(inst['end_time'])
-        if s and e_t:
-            add_to_map(inst['date'], s, e_t)
+    day_states = get_day_states(user, date_list)
 
     for d in date_list:
         date_str = d.strftime('%Y-%m-%d')
-        
-        if d in overrides:
-            text = overrides[d]
-            
-        elif d in fed_holidays or d in custom_holidays:
-            text = "Unavailable"
-            
-        elif d.weekday() not in work_days:
-            text = "Unavailable"
-            
-        else:
-            day_conflicts = []
-            if d in events_by_date:
-                for s, e in events_by_date[d]:
-                    c_start = datetime.combine(d, s)
-                    c_end = datetime.combine(d, e)
-                    day_conflicts.append((c_start, c_end))
-
-            ranges = work_time_ranges if work_time_ranges else [(work_start_time, work_end_time)]
-
-            all_slots = []
-            for rng_start, rng_end in ranges:
-                base_start = datetime.combine(d, rng_start)
-                base_end = datetime.combine(d, rng_end)
-                all_slots.extend(subtract_intervals(base_start, base_end, day_conflicts))
-
-            if not all_slots:
-                text = "Unavailable"
-            else:
-                parts = []
-                for s_dt, e_dt in sorted(all_slots):
-                    if (e_dt - s_dt).total_seconds() >= 900:
-                        parts.append(f"{s_dt.strftime('%-I:%M %p')} - {e_dt.strftime('%-I:%M %p')}")
+        override_text, bitmap = day_states[d]
 
-                text = ", ".join(parts) if parts else "Unavailable"
+        if override_text is not None:
+            text = override_text
+        else:
+            text = format_free_ranges(free_ranges_from_bitmap(bitmap)) or "Unavailable"
 
         if text != "Unavailable":
             availability[date_str] = {
@@ -181,37 +88,150 @@ def calculate_availability_for_dates(dates, timezone_str='America/Los_Angeles',
         
     return availability
 
+EXPORT_CHUNK_SIZE = 500
+
+
+def iter_chunks(iterable, size=None):
+    size = size or EXPORT_CHUNK_SIZE
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def serialized_records(queryset, serializer_class, context=None):
+    """Yield serialized rows from ``queryset`` one chunk of instances at a time."""
+    rows = queryset.iterator(chunk_size=EXPORT_CHUNK_SIZE) if hasattr(queryset, 'iterator') else queryset
+    for chunk in iter_chunks(rows):
+        yield from serializer_class(chunk, many=True, context=context or {}).data
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def _flat_export_value(value):
+    if isinstance(value, (dict, list)):
+        return str(value)
+    return value
+
+
+def _iter_csv(records):
+    import csv
+
+    writer = csv.writer(_Echo())
+    fields = None
+    for chunk in iter_chunks(records):
+        lines = []
+        if fields is None:
+            fields = list(chunk[0].keys())
+            lines.append(writer.writerow(fields))
+        lines.extend(writer.writerow([_flat_export_value(record.get(field)) for field in fields]) for record in chunk)
+        yield ''.join(lines)
+
+
+def _iter_json(records):
+    opened = False
+    for chunk in iter_chunks(records):
+        body = ',\n'.join('  ' + json.dumps(record, default=str) for record in chunk)
+        yield (',\n' if opened else '[\n') + body
+        opened = True
+    yield '\n]\n' if opened else '[]\n'
+
+
+def iter_export_chunks(records, export_format):
+    """Yield ``records`` as CSV or JSON text, one chunk of rows at a time."""
+    return _iter_csv(records) if export_format == 'csv' else _iter_json(records)
+
+
+def write_xlsx(sheets, target):
+    """Write ``(sheet_name, records)`` pairs to ``target`` with a write-only workbook."""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    for name, records in sheets:
+        sheet = workbook.create_sheet(name[:31])
+        fields = None
+        for record in records:
+            if fields is None:
+                fields = list(record.keys())
+                sheet.append(fields)
+            sheet.append([_flat_export_value(record.get(field)) for field in fields])
+    workbook.save(target)
+
+
 def export_data(queryset, serializer_class, export_format='csv', filename='export'):
-    serializer = serializer_class(queryset, many=True)
-    data = serializer.data
-    
-    if not data:
-        df = pd.DataFrame()
-    else:
-        df = pd.DataFrame(data)
+    records = serialized_records(queryset, serializer_class)
 
     if export_format == 'csv':
-        response = HttpResponse(content_type='text/csv')
+        response = StreamingHttpResponse(iter_export_chunks(records, 'csv'), content_type='text/csv')
         response['Content-Disposition'] = f'attachment; filename="{filename}.csv"'
-        df.to_csv(path_or_buf=response, index=False)
         return response
 
     elif export_format == 'xlsx' or export_format == 'excel':
-        response = HttpResponse(content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-        response['Content-Disposition'] = f'attachment; filename="{filename}.xlsx"'
-        # Write to buffer
-        with io.BytesIO() as buffer:
-            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Sheet1')
-            response.write(buffer.getvalue())
-        return response
+        # openpyxl's write-only workbook spools rows to disk; the finished file
+        # is streamed back from a temporary file rather than a BytesIO.
+        target = tempfile.TemporaryFile()
+        write_xlsx([('Sheet1', records)], target)
+        target.seek(0)
+        return FileResponse(
+            target,
+            as_attachment=True,
+            filename=f'{filename}.xlsx',
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        )
 
     elif export_format == 'json':
-        response = HttpResponse(content_type='application/json')
+        response = StreamingHttpResponse(iter_export_chunks(records, 'json'), content_type='application/json')
         response['Content-Disposition'] = f'attachment; filename="{filename}.json"'
-        
-        response.write(json.dumps(data, indent=2, default=str)) 
         return response
 
     else:
         return JsonResponse({'error': 'Invalid format. Supported: csv, xlsx, json'}, status=400)
+
+class _ZipStreamBuffer:
+    """Write-only sink that lets ``zipfile`` emit an archive while it is streamed."""
+
+    def __init__(self):
+        self._chunks = []
+        self._offset = 0
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._offset
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(entries):
+    """Yield a deflated zip archive built from ``(name, chunks)`` pairs without buffering it whole.
+
+    ``chunks`` may yield ``str`` (encoded as UTF-8) or ``bytes``.
+    """
+    import zipfile
+
+    buffer = _ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, chunks in entries:
+            with archive.open(name, 'w', force_zip64=True) as entry:
+                for chunk in chunks:
+                    entry.write(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+                    data = buffer.drain()
+                    if data:
+                        yield data
+    yield buffer.drain()
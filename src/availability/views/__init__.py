@@ -7,11 +7,14 @@ from .booking import (
     PublicBookingViewSet,
 )
 from .events import EventViewSet
+from .exports import ExportJobViewSet
+from .feed import CalendarFeedView
 from .holidays import HolidayViewSet
 from .management import ConflictAlertViewSet, EventCategoryViewSet, ImportViewSet, UserSettingsViewSet
 
 __all__ = [
     'EventViewSet',
+    'ExportJobViewSet',
     'HolidayViewSet',
     'AvailabilityOverrideViewSet',
     'AvailabilitySettingViewSet',
@@ -25,4 +28,5 @@ __all__ = [
     'PublicBookingSlotsView',
     'PublicBookingCreateView',
     'PublicBookingManageView',
+    'CalendarFeedView',
 ]
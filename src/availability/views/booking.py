@@ -1,10 +1,12 @@
-from datetime import datetime, timedelta, timezone as dt_timezone
+import hashlib
+from collections import Counter
+from datetime import datetime, time, timedelta, timezone as dt_timezone
 from zoneinfo import ZoneInfo
 from uuid import uuid4
 
 from django.conf import settings as django_settings
 from django.core.cache import cache
-from django.core.mail import EmailMessage
+from django.db import IntegrityError, transaction
 from django.http import HttpResponse
 from django.utils import timezone
 from rest_framework import status, viewsets
@@ -13,11 +15,17 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from ..models import Event, PublicBooking, ShareLink, UserSettings
+from ..availability_engine import get_availability_version, get_availability_versions
+from ..models import BookingEmailOutbox, BookingInventoryDay, BookingSlot, Event, PublicBooking, ShareLink, UserSettings
 from ..serializers import PublicBookingSerializer, ShareLinkSerializer
 from ..throttling import PublicBookingCreateThrottle, PublicBookingSlotsThrottle
 from ..utils import calculate_availability_for_dates
-from ..signals import get_user_settings_tz_cache_key
+from ..signals import get_share_link_cache_key, get_user_settings_tz_cache_key
+from ..slots import MINUTES_PER_DAY, SlotGrid, format_clock, parse_clock_minutes
+
+# Shared caches may reuse a slots response this long; browsers always revalidate.
+PUBLIC_SLOTS_SHARED_MAX_AGE = 30
+SHARE_LINK_CACHE_TIMEOUT = 60
 
 TIMEZONE_CODE_TO_NAME = {
     'PT': 'America/Los_Angeles',
@@ -27,31 +35,6 @@ TIMEZONE_CODE_TO_NAME = {
 }
 
 
-def _parse_slot_ranges(availability_text):
-    slots = []
-    if not availability_text:
-        return slots
-
-    parts = [part.strip() for part in str(availability_text).split(',') if part.strip()]
-    for part in parts:
-        if ' - ' not in part:
-            continue
-        start_str, end_str = [item.strip() for item in part.split(' - ', 1)]
-        try:
-            start_dt = datetime.strptime(start_str, '%I:%M %p')
-            end_dt = datetime.strptime(end_str, '%I:%M %p')
-        except ValueError:
-            continue
-        slots.append(
-            {
-                'start_time': start_dt.strftime('%H:%M:%S'),
-                'end_time': end_dt.strftime('%H:%M:%S'),
-                'label': f'{start_str} - {end_str}',
-            }
-        )
-    return slots
-
-
 def _normalize_timezone_code(value):
     if not value:
         return 'PT'
@@ -75,70 +58,49 @@ def _base_timezone_code(user):
     return tz_code
 
 
-def _format_label(start_dt, end_dt):
-    start_str = start_dt.strftime('%I:%M %p').lstrip('0')
-    end_str = end_dt.strftime('%I:%M %p').lstrip('0')
-    return f'{start_str} - {end_str}'
-
-
-def _convert_slots_between_timezones(date_obj, slots, from_code, to_code):
-    if from_code == to_code:
-        out = []
-        for slot in slots:
-            start_dt = datetime.strptime(slot['start_time'], '%H:%M:%S')
-            end_dt = datetime.strptime(slot['end_time'], '%H:%M:%S')
-            out.append(
-                {
-                    'start_time': slot['start_time'],
-                    'end_time': slot['end_time'],
-                    'label': _format_label(start_dt, end_dt),
-                }
-            )
-        return out
-
-    from_tz = ZoneInfo(TIMEZONE_CODE_TO_NAME[from_code])
-    to_tz = ZoneInfo(TIMEZONE_CODE_TO_NAME[to_code])
-    converted = []
-    for slot in slots:
-        s_time = datetime.strptime(slot['start_time'], '%H:%M:%S').time()
-        e_time = datetime.strptime(slot['end_time'], '%H:%M:%S').time()
-        s_dt_from = datetime.combine(date_obj, s_time).replace(tzinfo=from_tz)
-        e_dt_from = datetime.combine(date_obj, e_time).replace(tzinfo=from_tz)
-        s_dt_to = s_dt_from.astimezone(to_tz)
-        e_dt_to = e_dt_from.astimezone(to_tz)
-        converted.append(
-            {
-                'start_time': s_dt_to.strftime('%H:%M:%S'),
-                'end_time': e_dt_to.strftime('%H:%M:%S'),
-                'label': _format_label(s_dt_to, e_dt_to),
-            }
-        )
-    return converted
-
-
-def _convert_slot_to_base(date_obj, start_time, end_time, from_code, to_code):
-    from_tz = ZoneInfo(TIMEZONE_CODE_TO_NAME[from_code])
-    to_tz = ZoneInfo(TIMEZONE_CODE_TO_NAME[to_code])
-    s_time = datetime.strptime(start_time, '%H:%M:%S').time()
-    e_time = datetime.strptime(end_time, '%H:%M:%S').time()
-    s_dt_from = datetime.combine(date_obj, s_time).replace(tzinfo=from_tz)
-    e_dt_from = datetime.combine(date_obj, e_time).replace(tzinfo=from_tz)
-    s_dt_to = s_dt_from.astimezone(to_tz)
-    e_dt_to = e_dt_from.astimezone(to_tz)
-    return (
-        s_dt_to.date(),
-        s_dt_to.strftime('%H:%M:%S'),
-        e_dt_to.strftime('%H:%M:%S'),
-    )
+def _resolve_share_link(uuid_value):
+    """Return the share link for ``uuid_value`` with host metadata attached, or ``None``.
+
+    Links are cached briefly by uuid (including misses) and invalidated when the
+    link or the host's settings are saved. Without a shared cache backend that
+    only clears the local process, so other instances may serve the old link for
+    up to ``SHARE_LINK_CACHE_TIMEOUT``; callers still check ``expires_at`` and
+    bookings re-check the link under its row lock.
+    """
+    cache_key = get_share_link_cache_key(uuid_value)
+    try:
+        cached = cache.get(cache_key)
+    except Exception:
+        cached = None
+    if cached is not None:
+        link, host_timezone_code, host_profile_picture = cached
+    else:
+        link = ShareLink.objects.filter(uuid=uuid_value).first()
+        host_timezone_code = 'PT'
+        host_profile_picture = None
+        if link and link.user_id:
+            user_settings = UserSettings.objects.filter(user_id=link.user_id).first()
+            if user_settings:
+                host_timezone_code = _normalize_timezone_code(user_settings.primary_timezone)
+                host_profile_picture = user_settings.profile_picture.url if user_settings.profile_picture else None
+        try:
+            cache.set(cache_key, (link, host_timezone_code, host_profile_picture), timeout=SHARE_LINK_CACHE_TIMEOUT)
+        except Exception:
+            pass
+    if not link or link.user_id is None:
+        return None
+    link.host_timezone_code = host_timezone_code
+    link.host_profile_picture = host_profile_picture
+    return link
 
 
 def _get_share_link_or_none(uuid_value):
-    link = ShareLink.objects.filter(uuid=uuid_value, is_active=True).first()
-    if not link or link.user_id is None:
+    link = _resolve_share_link(uuid_value)
+    if not link or not link.is_active:
         return None
     if link.expires_at <= timezone.now():
         link.is_active = False
-        link.save(update_fields=['is_active'])
+        link.save(update_fields=['is_active', 'updated_at'])
         return None
     return link
 
@@ -146,35 +108,67 @@ def _get_share_link_or_none(uuid_value):
 def _get_share_link_for_existing_booking(uuid_value, booking_uuid):
     if not booking_uuid:
         return None
-    link = ShareLink.objects.filter(uuid=uuid_value).first()
-    if not link or link.user_id is None:
+    link = _resolve_share_link(uuid_value)
+    if not link:
         return None
     if not PublicBooking.objects.filter(share_link=link, uuid=booking_uuid).exists():
         return None
     return link
 
 
-def _filter_booked_slots(link, date_obj, slots):
-    bookings = (
-        PublicBooking.objects
-        .filter(share_link=link, date=date_obj, status=PublicBooking.STATUS_ACTIVE)
-        .values_list('start_time', 'end_time')
-    )
+def _link_timezone_code(link):
+    return getattr(link, 'host_timezone_code', None) or _base_timezone_code(link.user)
+
+
+def _booked_minutes_by_date(link, dates, base_timezone_code, excluded_booking=None):
+    """Return ``(blocked, counts)`` for active bookings of ``link`` around ``dates``.
+
+    ``blocked`` maps each date to buffered ``(start_minute, end_minute)`` ranges
+    relative to that day's midnight in the host timezone; ``counts`` maps each
+    date to the number of bookings stored on it.
+    """
+    dates = sorted(set(dates))
+    blocked = {date_obj: [] for date_obj in dates}
+    counts = Counter()
+    if not dates:
+        return blocked, counts
+
+    base_tz = ZoneInfo(TIMEZONE_CODE_TO_NAME[base_timezone_code])
     buffer_minutes = max(0, int(link.buffer_minutes or 0))
-    available = []
-    for slot in slots:
-        slot_start = datetime.strptime(slot['start_time'], '%H:%M:%S')
-        slot_end = datetime.strptime(slot['end_time'], '%H:%M:%S')
-        is_blocked = False
-        for booking_start_raw, booking_end_raw in bookings:
-            booking_start = datetime.strptime(booking_start_raw, '%H:%M:%S') - timedelta(minutes=buffer_minutes)
-            booking_end = datetime.strptime(booking_end_raw, '%H:%M:%S') + timedelta(minutes=buffer_minutes)
-            if slot_start < booking_end and slot_end > booking_start:
-                is_blocked = True
-                break
-        if not is_blocked:
-            available.append(slot)
-    return available
+    buffer = timedelta(minutes=buffer_minutes)
+    window_start = datetime.combine(dates[0], time.min, tzinfo=base_tz)
+    window_end = datetime.combine(dates[-1] + timedelta(days=1), time.min, tzinfo=base_tz)
+    bookings = PublicBooking.objects.filter(
+        share_link=link,
+        status=PublicBooking.STATUS_ACTIVE,
+        start_at__lt=window_end + buffer,
+        end_at__gt=window_start - buffer,
+    )
+    if excluded_booking is not None:
+        bookings = bookings.exclude(pk=excluded_booking.pk)
+
+    one_minute = timedelta(minutes=1)
+    for booking_date, start_at, end_at in bookings.values_list('date', 'start_at', 'end_at'):
+        counts[booking_date] += 1
+        local_start = start_at.astimezone(base_tz)
+        local_end = end_at.astimezone(base_tz)
+        day = local_start.date() - timedelta(days=1)
+        while day <= local_end.date() + timedelta(days=1):
+            if day in blocked:
+                day_start = datetime.combine(day, time.min, tzinfo=base_tz)
+                blocked[day].append(
+                    (
+                        (local_start - day_start) // one_minute - buffer_minutes,
+                        (local_end - day_start) // one_minute + buffer_minutes,
+                    )
+                )
+            day += timedelta(days=1)
+    return blocked, counts
+
+
+def _base_slot_grid(link, date_obj, availability_text, blocked):
+    grid = SlotGrid.from_availability_text(date_obj, availability_text)
+    return grid.split(int(link.booking_block_minutes or 30)).without(blocked)
 
 
 def _has_reached_daily_limit(link, date_obj):
@@ -189,28 +183,6 @@ def _has_reached_daily_limit(link, date_obj):
     )
 
 
-def _split_slots_by_block_minutes(slots, block_minutes):
-    if block_minutes <= 0:
-        return slots
-
-    out = []
-    for slot in slots:
-        start_dt = datetime.strptime(slot['start_time'], '%H:%M:%S')
-        end_dt = datetime.strptime(slot['end_time'], '%H:%M:%S')
-        cursor = start_dt
-        while cursor + timedelta(minutes=block_minutes) <= end_dt:
-            next_dt = cursor + timedelta(minutes=block_minutes)
-            out.append(
-                {
-                    'start_time': cursor.strftime('%H:%M:%S'),
-                    'end_time': next_dt.strftime('%H:%M:%S'),
-                    'label': _format_label(cursor, next_dt),
-                }
-            )
-            cursor = next_dt
-    return out
-
-
 def _normalize_intake_questions(value):
     if not isinstance(value, list):
         return []
@@ -286,7 +258,7 @@ def _ics_escape(value):
 
 
 def _generate_booking_ics(booking):
-    timezone_code = booking.event.timezone if booking.event_id else _base_timezone_code(booking.share_link.user)
+    timezone_code = booking.event.timezone if booking.event_id else _link_timezone_code(booking.share_link)
     tz_name = TIMEZONE_CODE_TO_NAME.get(_normalize_timezone_code(timezone_code), TIMEZONE_CODE_TO_NAME['PT'])
     start_dt = datetime.combine(booking.date, datetime.strptime(booking.start_time, '%H:%M:%S').time())
     end_dt = datetime.combine(booking.date, datetime.strptime(booking.end_time, '%H:%M:%S').time())
@@ -316,7 +288,7 @@ def _generate_booking_ics(booking):
     return '\r\n'.join(lines)
 
 
-def _send_host_booking_email(request, booking, action):
+def _enqueue_host_booking_email(request, booking, action):
     host_email = booking.share_link.host_email
     if not host_email:
         return
@@ -352,70 +324,181 @@ def _send_host_booking_email(request, booking, action):
         )
     body_lines.extend(['', f'ICS: {_booking_api_url(request, booking, "ics")}'])
 
-    email = EmailMessage(
+    # Rendered now, committed with the booking, and delivered by
+    # ``dispatch_booking_emails`` so the request never waits on the mail server.
+    BookingEmailOutbox.objects.create(
+        booking=booking,
+        action=action,
+        recipient=host_email,
         subject=f'CareerHub: {action_label}',
         body='\n'.join(body_lines),
-        from_email=getattr(django_settings, 'DEFAULT_FROM_EMAIL', None),
-        to=[host_email],
+        attachment_name=f'careerhub-booking-{booking.uuid}.ics',
+        attachment_content=_generate_booking_ics(booking),
+        attachment_mimetype='text/calendar',
     )
-    email.attach(f'careerhub-booking-{booking.uuid}.ics', _generate_booking_ics(booking), 'text/calendar')
-    email.send(fail_silently=True)
 
 
 def _serialize_booking(request, booking):
     return PublicBookingSerializer(booking, context={'request': request}).data
 
 
+def _requested_slot_in_base(booking_date, start_minute, end_minute, timezone_code, base_timezone_code):
+    base_slot = SlotGrid(booking_date, [start_minute], [end_minute]).shifted(
+        TIMEZONE_CODE_TO_NAME[timezone_code],
+        TIMEZONE_CODE_TO_NAME[base_timezone_code],
+    )
+    day_offset, base_start = divmod(base_slot.starts[0], MINUTES_PER_DAY)
+    return (
+        booking_date + timedelta(days=day_offset),
+        base_start,
+        base_slot.ends[0] - day_offset * MINUTES_PER_DAY,
+    )
+
+
+class SlotUnavailableError(Exception):
+    pass
+
+
+def _regenerate_slot_inventory(link, dates, base_timezone_code, version):
+    availability_map = calculate_availability_for_dates(dates, base_timezone_code, user=link.user)
+    block_minutes = int(link.booking_block_minutes or 30)
+    with transaction.atomic():
+        # Serialize with slot claims so bookings read below are final for these days.
+        ShareLink.objects.select_for_update().filter(pk=link.pk).first()
+        blocked, _counts = _booked_minutes_by_date(link, dates, base_timezone_code)
+        BookingInventoryDay.objects.filter(share_link=link, date__in=dates).delete()
+        days = BookingInventoryDay.objects.bulk_create(
+            [
+                BookingInventoryDay(share_link=link, date=date_obj, timezone=base_timezone_code, version=version)
+                for date_obj in dates
+            ]
+        )
+        slots = []
+        for day in days:
+            availability_item = availability_map.get(day.date.strftime('%Y-%m-%d'))
+            grid = SlotGrid.from_availability_text(
+                day.date,
+                availability_item['availability'] if availability_item else None,
+            ).split(block_minutes)
+            open_slots = set(grid.without(blocked[day.date]))
+            slots.extend(
+                BookingSlot(day=day, start_minute=start, end_minute=end, is_available=(start, end) in open_slots)
+                for start, end in grid
+            )
+        BookingSlot.objects.bulk_create(slots, batch_size=500)
+
+
+def _bookable_dates(link, dates, base_timezone_code):
+    """Return the ``dates`` that fall between today and the link's expiry in host time."""
+    base_tz = ZoneInfo(TIMEZONE_CODE_TO_NAME[base_timezone_code])
+    first = timezone.now().astimezone(base_tz).date()
+    last = link.expires_at.astimezone(base_tz).date()
+    return [date_obj for date_obj in dates if first <= date_obj <= last]
+
+
+def _stored_open_slots(link, dates):
+    open_ranges = {date_obj: [] for date_obj in dates}
+    open_slots = (
+        BookingSlot.objects
+        .filter(day__share_link=link, day__date__in=dates, is_available=True)
+        .order_by('day__date', 'start_minute')
+        .values_list('day__date', 'start_minute', 'end_minute')
+    )
+    for date_obj, start, end in open_slots:
+        open_ranges[date_obj].append((start, end))
+    return {date_obj: SlotGrid.from_ranges(date_obj, ranges) for date_obj, ranges in open_ranges.items()}
+
+
+def _fresh_inventory_dates(link, dates, base_timezone_code, version):
+    return set(
+        BookingInventoryDay.objects
+        .filter(share_link=link, date__in=dates, version=version, timezone=base_timezone_code)
+        .values_list('date', flat=True)
+    )
+
+
+def _slot_inventory(link, dates, base_timezone_code, version=None):
+    """Return ``{date: SlotGrid}`` of open slots, regenerating days older than the host's availability version."""
+    if version is None:
+        version = get_availability_version(link.user_id)
+    fresh = _fresh_inventory_dates(link, dates, base_timezone_code, version)
+    stale = [date_obj for date_obj in dates if date_obj not in fresh]
+    if stale:
+        _regenerate_slot_inventory(link, stale, base_timezone_code, version)
+    return _stored_open_slots(link, dates)
+
+
+def _open_slots_for_display(link, dates, base_timezone_code, version, blocked):
+    """Like ``_slot_inventory`` but computes missing days in memory instead of storing them."""
+    fresh = _fresh_inventory_dates(link, dates, base_timezone_code, version)
+    grids = _stored_open_slots(link, [date_obj for date_obj in dates if date_obj in fresh])
+    stale = [date_obj for date_obj in dates if date_obj not in fresh]
+    if stale:
+        availability_map = calculate_availability_for_dates(stale, base_timezone_code, user=link.user)
+        for date_obj in stale:
+            availability_item = availability_map.get(date_obj.strftime('%Y-%m-%d'))
+            grids[date_obj] = _base_slot_grid(
+                link,
+                date_obj,
+                availability_item['availability'] if availability_item else None,
+                blocked[date_obj],
+            )
+    return grids
+
+
+def _claim_inventory_slot(link, date_obj, start_minute, end_minute, booking):
+    # One conditional UPDATE takes the slot and any open neighbours inside the
+    # buffer; if the slot itself was not open the caller's transaction rolls back.
+    buffer_minutes = max(0, int(link.buffer_minutes or 0))
+    day_slots = BookingSlot.objects.filter(day__share_link=link, day__date=date_obj)
+    day_slots.filter(
+        is_available=True,
+        start_minute__lt=end_minute + buffer_minutes,
+        end_minute__gt=start_minute - buffer_minutes,
+    ).update(is_available=False, booking=booking)
+    if not day_slots.filter(start_minute=start_minute, end_minute=end_minute, booking=booking).exists():
+        raise SlotUnavailableError('Selected slot is no longer available. Please refresh and pick another.')
+
+
+def _drop_other_link_inventory(link, date_obj):
+    # The booking's event takes host time that the host's other links built their slots from.
+    transaction.on_commit(
+        lambda: BookingInventoryDay.objects
+        .filter(share_link__user_id=link.user_id, date=date_obj)
+        .exclude(share_link=link)
+        .delete()
+    )
+
+
 def _validate_requested_slot(link, booking_date, start_time, end_time, timezone_code, exclude_booking=None):
-    base_timezone_code = _base_timezone_code(link.user)
+    base_timezone_code = _link_timezone_code(link)
     if _has_reached_daily_limit(link, booking_date):
         if not exclude_booking or exclude_booking.date != booking_date:
             return None, 'This day has reached the booking limit. Please choose another day.'
 
+    requested_start = parse_clock_minutes(start_time)
+    requested_end = parse_clock_minutes(end_time)
+    if requested_start is None or requested_end is None:
+        return None, 'Selected slot is no longer available. Please refresh and pick another.'
+
     availability_map = calculate_availability_for_dates([booking_date], base_timezone_code, user=link.user)
     availability_item = availability_map.get(booking_date.strftime('%Y-%m-%d'))
-    base_slots = _split_slots_by_block_minutes(
-        _parse_slot_ranges(availability_item['availability'] if availability_item else None),
-        int(link.booking_block_minutes or 30),
-    )
-    if exclude_booking:
-        base_slots = _filter_booked_slots_excluding(link, booking_date, base_slots, exclude_booking)
-    else:
-        base_slots = _filter_booked_slots(link, booking_date, base_slots)
-    slots = _convert_slots_between_timezones(
+    blocked, _counts = _booked_minutes_by_date(link, [booking_date], base_timezone_code, excluded_booking=exclude_booking)
+    base_grid = _base_slot_grid(
+        link,
         booking_date,
-        base_slots,
-        base_timezone_code,
-        timezone_code,
+        availability_item['availability'] if availability_item else None,
+        blocked[booking_date],
     )
-    matched_slot = any(slot['start_time'] == start_time and slot['end_time'] == end_time for slot in slots)
-    if not matched_slot:
+    base_tz_name = TIMEZONE_CODE_TO_NAME[base_timezone_code]
+    guest_tz_name = TIMEZONE_CODE_TO_NAME[timezone_code]
+    if not base_grid.shifted(base_tz_name, guest_tz_name).contains(requested_start, requested_end):
         return None, 'Selected slot is no longer available. Please refresh and pick another.'
-    return _convert_slot_to_base(booking_date, start_time, end_time, timezone_code, base_timezone_code), None
 
-
-def _filter_booked_slots_excluding(link, date_obj, slots, excluded_booking):
-    bookings = (
-        PublicBooking.objects
-        .filter(share_link=link, date=date_obj, status=PublicBooking.STATUS_ACTIVE)
-        .exclude(pk=excluded_booking.pk)
-        .values_list('start_time', 'end_time')
+    base_date, base_start, base_end = _requested_slot_in_base(
+        booking_date, requested_start, requested_end, timezone_code, base_timezone_code
     )
-    buffer_minutes = max(0, int(link.buffer_minutes or 0))
-    available = []
-    for slot in slots:
-        slot_start = datetime.strptime(slot['start_time'], '%H:%M:%S')
-        slot_end = datetime.strptime(slot['end_time'], '%H:%M:%S')
-        is_blocked = False
-        for booking_start_raw, booking_end_raw in bookings:
-            booking_start = datetime.strptime(booking_start_raw, '%H:%M:%S') - timedelta(minutes=buffer_minutes)
-            booking_end = datetime.strptime(booking_end_raw, '%H:%M:%S') + timedelta(minutes=buffer_minutes)
-            if slot_start < booking_end and slot_end > booking_start:
-                is_blocked = True
-                break
-        if not is_blocked:
-            available.append(slot)
-    return available
+    return (base_date, format_clock(base_start), format_clock(base_end)), None
 
 
 class ShareLinkViewSet(viewsets.ModelViewSet):
@@ -431,7 +514,7 @@ class ShareLinkViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def current(self, request):
         now = timezone.now()
-        self.get_queryset().filter(is_active=True, expires_at__lte=now).update(is_active=False)
+        self.get_queryset().filter(is_active=True, expires_at__lte=now).update(is_active=False, updated_at=now)
         link = self.get_queryset().filter(is_active=True, expires_at__gt=now).first()
         if not link:
             return Response({'active': None})
@@ -490,19 +573,28 @@ class ShareLinkViewSet(viewsets.ModelViewSet):
             expires_at=timezone.now() + timedelta(days=duration_days),
             is_active=True,
         )
+        base_timezone_code = _base_timezone_code(request.user)
+        today = timezone.now().date()
+        _slot_inventory(
+            link,
+            _bookable_dates(link, [today + timedelta(days=offset) for offset in range(duration_days)], base_timezone_code),
+            base_timezone_code,
+        )
         return Response(self.get_serializer(link).data, status=status.HTTP_201_CREATED)
 
     @action(detail=False, methods=['post'])
     def deactivate(self, request):
         now = timezone.now()
-        count = self.get_queryset().filter(is_active=True, expires_at__gt=now).update(is_active=False)
+        links = self.get_queryset().filter(is_active=True, expires_at__gt=now)
+        cache.delete_many([get_share_link_cache_key(uuid_value) for uuid_value in links.values_list('uuid', flat=True)])
+        count = links.update(is_active=False, updated_at=now)
         return Response({'message': f'Deactivated {count} active link(s).'})
 
     @action(detail=True, methods=['post'])
     def deactivate_link(self, request, pk=None):
         link = self.get_object()
         link.is_active = False
-        link.save(update_fields=['is_active'])
+        link.save(update_fields=['is_active', 'updated_at'])
         return Response(self.get_serializer(link).data)
 
     @action(detail=False, methods=['get'])
@@ -522,6 +614,33 @@ class ShareLinkViewSet(viewsets.ModelViewSet):
         return Response(PublicBookingSerializer(bookings, many=True, context={'request': request}).data)
 
 
+def _slots_etag(link, start_date, days, timezone_code, versions):
+    fingerprint = ':'.join(
+        [
+            str(link.pk),
+            *versions,
+            start_date.isoformat(),
+            str(days),
+            timezone_code,
+        ]
+    )
+    return f'"{hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def _etag_matches(request, etag):
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    candidates = [item.strip() for item in header.split(',')]
+    return '*' in candidates or any(item.removeprefix('W/') == etag for item in candidates)
+
+
+def _with_slots_cache_headers(response, etag):
+    response['ETag'] = etag
+    response['Cache-Control'] = f'public, max-age=0, s-maxage={PUBLIC_SLOTS_SHARED_MAX_AGE}'
+    return response
+
+
 class PublicBookingSlotsView(APIView):
     permission_classes = [AllowAny]
     authentication_classes = []
@@ -529,13 +648,14 @@ class PublicBookingSlotsView(APIView):
 
     def get(self, request, uuid):
         link = _get_share_link_or_none(uuid)
+        rescheduling = False
         if not link:
             link = _get_share_link_for_existing_booking(uuid, request.query_params.get('booking_uuid'))
+            rescheduling = True
         if not link:
             return Response({'error': 'This booking link is invalid or expired.'}, status=404)
 
         timezone_code = _normalize_timezone_code(request.query_params.get('timezone', 'PT'))
-        base_timezone_code = _base_timezone_code(link.user)
         date_str = request.query_params.get('date')
         days_raw = request.query_params.get('days', 14)
         try:
@@ -550,25 +670,28 @@ class PublicBookingSlotsView(APIView):
             except ValueError:
                 return Response({'error': 'Invalid date format. Use YYYY-MM-DD.'}, status=400)
 
+        versions = get_availability_versions(link.user_id)
+        etag = _slots_etag(link, start_date, days, timezone_code, versions)
+        if _etag_matches(request, etag):
+            return _with_slots_cache_headers(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+
+        base_timezone_code = _link_timezone_code(link)
         dates = [start_date + timedelta(days=i) for i in range(days)]
-        availability_map = calculate_availability_for_dates(dates, base_timezone_code, user=link.user)
+        # Guests rescheduling an existing booking may still move it after the link expires.
+        shown_dates = dates if rescheduling else _bookable_dates(link, dates, base_timezone_code)
+        blocked, bookings_per_day = _booked_minutes_by_date(link, dates, base_timezone_code)
+        inventory = _open_slots_for_display(link, shown_dates, base_timezone_code, versions[0], blocked)
+        max_per_day = int(link.max_bookings_per_day or 0)
+        base_tz_name = TIMEZONE_CODE_TO_NAME[base_timezone_code]
+        guest_tz_name = TIMEZONE_CODE_TO_NAME[timezone_code]
 
         rows = []
         for date_obj in dates:
             date_key = date_obj.strftime('%Y-%m-%d')
-            availability_item = availability_map.get(date_key)
-            raw_text = availability_item['availability'] if availability_item else None
-            if _has_reached_daily_limit(link, date_obj):
-                base_slots = []
+            if date_obj not in inventory or (max_per_day > 0 and bookings_per_day[date_obj] >= max_per_day):
+                slots = []
             else:
-                base_slots = _split_slots_by_block_minutes(_parse_slot_ranges(raw_text), int(link.booking_block_minutes or 30))
-                base_slots = _filter_booked_slots(link, date_obj, base_slots)
-            slots = _convert_slots_between_timezones(
-                date_obj,
-                base_slots,
-                base_timezone_code,
-                timezone_code,
-            )
+                slots = inventory[date_obj].shifted(base_tz_name, guest_tz_name).as_response()
             rows.append(
                 {
                     'date': date_key,
@@ -578,10 +701,9 @@ class PublicBookingSlotsView(APIView):
                 }
             )
 
-        user_settings = UserSettings.objects.filter(user=link.user).first()
-        host_profile_picture = request.build_absolute_uri(user_settings.profile_picture.url) if user_settings and user_settings.profile_picture else None
+        host_profile_picture = request.build_absolute_uri(link.host_profile_picture) if link.host_profile_picture else None
 
-        return Response(
+        response = Response(
             {
                 'title': link.title,
                 'host_display_name': link.host_display_name,
@@ -598,6 +720,7 @@ class PublicBookingSlotsView(APIView):
                 'days': rows,
             }
         )
+        return _with_slots_cache_headers(response, etag)
 
 
 class PublicBookingCreateView(APIView):
@@ -632,38 +755,67 @@ class PublicBookingCreateView(APIView):
         except ValueError:
             return Response({'error': 'Invalid date format. Use YYYY-MM-DD.'}, status=400)
 
-        normalized_slot, slot_error = _validate_requested_slot(link, booking_date, start_time, end_time, timezone_code)
-        if slot_error:
-            return Response({'error': slot_error}, status=409)
-        normalized_date, normalized_start_time, normalized_end_time = normalized_slot
-        base_timezone_code = _base_timezone_code(link.user)
-
-        event = Event.objects.create(
-            user=link.user,
-            name=f'Booking - {name}',
-            date=normalized_date,
-            start_time=normalized_start_time,
-            end_time=normalized_end_time,
-            timezone=base_timezone_code,
-            location_type='virtual',
-            notes='',
-            is_locked=True,
-        )
-        booking = PublicBooking.objects.create(
-            share_link=link,
-            event=event,
-            name=name,
-            email=email,
-            date=normalized_date,
-            start_time=normalized_start_time,
-            end_time=normalized_end_time,
-            timezone=timezone_code,
-            notes=notes,
-            intake_answers=intake_answers or {},
+        requested_start = parse_clock_minutes(start_time)
+        requested_end = parse_clock_minutes(end_time)
+        if requested_start is None or requested_end is None:
+            return Response({'error': 'Selected slot is no longer available. Please refresh and pick another.'}, status=409)
+
+        base_timezone_code = _link_timezone_code(link)
+        normalized_date, base_start, base_end = _requested_slot_in_base(
+            booking_date, requested_start, requested_end, timezone_code, base_timezone_code
         )
-        event.notes = _format_public_booking_notes(booking)
-        event.save(update_fields=['notes', 'updated_at'])
-        _send_host_booking_email(request, booking, 'created')
+        normalized_start_time = format_clock(base_start)
+        normalized_end_time = format_clock(base_end)
+
+        try:
+            with transaction.atomic():
+                # Read fresh, since the resolved link may come from another instance's stale cache.
+                if not ShareLink.objects.select_for_update().filter(pk=link.pk, is_active=True).first():
+                    raise SlotUnavailableError('This booking link is invalid or expired.')
+                if not _bookable_dates(link, [normalized_date], base_timezone_code):
+                    raise SlotUnavailableError('Selected slot is no longer available. Please refresh and pick another.')
+                if _has_reached_daily_limit(link, normalized_date):
+                    raise SlotUnavailableError('This day has reached the booking limit. Please choose another day.')
+                _slot_inventory(link, [normalized_date], base_timezone_code)
+
+                # Flagged so their signals rotate the bookings version rather than
+                # the availability version, which would regenerate the inventory.
+                event = Event(
+                    user_id=link.user_id,
+                    name=f'Booking - {name}',
+                    date=normalized_date,
+                    start_time=normalized_start_time,
+                    end_time=normalized_end_time,
+                    timezone=base_timezone_code,
+                    location_type='virtual',
+                    notes='',
+                    is_locked=True,
+                )
+                event._from_public_booking = True
+                event.save()
+                booking = PublicBooking(
+                    share_link=link,
+                    event=event,
+                    name=name,
+                    email=email,
+                    date=normalized_date,
+                    start_time=normalized_start_time,
+                    end_time=normalized_end_time,
+                    timezone=timezone_code,
+                    notes=notes,
+                    intake_answers=intake_answers or {},
+                )
+                booking._from_public_booking = True
+                booking.save()
+                _claim_inventory_slot(link, normalized_date, base_start, base_end, booking)
+                _drop_other_link_inventory(link, normalized_date)
+                event.notes = _format_public_booking_notes(booking)
+                event.save(update_fields=['notes', 'updated_at'])
+                _enqueue_host_booking_email(request, booking, 'created')
+        except SlotUnavailableError as exc:
+            return Response({'error': str(exc)}, status=409)
+        except IntegrityError:
+            return Response({'error': 'Selected slot is no longer available. Please refresh and pick another.'}, status=409)
 
         return Response(
             {
@@ -702,15 +854,13 @@ class PublicBookingManageView(APIView):
     throttle_classes = [PublicBookingCreateThrottle]
 
     def _get_booking(self, uuid, booking_uuid):
-        link = ShareLink.objects.filter(uuid=uuid, user__isnull=False).first()
+        link = _resolve_share_link(uuid)
         if not link:
             return None
-        return (
-            PublicBooking.objects
-            .filter(share_link=link, uuid=booking_uuid)
-            .select_related('share_link', 'event')
-            .first()
-        )
+        booking = PublicBooking.objects.filter(share_link=link, uuid=booking_uuid).select_related('event').first()
+        if booking:
+            booking.share_link = link
+        return booking
 
     def get(self, request, uuid, booking_uuid, action):
         booking = self._get_booking(uuid, booking_uuid)
@@ -739,13 +889,14 @@ class PublicBookingManageView(APIView):
             return Response({'error': 'This booking has already been canceled.'}, status=409)
 
         if action == 'cancel':
-            booking.status = PublicBooking.STATUS_CANCELED
-            booking.save(update_fields=['status'])
-            if booking.event_id:
-                booking.event.delete()
-                booking.event = None
-                booking.save(update_fields=['event'])
-            _send_host_booking_email(request, booking, 'canceled')
+            with transaction.atomic():
+                booking.status = PublicBooking.STATUS_CANCELED
+                booking.save(update_fields=['status', 'updated_at'])
+                if booking.event_id:
+                    booking.event.delete()
+                    booking.event = None
+                    booking.save(update_fields=['event', 'updated_at'])
+                _enqueue_host_booking_email(request, booking, 'canceled')
             return Response({'message': 'Booking canceled.', 'booking': _serialize_booking(request, booking)})
 
         if action != 'reschedule':
@@ -774,35 +925,35 @@ class PublicBookingManageView(APIView):
             return Response({'error': slot_error}, status=409)
 
         normalized_date, normalized_start_time, normalized_end_time = normalized_slot
-        base_timezone_code = _base_timezone_code(booking.share_link.user)
-        booking.date = normalized_date
-        booking.start_time = normalized_start_time
-        booking.end_time = normalized_end_time
-        booking.timezone = timezone_code
-        booking.save(update_fields=['date', 'start_time', 'end_time', 'timezone'])
-
-        if booking.event_id:
-            event = booking.event
-            event.date = normalized_date
-            event.start_time = normalized_start_time
-            event.end_time = normalized_end_time
-            event.timezone = base_timezone_code
-            event.notes = _format_public_booking_notes(booking)
-            event.save(update_fields=['date', 'start_time', 'end_time', 'timezone', 'notes', 'updated_at'])
-        else:
-            event = Event.objects.create(
-                user=booking.share_link.user,
-                name=f'Booking - {booking.name}',
-                date=normalized_date,
-                start_time=normalized_start_time,
-                end_time=normalized_end_time,
-                timezone=base_timezone_code,
-                location_type='virtual',
-                notes=_format_public_booking_notes(booking),
-                is_locked=True,
-            )
-            booking.event = event
-            booking.save(update_fields=['event'])
+        base_timezone_code = _link_timezone_code(booking.share_link)
+        with transaction.atomic():
+            booking.date = normalized_date
+            booking.start_time = normalized_start_time
+            booking.end_time = normalized_end_time
+            booking.timezone = timezone_code
+            booking.save(update_fields=['date', 'start_time', 'end_time', 'timezone', 'updated_at'])
 
-        _send_host_booking_email(request, booking, 'rescheduled')
+            if booking.event_id:
+                event = booking.event
+                event.date = normalized_date
+                event.start_time = normalized_start_time
+                event.end_time = normalized_end_time
+                event.timezone = base_timezone_code
+                event.notes = _format_public_booking_notes(booking)
+                event.save(update_fields=['date', 'start_time', 'end_time', 'timezone', 'notes', 'updated_at'])
+            else:
+                event = Event.objects.create(
+                    user_id=booking.share_link.user_id,
+                    name=f'Booking - {booking.name}',
+                    date=normalized_date,
+                    start_time=normalized_start_time,
+                    end_time=normalized_end_time,
+                    timezone=base_timezone_code,
+                    location_type='virtual',
+                    notes=_format_public_booking_notes(booking),
+                    is_locked=True,
+                )
+                booking.event = event
+                booking.save(update_fields=['event', 'updated_at'])
+            _enqueue_host_booking_email(request, booking, 'rescheduled')
         return Response({'message': 'Booking rescheduled.', 'booking': _serialize_booking(request, booking)})
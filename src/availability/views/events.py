@@ -6,10 +6,15 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 from ..conflict_detector import check_for_conflicts
-from ..models import Event
-from ..recurrence import delete_recurring_series, generate_recurring_instances, update_recurring_series
+from ..models import Event, ExportJob
+from ..recurrence import (
+    delete_recurring_series,
+    recurring_instances_for_range,
+    update_recurring_series,
+)
 from ..serializers import EventSerializer
 from ..utils import export_data
+from .exports import queued_export_response, wants_async_export
 
 
 class EventViewSet(viewsets.ModelViewSet):
@@ -89,10 +94,7 @@ class EventViewSet(viewsets.ModelViewSet):
         end_date = datetime.strptime(end_str, '%Y-%m-%d').date()
 
         recurring_events = self.get_queryset().filter(is_recurring=True, parent_event__isnull=True)
-        all_instances = []
-        for event in recurring_events:
-            all_instances.extend(generate_recurring_instances(event, start_date, end_date))
-        return Response(all_instances)
+        return Response(recurring_instances_for_range(recurring_events, start_date, end_date))
 
     @action(detail=True, methods=['post'])
     def set_recurrence(self, request, pk=None):
@@ -140,6 +142,7 @@ class EventViewSet(viewsets.ModelViewSet):
             event.recurrence_rule['excluded_dates'] = []
         if date_str not in event.recurrence_rule['excluded_dates']:
             event.recurrence_rule['excluded_dates'].append(date_str)
+            # The post_save signals rebuild the occurrences and conflict alerts.
             event.save()
 
         return Response({'message': f'Deleted instance on {date_str}'})
@@ -172,6 +175,8 @@ class EventViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def export(self, request):
         fmt = request.query_params.get('fmt', 'csv')
+        if wants_async_export(request):
+            return queued_export_response(request, ExportJob.SCOPE_EVENTS, fmt)
         return export_data(self.get_queryset(), self.get_serializer_class(), fmt, 'events')
 
     @action(detail=False, methods=['delete'])
@@ -0,0 +1,60 @@
+from django.http import FileResponse
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from career.services.document_storage import open_document_file
+
+from ..export_jobs import EXPORT_JOB_FORMATS, normalize_export_format, request_export_job
+from ..models import ExportJob
+from ..serializers import ExportJobSerializer
+
+EXPORT_JOBS_LIST_LIMIT = 50
+
+
+def wants_async_export(request):
+    return request.query_params.get('async', '').lower() in {'1', 'true', 'yes'}
+
+
+def queued_export_response(request, scope, export_format):
+    """Queue (or reuse) an export job and answer with its status instead of the file."""
+    normalized = normalize_export_format(scope, export_format)
+    if normalized is None:
+        supported = ', '.join(EXPORT_JOB_FORMATS[scope])
+        return Response({'error': f'Invalid format. Supported: {supported}'}, status=status.HTTP_400_BAD_REQUEST)
+    job, created = request_export_job(request.user, scope, normalized)
+    data = ExportJobSerializer(job, context={'request': request}).data
+    return Response(data, status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK)
+
+
+class ExportJobViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    """Background exports: queue with POST, poll the job, then download the stored artifact."""
+
+    serializer_class = ExportJobSerializer
+
+    def get_queryset(self):
+        return ExportJob.objects.filter(user=self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        jobs = self.get_queryset()[:EXPORT_JOBS_LIST_LIMIT]
+        return Response(self.get_serializer(jobs, many=True).data)
+
+    def create(self, request):
+        scope = request.data.get('scope')
+        if scope not in EXPORT_JOB_FORMATS:
+            supported = ', '.join(EXPORT_JOB_FORMATS)
+            return Response({'error': f'Invalid scope. Supported: {supported}'}, status=status.HTTP_400_BAD_REQUEST)
+        return queued_export_response(request, scope, request.data.get('format'))
+
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        job = self.get_object()
+        if job.status != ExportJob.STATUS_COMPLETED:
+            return Response(
+                {'error': 'This export is not ready yet.', 'status': job.status},
+                status=status.HTTP_409_CONFLICT,
+            )
+        file_obj = open_document_file(job.file)
+        if file_obj is None:
+            return Response({'error': 'The export file is no longer available.'}, status=status.HTTP_410_GONE)
+        return FileResponse(file_obj, as_attachment=True, filename=job.filename, content_type=job.content_type)
@@ -0,0 +1,178 @@
+import hashlib
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+
+from django.db.models import Count, Max
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..models import Event, PublicBooking, UserSettings
+from ..recurrence import occurrence_horizon_end, recurring_instances_for_range
+from ..throttling import CalendarFeedThrottle
+from ..utils import parse_time_str
+from .booking import TIMEZONE_CODE_TO_NAME, _format_public_booking_notes, _ics_escape, _normalize_timezone_code
+
+# Subscribers see this much history; the future runs to the occurrence horizon.
+CALENDAR_FEED_LOOKBACK_DAYS = 180
+CALENDAR_FEED_CHUNK_SIZE = 500
+
+
+def _ics_stamp(value):
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def _ics_local(local, tz_name):
+    return f'TZID={tz_name}:{local.strftime("%Y%m%dT%H%M%S")}'
+
+
+def _vevent(uid, stamp, item, summary, description, extra=()):
+    tz_name = TIMEZONE_CODE_TO_NAME[_normalize_timezone_code(item['timezone'])]
+    start = datetime.combine(item['date'], parse_time_str(item['start_time']) or time.min)
+    end = datetime.combine(item['date'], parse_time_str(item['end_time']) or time.min)
+    # Same rule as get_event_datetime_range: an end at or before the start is on the next day.
+    if end <= start:
+        end += timedelta(days=1)
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:{uid}',
+        f'DTSTAMP:{_ics_stamp(stamp)}',
+        f'DTSTART;{_ics_local(start, tz_name)}',
+        f'DTEND;{_ics_local(end, tz_name)}',
+        f'SUMMARY:{_ics_escape(summary)}',
+    ]
+    if description:
+        lines.append(f'DESCRIPTION:{_ics_escape(description)}')
+    if item.get('location'):
+        lines.append(f'LOCATION:{_ics_escape(item["location"])}')
+    if item.get('meeting_link'):
+        lines.append(f'URL:{item["meeting_link"]}')
+    lines.extend(extra)
+    lines.append('END:VEVENT')
+    return '\r\n'.join(lines) + '\r\n'
+
+
+def _event_item(event):
+    return {
+        'date': event.date,
+        'start_time': event.start_time,
+        'end_time': event.end_time,
+        'timezone': event.timezone,
+        'location': event.location,
+        'meeting_link': event.meeting_link,
+    }
+
+
+def _feed_window():
+    start_date = timezone.now().date() - timedelta(days=CALENDAR_FEED_LOOKBACK_DAYS)
+    return start_date, occurrence_horizon_end()
+
+
+def _feed_validators(user_id, start_date):
+    summary = Event.objects.filter(user_id=user_id).aggregate(last_modified=Max('updated_at'), total=Count('id'))
+    last_modified = summary['last_modified']
+    # The count catches deletions and the window start catches the daily slide.
+    fingerprint = ':'.join([str(user_id), start_date.isoformat(), str(summary['total']), str(last_modified)])
+    etag = f'"{hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:32]}"'
+    return etag, last_modified
+
+
+def generate_calendar_feed(user_id, start_date, end_date):
+    """Yield the user's calendar as ICS text, one VEVENT at a time."""
+    yield '\r\n'.join(
+        [
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            'PRODID:-//CareerHub//Calendar Feed//EN',
+            'CALSCALE:GREGORIAN',
+            'METHOD:PUBLISH',
+            'X-WR-CALNAME:CareerHub',
+        ]
+    ) + '\r\n'
+
+    events = (
+        Event.objects
+        .filter(user_id=user_id, parent_event__isnull=True, is_recurring=False, date__range=[start_date, end_date])
+        .select_related('public_booking__share_link')
+        .order_by('date', 'start_time')
+    )
+    for event in events.iterator(chunk_size=CALENDAR_FEED_CHUNK_SIZE):
+        booking = getattr(event, 'public_booking', None)
+        if booking and booking.status == PublicBooking.STATUS_ACTIVE:
+            # Same UID as the per-booking ICS download so clients merge the two.
+            yield _vevent(
+                f'{booking.uuid}@careerhub',
+                event.updated_at,
+                _event_item(event),
+                event.name,
+                _format_public_booking_notes(booking),
+                extra=[f'ATTENDEE;CN={_ics_escape(booking.name)};ROLE=REQ-PARTICIPANT:MAILTO:{booking.email}'],
+            )
+        else:
+            yield _vevent(f'event-{event.id}@careerhub', event.updated_at, _event_item(event), event.name, event.notes)
+
+    parents = list(
+        Event.objects.filter(
+            user_id=user_id,
+            is_recurring=True,
+            parent_event__isnull=True,
+            date__lte=end_date,
+        ).exclude(recurrence_rule__isnull=True)
+    )
+    stamps = {parent.id: parent.updated_at for parent in parents}
+    for instance in recurring_instances_for_range(parents, start_date, end_date):
+        instance_date = instance['date']
+        if isinstance(instance_date, str):
+            instance_date = datetime.strptime(instance_date, '%Y-%m-%d').date()
+            instance = {**instance, 'date': instance_date}
+        parent_id = instance['parent_event_id']
+        yield _vevent(
+            f'event-{parent_id}-{instance_date.strftime("%Y%m%d")}@careerhub',
+            stamps[parent_id],
+            instance,
+            instance['name'],
+            instance.get('notes'),
+        )
+
+    yield 'END:VCALENDAR\r\n'
+
+
+class CalendarFeedView(APIView):
+    """Public, token-authenticated ICS feed for calendar subscriptions."""
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    throttle_classes = [CalendarFeedThrottle]
+
+    def perform_content_negotiation(self, request, force=False):
+        # Calendar clients ask for text/calendar, which no DRF renderer advertises.
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request, token):
+        user_id = (
+            UserSettings.objects
+            .filter(calendar_feed_token=token, user__isnull=False)
+            .values_list('user_id', flat=True)
+            .first()
+        )
+        if not user_id:
+            return Response({'error': 'This calendar feed is invalid or has been reset.'}, status=404)
+
+        start_date, end_date = _feed_window()
+        etag, last_modified = _feed_validators(user_id, start_date)
+        last_modified_ts = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified_ts)
+        if response is None:
+            response = StreamingHttpResponse(
+                generate_calendar_feed(user_id, start_date, end_date),
+                content_type='text/calendar; charset=utf-8',
+            )
+            response['Content-Disposition'] = 'inline; filename="careerhub.ics"'
+        response['ETag'] = etag
+        if last_modified_ts is not None:
+            response['Last-Modified'] = http_date(last_modified_ts)
+        response['Cache-Control'] = 'private, max-age=0, must-revalidate'
+        return response
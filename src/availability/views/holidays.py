@@ -4,9 +4,10 @@ from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from ..models import CustomHoliday, UserSettings
+from ..models import CustomHoliday, ExportJob, UserSettings
 from ..serializers import CustomHolidaySerializer
 from ..utils import export_data, get_federal_holidays
+from .exports import queued_export_response, wants_async_export
 
 
 class HolidayViewSet(viewsets.ModelViewSet):
@@ -67,6 +68,8 @@ class HolidayViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def export(self, request):
         fmt = request.query_params.get('fmt', 'csv')
+        if wants_async_export(request):
+            return queued_export_response(request, ExportJob.SCOPE_HOLIDAYS, fmt)
         return export_data(self.get_queryset(), self.get_serializer_class(), fmt, 'holidays')
 
     @action(detail=False, methods=['delete'])
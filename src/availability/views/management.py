@@ -1,93 +1,44 @@
 import logging
-import io
 import json
+import secrets
+import tempfile
 import zipfile
 from datetime import datetime
 
-import pandas as pd
-from django.core.serializers.json import DjangoJSONEncoder
-from django.db import transaction
-from django.forms.models import model_to_dict
-from django.http import HttpResponse
+from django.http import FileResponse, StreamingHttpResponse
+from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 
-from career.models import (
-    AIArtifact,
-    Application,
-    ApplicationTimelineEntry,
-    Company,
-    Document,
-    Experience,
-    Offer,
-    OfferDecisionSnapshot,
-    Task,
-)
-from career.serializers import (
-    AIArtifactSerializer,
-    ApplicationExportSerializer,
-    DocumentExportSerializer,
-    ExperienceExportSerializer,
-    OfferDecisionSnapshotSerializer,
-    OfferExportSerializer,
-    TaskSerializer,
-)
-
+from ..account_export import ACCOUNT_EXPORT_FILENAME, iter_account_export_json
+from ..account_restore import BackupFormatError, restore_account_backup
 from ..ai_provider import AIProviderConfigurationError, AIProviderRequestError, relay_ai_provider_chat_completion
+from ..export_jobs import iter_export_all_zip, write_export_all_xlsx
+from ..json_stream import iter_json_items
 from ..models import (
-    AvailabilityOverride,
-    AvailabilitySetting,
     ConflictAlert,
     CustomHoliday,
     Event,
     EventCategory,
-    PublicBooking,
-    ShareLink,
+    ExportJob,
     UserSettings,
 )
 from ..serializers import (
     AIProviderChatCompletionRequestSerializer,
-    AvailabilityOverrideSerializer,
-    AvailabilitySettingSerializer,
     ConflictAlertSerializer,
-    CustomHolidaySerializer,
     EventCategorySerializer,
-    EventSerializer,
-    PublicBookingSerializer,
-    ShareLinkSerializer,
     UserSettingsSerializer,
 )
 from ..throttling import AIProviderRelayThrottle
+from ..utils import stream_zip
+from .exports import queued_export_response, wants_async_export
 
 logger = logging.getLogger(__name__)
 
 
-def _json_response(payload, filename):
-    content = json.dumps(payload, indent=2, cls=DjangoJSONEncoder).encode('utf-8')
-    response = HttpResponse(content, content_type='application/json')
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    return response
-
-
-def _zip_json_response(payload, filename):
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        zip_file.writestr('careerhub-account-export.json', json.dumps(payload, indent=2, cls=DjangoJSONEncoder))
-    response = HttpResponse(buffer.getvalue(), content_type='application/zip')
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    return response
-
-
-def _model_payload(instance, exclude=()):
-    data = model_to_dict(instance, exclude=list(exclude))
-    data.pop('user', None)
-    data.pop('id', None)
-    return data
-
-
 class ImportViewSet(viewsets.ViewSet):
     def create(self, request):
         from ..utils import parse_import_file
@@ -174,124 +125,64 @@ class UserSettingsViewSet(viewsets.ModelViewSet):
             return Response(serializer.data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=['get', 'post', 'delete'])
+    def calendar_feed(self, request):
+        settings, _ = UserSettings.objects.get_or_create(user=request.user)
+        if request.method == 'POST':
+            settings.calendar_feed_token = secrets.token_urlsafe(32)
+            settings.save(update_fields=['calendar_feed_token', 'updated_at'])
+        elif request.method == 'DELETE':
+            settings.calendar_feed_token = None
+            settings.save(update_fields=['calendar_feed_token', 'updated_at'])
+
+        if not settings.calendar_feed_token:
+            return Response({'url': None, 'webcal_url': None})
+        url = request.build_absolute_uri(reverse('calendar-feed', args=[settings.calendar_feed_token]))
+        return Response({'url': url, 'webcal_url': 'webcal://' + url.split('://', 1)[-1]})
+
     @action(detail=False, methods=['get'])
     def export_all(self, request):
         fmt = request.query_params.get('fmt', 'json')
-        data_map = {
-            'events': (Event.objects.filter(user=request.user), EventSerializer),
-            'holidays': (CustomHoliday.objects.filter(user=request.user), CustomHolidaySerializer),
-            'applications': (Application.objects.filter(user=request.user), ApplicationExportSerializer),
-            'user_settings': (UserSettings.objects.filter(user=request.user), UserSettingsSerializer),
-            'categories': (EventCategory.objects.filter(user=request.user), EventCategorySerializer),
-        }
+        if wants_async_export(request):
+            return queued_export_response(request, ExportJob.SCOPE_ALL, fmt)
 
         if fmt in {'xlsx', 'excel'}:
-            buffer = io.BytesIO()
-            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                for name, (queryset, serializer_cls) in data_map.items():
-                    data = serializer_cls(queryset, many=True).data
-                    df = pd.DataFrame(data) if data else pd.DataFrame()
-                    df.to_excel(writer, sheet_name=name[:31], index=False)
-            response = HttpResponse(
-                buffer.getvalue(),
+            target = tempfile.TemporaryFile()
+            write_export_all_xlsx(request.user, target)
+            target.seek(0)
+            return FileResponse(
+                target,
+                as_attachment=True,
+                filename=f'availability_manager_export_{datetime.now().strftime("%Y%m%d")}.xlsx',
                 content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             )
-            response['Content-Disposition'] = (
-                f'attachment; filename="availability_manager_export_{datetime.now().strftime("%Y%m%d")}.xlsx"'
-            )
-            return response
-
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for name, (queryset, serializer_cls) in data_map.items():
-                data = serializer_cls(queryset, many=True).data
-                if fmt == 'csv':
-                    df = pd.DataFrame(data) if data else pd.DataFrame()
-                    csv_buffer = io.StringIO()
-                    df.to_csv(csv_buffer, index=False)
-                    zip_file.writestr(f'{name}.csv', csv_buffer.getvalue())
-                else:
-                    zip_file.writestr(f'{name}.json', json.dumps(data, indent=2, default=str))
 
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        response = HttpResponse(buffer.getvalue(), content_type='application/zip')
+        response = StreamingHttpResponse(
+            iter_export_all_zip(request.user, 'csv' if fmt == 'csv' else 'json'),
+            content_type='application/zip',
+        )
         response['Content-Disposition'] = f'attachment; filename="availability_manager_backup_{timestamp}.zip"'
         return response
 
-    def _build_account_export_payload(self, request):
-        user = request.user
-        serializer_context = {'request': request}
-        return {
-            'schema': 'careerhub.account_export.v1',
-            'exported_at': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
-            'account': {
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'full_name': getattr(user, 'full_name', '') or f'{user.first_name} {user.last_name}'.strip(),
-            },
-            'availability': {
-                'user_settings': UserSettingsSerializer(
-                    UserSettings.objects.filter(user=user), many=True, context=serializer_context
-                ).data,
-                'categories': EventCategorySerializer(EventCategory.objects.filter(user=user), many=True).data,
-                'events': EventSerializer(Event.objects.filter(user=user), many=True, context=serializer_context).data,
-                'holidays': CustomHolidaySerializer(CustomHoliday.objects.filter(user=user), many=True).data,
-                'availability_overrides': AvailabilityOverrideSerializer(
-                    AvailabilityOverride.objects.filter(user=user), many=True
-                ).data,
-                'availability_settings': AvailabilitySettingSerializer(
-                    AvailabilitySetting.objects.filter(user=user), many=True
-                ).data,
-                'share_links': ShareLinkSerializer(ShareLink.objects.filter(user=user), many=True).data,
-                'public_bookings': PublicBookingSerializer(
-                    PublicBooking.objects.filter(share_link__user=user), many=True
-                ).data,
-            },
-            'career': {
-                'companies': [_model_payload(company) for company in Company.objects.filter(user=user)],
-                'applications': ApplicationExportSerializer(Application.objects.filter(user=user), many=True).data,
-                'offers': OfferExportSerializer(Offer.objects.filter(application__user=user), many=True).data,
-                'documents': DocumentExportSerializer(
-                    Document.objects.filter(user=user), many=True, context=serializer_context
-                ).data,
-                'tasks': TaskSerializer(Task.objects.filter(user=user), many=True).data,
-                'experiences': ExperienceExportSerializer(Experience.objects.filter(user=user), many=True).data,
-                'application_timeline': [
-                    {
-                        **_model_payload(entry, exclude=('documents',)),
-                        'application_role': entry.application.role_title,
-                        'application_company': entry.application.company.name,
-                        'documents': list(entry.documents.filter(user=user).values_list('title', flat=True)),
-                    }
-                    for entry in ApplicationTimelineEntry.objects.filter(user=user).select_related(
-                        'application', 'application__company'
-                    )
-                ],
-                'ai_artifacts': AIArtifactSerializer(
-                    AIArtifact.objects.filter(user=user), many=True, context=serializer_context
-                ).data,
-                'offer_decision_snapshots': [
-                    {
-                        **OfferDecisionSnapshotSerializer(snapshot, context=serializer_context).data,
-                        'offer_company': snapshot.offer.application.company.name,
-                        'offer_role': snapshot.offer.application.role_title,
-                    }
-                    for snapshot in OfferDecisionSnapshot.objects.filter(user=user).select_related(
-                        'offer', 'offer__application', 'offer__application__company'
-                    )
-                ],
-            },
-        }
-
     @action(detail=False, methods=['get'], url_path='account-export')
     def account_export(self, request):
         fmt = request.query_params.get('fmt', 'json')
+        if wants_async_export(request):
+            return queued_export_response(request, ExportJob.SCOPE_ACCOUNT, fmt)
         timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        payload = self._build_account_export_payload(request)
+        chunks = iter_account_export_json(request.user, {'request': request})
         if fmt == 'zip':
-            return _zip_json_response(payload, f'careerhub_account_export_{timestamp}.zip')
-        return _json_response(payload, f'careerhub_account_export_{timestamp}.json')
+            response = StreamingHttpResponse(
+                stream_zip([(ACCOUNT_EXPORT_FILENAME, chunks)]),
+                content_type='application/zip',
+            )
+            filename = f'careerhub_account_export_{timestamp}.zip'
+        else:
+            response = StreamingHttpResponse(chunks, content_type='application/json')
+            filename = f'careerhub_account_export_{timestamp}.json'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
 
     @action(
         detail=False,
@@ -307,281 +198,26 @@ class UserSettingsViewSet(viewsets.ModelViewSet):
         if not file_obj:
             return Response({'error': 'No backup file uploaded.'}, status=status.HTTP_400_BAD_REQUEST)
 
+        restore_context = {'request': request}
         try:
             if file_obj.name.lower().endswith('.zip'):
                 with zipfile.ZipFile(file_obj) as zip_file:
                     json_names = [name for name in zip_file.namelist() if name.endswith('.json')]
                     if not json_names:
                         return Response({'error': 'No JSON export found in backup zip.'}, status=status.HTTP_400_BAD_REQUEST)
-                    payload = json.loads(zip_file.read(json_names[0]).decode('utf-8'))
+                    with zip_file.open(json_names[0]) as backup_stream:
+                        created_counts = restore_account_backup(
+                            request.user, iter_json_items(backup_stream), mode=restore_mode, context=restore_context
+                        )
             else:
-                payload = json.loads(file_obj.read().decode('utf-8'))
+                created_counts = restore_account_backup(
+                    request.user, iter_json_items(file_obj), mode=restore_mode, context=restore_context
+                )
+        except BackupFormatError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
         except (json.JSONDecodeError, zipfile.BadZipFile, UnicodeDecodeError):
             return Response({'error': 'Backup file could not be read.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        if payload.get('schema') != 'careerhub.account_export.v1':
-            return Response(
-                {'error': 'Unsupported backup format. Please upload a CareerHub account export.'},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        user = request.user
-        availability_data = payload.get('availability') or {}
-        career_data = payload.get('career') or {}
-        created_counts = {
-            'settings': 0,
-            'categories': 0,
-            'holidays': 0,
-            'events': 0,
-            'companies': 0,
-            'applications': 0,
-            'tasks': 0,
-            'ai_artifacts': 0,
-            'offer_decision_snapshots': 0,
-        }
-
-        with transaction.atomic():
-            if restore_mode == 'replace':
-                ApplicationTimelineEntry.objects.filter(user=user).delete()
-                AIArtifact.objects.filter(user=user).delete()
-                OfferDecisionSnapshot.objects.filter(user=user).delete()
-                Task.objects.filter(user=user).delete()
-                Offer.objects.filter(application__user=user).delete()
-                Document.objects.filter(user=user).delete()
-                Experience.objects.filter(user=user).delete()
-                Application.objects.filter(user=user).delete()
-                Company.objects.filter(user=user).delete()
-                PublicBooking.objects.filter(share_link__user=user).delete()
-                ShareLink.objects.filter(user=user).delete()
-                AvailabilityOverride.objects.filter(user=user).delete()
-                AvailabilitySetting.objects.filter(user=user).delete()
-                Event.objects.filter(user=user).delete()
-                CustomHoliday.objects.filter(user=user).delete()
-                EventCategory.objects.filter(user=user).delete()
-
-            settings_items = availability_data.get('user_settings') or []
-            if settings_items:
-                settings_payload = dict(settings_items[0])
-                for field in ('id', 'email', 'profile_picture', 'ai_provider_api_key_masked', 'ai_provider_api_key_configured'):
-                    settings_payload.pop(field, None)
-                settings_obj, _ = UserSettings.objects.get_or_create(user=user)
-                serializer = UserSettingsSerializer(settings_obj, data=settings_payload, partial=True, context={'request': request})
-                serializer.is_valid(raise_exception=True)
-                serializer.save()
-                created_counts['settings'] = 1
-
-            category_map = {}
-            for item in availability_data.get('categories') or []:
-                payload_item = {key: item.get(key) for key in ('name', 'color', 'icon', 'is_locked')}
-                category, created = EventCategory.objects.update_or_create(
-                    user=user,
-                    name=payload_item['name'],
-                    defaults=payload_item,
-                )
-                category_map[item.get('id')] = category
-                if created:
-                    created_counts['categories'] += 1
-
-            for item in availability_data.get('holidays') or []:
-                payload_item = {
-                    key: item.get(key)
-                    for key in ('date', 'group_id', 'description', 'holiday_type', 'is_recurring', 'is_locked', 'tab')
-                }
-                _, created = CustomHoliday.objects.get_or_create(
-                    user=user,
-                    date=payload_item['date'],
-                    description=payload_item.get('description') or '',
-                    defaults=payload_item,
-                )
-                if created:
-                    created_counts['holidays'] += 1
-
-            for item in availability_data.get('events') or []:
-                payload_item = {
-                    key: item.get(key)
-                    for key in (
-                        'name',
-                        'date',
-                        'start_time',
-                        'end_time',
-                        'timezone',
-                        'color',
-                        'location_type',
-                        'location',
-                        'meeting_link',
-                        'is_recurring',
-                        'recurrence_rule',
-                        'notes',
-                        'reminder_minutes',
-                        'is_locked',
-                    )
-                }
-                payload_item['category'] = category_map.get(item.get('category'))
-                _, created = Event.objects.get_or_create(
-                    user=user,
-                    name=payload_item['name'],
-                    date=payload_item['date'],
-                    start_time=payload_item['start_time'],
-                    defaults=payload_item,
-                )
-                if created:
-                    created_counts['events'] += 1
-
-            company_map = {}
-            for item in career_data.get('companies') or []:
-                company, created = Company.objects.update_or_create(
-                    user=user,
-                    name=item.get('name') or 'Imported Company',
-                    defaults={
-                        'website': item.get('website') or None,
-                        'industry': item.get('industry') or '',
-                    },
-                )
-                company_map[company.name] = company
-                if created:
-                    created_counts['companies'] += 1
-
-            for item in career_data.get('applications') or []:
-                company_name = item.get('company') or 'Imported Company'
-                company = company_map.get(company_name)
-                if not company:
-                    company, created_company = Company.objects.get_or_create(user=user, name=company_name)
-                    company_map[company_name] = company
-                    if created_company:
-                        created_counts['companies'] += 1
-                defaults = {
-                    key: item.get(key)
-                    for key in (
-                        'status',
-                        'rto_policy',
-                        'rto_days_per_week',
-                        'commute_cost_value',
-                        'commute_cost_frequency',
-                        'free_food_perk_value',
-                        'free_food_perk_frequency',
-                        'tax_base_rate',
-                        'tax_bonus_rate',
-                        'tax_equity_rate',
-                        'monthly_rent_override',
-                        'current_round',
-                        'job_link',
-                        'salary_range',
-                        'location',
-                        'office_location',
-                        'visa_sponsorship',
-                        'day_one_gc',
-                        'growth_score',
-                        'work_life_score',
-                        'brand_score',
-                        'team_score',
-                        'notes',
-                        'date_applied',
-                    )
-                }
-                _, created = Application.objects.update_or_create(
-                    user=user,
-                    company=company,
-                    role_title=item.get('role_title') or 'Imported Role',
-                    defaults=defaults,
-                )
-                if created:
-                    created_counts['applications'] += 1
-
-            for item in career_data.get('tasks') or []:
-                payload_item = {key: item.get(key) for key in ('title', 'description', 'status', 'priority', 'due_date', 'position')}
-                _, created = Task.objects.get_or_create(
-                    user=user,
-                    title=payload_item.get('title') or 'Imported Task',
-                    defaults=payload_item,
-                )
-                if created:
-                    created_counts['tasks'] += 1
-
-            for item in career_data.get('ai_artifacts') or []:
-                payload_item = {
-                    key: item.get(key)
-                    for key in (
-                        'artifact_type',
-                        'client_id',
-                        'title',
-                        'summary',
-                        'payload',
-                        'is_locked',
-                        'saved_at',
-                    )
-                }
-                if not payload_item.get('artifact_type') or not payload_item.get('client_id'):
-                    continue
-                _, created = AIArtifact.objects.update_or_create(
-                    user=user,
-                    client_id=payload_item['client_id'],
-                    defaults=payload_item,
-                )
-                if created:
-                    created_counts['ai_artifacts'] += 1
-
-            for item in career_data.get('offer_decision_snapshots') or []:
-                offer_company = item.get('offer_company') or item.get('company_name')
-                offer_role = item.get('offer_role') or item.get('role_title')
-                offer = None
-                if offer_company and offer_role:
-                    offer = Offer.objects.filter(
-                        application__user=user,
-                        application__company__name=offer_company,
-                        application__role_title=offer_role,
-                    ).select_related('application').first()
-                if not offer:
-                    application = Application.objects.filter(
-                        user=user,
-                        company__name=offer_company,
-                        role_title=offer_role,
-                    ).first()
-                    offer_snapshot = item.get('offer_snapshot') or {}
-                    if application:
-                        offer, _ = Offer.objects.get_or_create(
-                            application=application,
-                            defaults={
-                                'base_salary': offer_snapshot.get('base_salary') or 0,
-                                'bonus': offer_snapshot.get('bonus') or 0,
-                                'equity': offer_snapshot.get('equity') or 0,
-                                'sign_on': offer_snapshot.get('sign_on') or 0,
-                                'benefits_value': offer_snapshot.get('benefits_value') or 0,
-                                'benefit_items': offer_snapshot.get('benefit_items') or [],
-                                'pto_days': offer_snapshot.get('pto_days') or 15,
-                                'is_unlimited_pto': offer_snapshot.get('is_unlimited_pto') or False,
-                                'holiday_days': offer_snapshot.get('holiday_days') or 11,
-                            },
-                        )
-                if not offer:
-                    continue
-                payload_item = {
-                    key: item.get(key)
-                    for key in (
-                        'title',
-                        'notes',
-                        'decision_score',
-                        'rank',
-                        'total_comp',
-                        'adjusted_value',
-                        'monthly_rent',
-                        'commute_cost_annual',
-                        'tax_snapshot',
-                        'score_categories',
-                        'offer_snapshot',
-                        'adjustment_snapshot',
-                        'is_locked',
-                    )
-                }
-                _, created = OfferDecisionSnapshot.objects.get_or_create(
-                    user=user,
-                    offer=offer,
-                    title=payload_item.get('title') or '',
-                    captured_at=item.get('captured_at'),
-                    defaults=payload_item,
-                )
-                if created:
-                    created_counts['offer_decision_snapshots'] += 1
-
         return Response(
             {
                 'message': 'Backup restore completed.',
@@ -649,7 +285,7 @@ class ConflictAlertViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def unresolved(self, request):
-        conflicts = self.get_queryset().filter(resolved=False)
+        conflicts = self.get_queryset().filter(resolved=False).select_related('event1', 'event2')
         serializer = self.get_serializer(conflicts, many=True)
         return Response(serializer.data)
 
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.3 on 2026-10-17 03:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('career', '0050_googlesheetsyncconfig_overwrite_strategies_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='googlesheetsyncconfig',
+            name='source_revision',
+            field=models.CharField(blank=True, help_text='Sheet revision and sync settings digest from the last clean sync.', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='googlesheetsyncrun',
+            name='status',
+            field=models.CharField(choices=[('SUCCESS', 'Success'), ('ERROR', 'Error'), ('ROLLED_BACK', 'Rolled Back'), ('UNCHANGED', 'Unchanged')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.3 on 2026-10-17 03:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('career', '0051_googlesheetsyncconfig_source_revision'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='googleoauthcredential',
+            name='access_token_encrypted',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='googleoauthcredential',
+            name='access_token_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='googlesheetsyncconfig',
+            name='fetch_strategy',
+            field=models.CharField(blank=True, choices=[('OAUTH', 'Google OAuth'), ('PUBLIC_CSV', 'Public CSV'), ('SERVICE_ACCOUNT', 'Service Account')], help_text='How the sheet was last read successfully; tried first on the next read.', max_length=20),
+        ),
+    ]
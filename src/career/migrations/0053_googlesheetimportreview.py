@@ -0,0 +1,33 @@
+# Generated by Django 5.0.3 on 2026-10-17 03:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('career', '0052_google_sheet_fetch_strategy_and_access_token'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GoogleSheetImportReview',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('force', models.BooleanField(default=False)),
+                ('column_mapping', models.JSONField(blank=True, default=dict)),
+                ('summary', models.JSONField(blank=True, default=dict)),
+                ('items', models.JSONField(blank=True, default=list)),
+                ('errors', models.JSONField(blank=True, default=list)),
+                ('rows', models.JSONField(blank=True, default=dict, help_text='Reviewed sheet rows keyed by row number.')),
+                ('scanned_rows', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+                ('config', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='import_reviews', to='career.googlesheetsyncconfig')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
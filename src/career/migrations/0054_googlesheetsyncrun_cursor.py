@@ -0,0 +1,38 @@
+# Generated by Django 5.0.3 on 2026-10-17 03:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('career', '0053_googlesheetimportreview'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='googlesheetsyncrun',
+            name='checkpoint_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='googlesheetsyncrun',
+            name='cursor',
+            field=models.PositiveIntegerField(default=0, help_text='Last sheet row number processed by this run.'),
+        ),
+        migrations.AddField(
+            model_name='googlesheetsyncrun',
+            name='force',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='googlesheetsyncrun',
+            name='source_revision',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='googlesheetsyncrun',
+            name='status',
+            field=models.CharField(choices=[('SUCCESS', 'Success'), ('ERROR', 'Error'), ('ROLLED_BACK', 'Rolled Back'), ('UNCHANGED', 'Unchanged'), ('RUNNING', 'Running'), ('PARTIAL', 'Partial')], max_length=20),
+        ),
+    ]
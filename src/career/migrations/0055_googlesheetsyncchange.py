@@ -0,0 +1,40 @@
+# Generated by Django 5.0.3 on 2026-10-17 03:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('career', '0054_googlesheetsyncrun_cursor'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='googlesheetsyncrun',
+            name='change_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='googlesheetsyncrun',
+            name='compacted_at',
+            field=models.DateTimeField(blank=True, help_text="When retention dropped this run's change log.", null=True),
+        ),
+        migrations.CreateModel(
+            name='GoogleSheetSyncChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('CHANGE', 'Change'), ('HISTORY', 'History')], max_length=10)),
+                ('action', models.CharField(blank=True, max_length=50)),
+                ('row_number', models.PositiveIntegerField(blank=True, null=True)),
+                ('local_object_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('data', models.JSONField(blank=True, default=dict)),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='change_entries', to='career.googlesheetsyncrun')),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['run', 'kind', 'id'], name='sheet_sync_change_page')],
+            },
+        ),
+    ]
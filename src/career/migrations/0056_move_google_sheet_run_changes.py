@@ -0,0 +1,45 @@
+# Generated by Django 5.0.3 on 2026-10-17
+
+from django.db import migrations
+
+LAST_RESULT_MAX_ERRORS = 20
+
+
+def move_run_changes(apps, schema_editor):
+    GoogleSheetSyncRun = apps.get_model("career", "GoogleSheetSyncRun")
+    GoogleSheetSyncChange = apps.get_model("career", "GoogleSheetSyncChange")
+    GoogleSheetSyncConfig = apps.get_model("career", "GoogleSheetSyncConfig")
+
+    for run in GoogleSheetSyncRun.objects.exclude(changes=[]).iterator(chunk_size=100):
+        entries = [
+            GoogleSheetSyncChange(
+                run_id=run.id,
+                kind="CHANGE",
+                action=change.get("action") or "",
+                row_number=change.get("row_number"),
+                local_object_id=change.get("local_object_id"),
+                data={"diff": change.get("diff") or {}},
+            )
+            for change in run.changes or []
+            if isinstance(change, dict)
+        ]
+        GoogleSheetSyncChange.objects.bulk_create(entries, batch_size=500)
+        GoogleSheetSyncRun.objects.filter(id=run.id).update(change_count=len(entries), changes=[])
+
+    for config in GoogleSheetSyncConfig.objects.exclude(last_result={}).iterator(chunk_size=100):
+        result = dict(config.last_result or {})
+        errors = result.get("errors") or []
+        result.pop("history", None)
+        result["error_count"] = len(errors)
+        result["errors"] = errors[:LAST_RESULT_MAX_ERRORS]
+        GoogleSheetSyncConfig.objects.filter(id=config.id).update(last_result=result)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("career", "0055_googlesheetsyncchange"),
+    ]
+
+    operations = [
+        migrations.RunPython(move_run_changes, migrations.RunPython.noop),
+    ]
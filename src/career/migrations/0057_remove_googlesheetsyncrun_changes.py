@@ -0,0 +1,17 @@
+# Generated by Django 5.0.3 on 2026-10-17
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('career', '0056_move_google_sheet_run_changes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='googlesheetsyncrun',
+            name='changes',
+        ),
+    ]
@@ -236,6 +236,15 @@ class GoogleSheetSyncConfig(models.Model):
         (STATUS_ERROR, 'Error'),
     ]
 
+    FETCH_OAUTH = 'OAUTH'
+    FETCH_PUBLIC_CSV = 'PUBLIC_CSV'
+    FETCH_SERVICE_ACCOUNT = 'SERVICE_ACCOUNT'
+    FETCH_STRATEGY_CHOICES = [
+        (FETCH_OAUTH, 'Google OAuth'),
+        (FETCH_PUBLIC_CSV, 'Public CSV'),
+        (FETCH_SERVICE_ACCOUNT, 'Service Account'),
+    ]
+
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='google_sheet_sync_configs')
     name = models.CharField(max_length=120)
     sheet_url = models.URLField(max_length=2048)
@@ -253,6 +262,17 @@ class GoogleSheetSyncConfig(models.Model):
     last_status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_IDLE)
     last_error = models.TextField(blank=True)
     last_result = models.JSONField(default=dict, blank=True)
+    fetch_strategy = models.CharField(
+        max_length=20,
+        choices=FETCH_STRATEGY_CHOICES,
+        blank=True,
+        help_text='How the sheet was last read successfully; tried first on the next read.',
+    )
+    source_revision = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text='Sheet revision and sync settings digest from the last clean sync.',
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -270,18 +290,30 @@ class GoogleSheetSyncRun(models.Model):
     STATUS_SUCCESS = 'SUCCESS'
     STATUS_ERROR = 'ERROR'
     STATUS_ROLLED_BACK = 'ROLLED_BACK'
+    STATUS_UNCHANGED = 'UNCHANGED'
+    STATUS_RUNNING = 'RUNNING'
+    STATUS_PARTIAL = 'PARTIAL'
     STATUS_CHOICES = [
         (STATUS_SUCCESS, 'Success'),
         (STATUS_ERROR, 'Error'),
         (STATUS_ROLLED_BACK, 'Rolled Back'),
+        (STATUS_UNCHANGED, 'Unchanged'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_PARTIAL, 'Partial'),
     ]
+    RESUMABLE_STATUSES = [STATUS_RUNNING, STATUS_PARTIAL]
 
     config = models.ForeignKey(GoogleSheetSyncConfig, on_delete=models.CASCADE, related_name='runs')
     status = models.CharField(max_length=20, choices=STATUS_CHOICES)
     started_at = models.DateTimeField()
     completed_at = models.DateTimeField(null=True, blank=True)
+    cursor = models.PositiveIntegerField(default=0, help_text='Last sheet row number processed by this run.')
+    checkpoint_at = models.DateTimeField(null=True, blank=True)
+    force = models.BooleanField(default=False)
+    source_revision = models.CharField(max_length=255, blank=True)
     summary = models.JSONField(default=dict, blank=True)
-    changes = models.JSONField(default=list, blank=True)
+    change_count = models.PositiveIntegerField(default=0)
+    compacted_at = models.DateTimeField(null=True, blank=True, help_text='When retention dropped this run\'s change log.')
     error_details = models.TextField(blank=True)
 
     class Meta:
@@ -291,6 +323,31 @@ class GoogleSheetSyncRun(models.Model):
         return f"{self.config.name} Run at {self.started_at}"
 
 
+class GoogleSheetSyncChange(models.Model):
+    KIND_CHANGE = 'CHANGE'
+    KIND_HISTORY = 'HISTORY'
+    KIND_CHOICES = [
+        (KIND_CHANGE, 'Change'),
+        (KIND_HISTORY, 'History'),
+    ]
+
+    run = models.ForeignKey(GoogleSheetSyncRun, on_delete=models.CASCADE, related_name='change_entries')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    action = models.CharField(max_length=50, blank=True)
+    row_number = models.PositiveIntegerField(null=True, blank=True)
+    local_object_id = models.PositiveIntegerField(null=True, blank=True)
+    data = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['run', 'kind', 'id'], name='sheet_sync_change_page'),
+        ]
+
+    def __str__(self):
+        return f"{self.run_id}:{self.kind}:{self.action}"
+
+
 class GoogleSheetSyncRow(models.Model):
     config = models.ForeignKey(GoogleSheetSyncConfig, on_delete=models.CASCADE, related_name='tracked_rows')
     external_key = models.CharField(max_length=255)
@@ -310,11 +367,32 @@ class GoogleSheetSyncRow(models.Model):
         return f"{self.config_id}:{self.external_key}"
 
 
+class GoogleSheetImportReview(models.Model):
+    config = models.ForeignKey(GoogleSheetSyncConfig, on_delete=models.CASCADE, related_name='import_reviews')
+    force = models.BooleanField(default=False)
+    column_mapping = models.JSONField(default=dict, blank=True)
+    summary = models.JSONField(default=dict, blank=True)
+    items = models.JSONField(default=list, blank=True)
+    errors = models.JSONField(default=list, blank=True)
+    rows = models.JSONField(default=dict, blank=True, help_text='Reviewed sheet rows keyed by row number.')
+    scanned_rows = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.config.name} import review at {self.created_at}"
+
+
 class GoogleOAuthCredential(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='google_oauth_credential')
     google_email = models.EmailField(blank=True)
     scopes = models.JSONField(default=list, blank=True)
     refresh_token_encrypted = models.TextField(blank=True, default='')
+    access_token_encrypted = models.TextField(blank=True, default='')
+    access_token_expires_at = models.DateTimeField(null=True, blank=True)
     token_uri = models.URLField(default='https://oauth2.googleapis.com/token')
     connected_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -9,6 +9,7 @@ from .models import (
     Company,
     Application,
     ApplicationTimelineEntry,
+    GoogleSheetSyncChange,
     GoogleSheetSyncConfig,
     GoogleSheetSyncRun,
     Offer,
@@ -463,12 +464,21 @@ class GoogleSheetSyncRunSerializer(serializers.ModelSerializer):
             'status',
             'started_at',
             'completed_at',
+            'cursor',
             'summary',
-            'changes',
+            'change_count',
+            'compacted_at',
             'error_details',
         ]
         read_only_fields = fields
 
+
+class GoogleSheetSyncChangeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = GoogleSheetSyncChange
+        fields = ['id', 'kind', 'action', 'row_number', 'local_object_id', 'data']
+        read_only_fields = fields
+
 class ApplicationExportSerializer(serializers.ModelSerializer):
     company = serializers.CharField(source='company.name', read_only=True)
     
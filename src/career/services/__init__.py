@@ -15,8 +15,10 @@ from .document_storage import (
     document_content_type,
     document_filename,
     normalize_document_url,
+    open_document_file,
     read_document_bytes,
     store_document_file,
+    store_export_file,
     using_private_document_blob_storage,
 )
 
@@ -35,7 +37,9 @@ __all__ = [
     'document_content_type',
     'document_filename',
     'normalize_document_url',
+    'open_document_file',
     'read_document_bytes',
     'store_document_file',
+    'store_export_file',
     'using_private_document_blob_storage',
 ]
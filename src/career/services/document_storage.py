@@ -1,3 +1,4 @@
+import io
 import mimetypes
 import os
 import posixpath
@@ -6,6 +7,7 @@ from urllib.parse import urlparse
 from urllib.request import urlopen
 
 from django.conf import settings
+from django.core.files import File
 from django.core.files.storage import default_storage
 from vercel.blob import BlobClient
 
@@ -202,3 +204,46 @@ def store_document_file(
         delete_document_asset(current_file)
 
     return stored_value
+
+
+def open_document_file(value):
+    """Return a readable binary file for a stored document value, or ``None``."""
+    normalized = normalize_document_url(value)
+    if not normalized:
+        return None
+
+    if _is_blob_value(normalized) or normalized.startswith(("http://", "https://")):
+        content = read_document_bytes(normalized)
+        return io.BytesIO(content) if content is not None else None
+
+    storage_name = normalized
+    media_url = settings.MEDIA_URL.rstrip("/")
+    if storage_name.startswith(settings.MEDIA_URL):
+        storage_name = storage_name[len(settings.MEDIA_URL) :].lstrip("/")
+    elif storage_name.startswith(f"{media_url}/"):
+        storage_name = storage_name[len(media_url) + 1 :]
+
+    try:
+        return default_storage.open(storage_name, "rb")
+    except Exception:
+        return None
+
+
+def store_export_file(file_obj, *, user_id, job_id, filename, content_type):
+    """Store a generated export artifact without reading it into memory first."""
+    file_obj.seek(0)
+    if using_private_document_blob_storage():
+        with BlobClient(token=_blob_token()) as client:
+            uploaded = client.put(
+                f"exports/user-{user_id}/job-{job_id}/{filename}",
+                file_obj,
+                access="private",
+                content_type=content_type,
+                add_random_suffix=False,
+                overwrite=True,
+                multipart=True,
+            )
+        return f"{BLOB_VALUE_PREFIX}{uploaded.pathname}"
+
+    stored_name = default_storage.save(f"exports/user_{user_id}/job_{job_id}-{filename}", File(file_obj))
+    return default_storage.url(stored_name)
@@ -1,6 +1,7 @@
 import json
 import secrets
-from datetime import timedelta
+import threading
+from datetime import timedelta, timezone as dt_timezone
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
@@ -24,6 +25,12 @@ GOOGLE_AUTH_URL = 'https://accounts.google.com/o/oauth2/v2/auth'
 GOOGLE_TOKEN_URL = 'https://oauth2.googleapis.com/token'
 GOOGLE_TOKEN_INFO_URL = 'https://www.googleapis.com/oauth2/v2/userinfo'
 STATE_TTL = timedelta(minutes=15)
+# Refresh a cached access token this long before it expires; google-auth itself
+# refreshes (without persisting) a few minutes early.
+ACCESS_TOKEN_EXPIRY_MARGIN = timedelta(minutes=5)
+SERVICE_CACHE_MAX_ENTRIES = 64
+
+_service_cache = threading.local()
 
 
 def google_oauth_configured():
@@ -76,12 +83,15 @@ def complete_google_oauth_callback(state, code, redirect_uri):
         access_token = token_data.get('access_token') or ''
         google_email = _fetch_google_email(access_token) if access_token else ''
         scopes = (token_data.get('scope') or ' '.join(GOOGLE_OAUTH_SCOPES)).split()
+        expires_in = int(token_data.get('expires_in') or 0)
         GoogleOAuthCredential.objects.update_or_create(
             user=state_record.user,
             defaults={
                 'google_email': google_email,
                 'scopes': scopes,
                 'refresh_token_encrypted': encrypt_ai_provider_secret(refresh_token),
+                'access_token_encrypted': encrypt_ai_provider_secret(access_token) if access_token and expires_in else '',
+                'access_token_expires_at': timezone.now() + timedelta(seconds=expires_in) if access_token and expires_in else None,
                 'token_uri': GOOGLE_TOKEN_URL,
             },
         )
@@ -95,6 +105,11 @@ def disconnect_google_oauth(user):
 
 
 def get_google_oauth_credentials(user):
+    """Return refreshable credentials carrying a valid access token, or ``None`` if not connected.
+
+    The access token is kept encrypted on the credential row until shortly
+    before it expires, so back-to-back reads skip the token endpoint.
+    """
     credential = GoogleOAuthCredential.objects.filter(user=user).first()
     if not credential or not credential.refresh_token_encrypted:
         return None
@@ -103,15 +118,60 @@ def get_google_oauth_credentials(user):
     except ImportError as exc:
         raise ValidationError('Install google-auth to use Google OAuth.') from exc
 
+    now = timezone.now()
+    token = None
+    expiry = None
+    if (
+        credential.access_token_encrypted
+        and credential.access_token_expires_at
+        and credential.access_token_expires_at > now + ACCESS_TOKEN_EXPIRY_MARGIN
+    ):
+        try:
+            token = decrypt_ai_provider_secret(credential.access_token_encrypted) or None
+        except Exception:
+            token = None
+        # google-auth compares expiry against naive UTC datetimes.
+        expiry = credential.access_token_expires_at.astimezone(dt_timezone.utc).replace(tzinfo=None)
+
     refresh_token = decrypt_ai_provider_secret(credential.refresh_token_encrypted)
-    return Credentials(
-        token=None,
+    credentials = Credentials(
+        token=token,
         refresh_token=refresh_token,
         token_uri=credential.token_uri or GOOGLE_TOKEN_URL,
         client_id=_client_id(),
         client_secret=_client_secret(),
         scopes=credential.scopes or GOOGLE_OAUTH_SCOPES,
+        expiry=expiry if token else None,
     )
+    if not token:
+        _refresh_and_store_access_token(credential, credentials)
+    return credentials
+
+
+def get_google_service(api, version, credentials, cache_key):
+    """Return a ``googleapiclient`` service, reused per thread while ``cache_key`` is unchanged.
+
+    ``cache_key`` is ``(owner, token)``: a new token for the same owner
+    replaces that owner's client instead of piling up stale ones.
+    """
+    try:
+        from googleapiclient.discovery import build
+    except ImportError as exc:
+        raise ValidationError('Install google-api-python-client to read Google Sheets.') from exc
+
+    services = getattr(_service_cache, 'services', None)
+    if services is None:
+        services = _service_cache.services = {}
+    owner, token = cache_key
+    slot = (api, version, owner)
+    cached = services.get(slot)
+    if cached and cached[0] == token:
+        return cached[1]
+    if len(services) >= SERVICE_CACHE_MAX_ENTRIES:
+        services.clear()
+    service = build(api, version, credentials=credentials, cache_discovery=False)
+    services[slot] = (token, service)
+    return service
 
 
 def list_google_spreadsheets(user, page_size=50):
@@ -120,12 +180,7 @@ def list_google_spreadsheets(user, page_size=50):
         raise ValidationError('Connect Google first.')
     if GOOGLE_DRIVE_METADATA_READONLY_SCOPE not in getattr(credentials, 'scopes', []):
         raise ValidationError('Reconnect Google to allow spreadsheet selection.')
-    try:
-        from googleapiclient.discovery import build
-    except ImportError as exc:
-        raise ValidationError('Install google-api-python-client to list Google Sheets.') from exc
-
-    service = build('drive', 'v3', credentials=credentials, cache_discovery=False)
+    service = get_google_service('drive', 'v3', credentials, (f'oauth:{user.pk}', credentials.token))
     response = service.files().list(
         q="mimeType='application/vnd.google-apps.spreadsheet' and trashed=false",
         fields='files(id,name,webViewLink,modifiedTime)',
@@ -152,12 +207,7 @@ def list_google_spreadsheet_tabs(user, spreadsheet_id):
     spreadsheet_id = (spreadsheet_id or '').strip()
     if not spreadsheet_id:
         raise ValidationError('Spreadsheet ID is required.')
-    try:
-        from googleapiclient.discovery import build
-    except ImportError as exc:
-        raise ValidationError('Install google-api-python-client to list worksheet tabs.') from exc
-
-    service = build('sheets', 'v4', credentials=credentials, cache_discovery=False)
+    service = get_google_service('sheets', 'v4', credentials, (f'oauth:{user.pk}', credentials.token))
     response = service.spreadsheets().get(
         spreadsheetId=spreadsheet_id,
         fields='sheets(properties(sheetId,title,index))',
@@ -173,6 +223,25 @@ def list_google_spreadsheet_tabs(user, spreadsheet_id):
     ]
 
 
+def _refresh_and_store_access_token(credential, credentials):
+    try:
+        import httplib2
+        from google.auth.exceptions import RefreshError
+        from google_auth_httplib2 import Request as GoogleAuthRequest
+    except ImportError as exc:
+        raise ValidationError('Install google-api-python-client to use Google OAuth.') from exc
+
+    try:
+        credentials.refresh(GoogleAuthRequest(httplib2.Http(timeout=15)))
+    except RefreshError as exc:
+        raise ValidationError('Google access was revoked or expired. Please reconnect Google.') from exc
+    credential.access_token_encrypted = encrypt_ai_provider_secret(credentials.token)
+    credential.access_token_expires_at = (
+        credentials.expiry.replace(tzinfo=dt_timezone.utc) if credentials.expiry else None
+    )
+    credential.save(update_fields=['access_token_encrypted', 'access_token_expires_at', 'updated_at'])
+
+
 def _exchange_code_for_tokens(code, redirect_uri):
     body = urlencode(
         {
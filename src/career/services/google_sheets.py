@@ -5,21 +5,34 @@ import io
 import json
 import os
 import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from datetime import timedelta
 from datetime import time
 from decimal import Decimal, InvalidOperation
+from time import monotonic
 from urllib.error import HTTPError, URLError
 from urllib.parse import parse_qs, urlencode, urlparse
 from urllib.request import Request, urlopen
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from django.db import transaction
+from django.conf import settings
+from django.db import connection, connections, transaction
+from django.db.models import F, Max, Q
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
+from analytics.signals import bump_widget_generation
 from availability.models import Event, EventCategory, UserSettings
-from career.models import Application, Company, GoogleSheetSyncConfig, GoogleSheetSyncRow, GoogleSheetSyncRun
+from career.models import (
+    Application,
+    Company,
+    GoogleSheetImportReview,
+    GoogleSheetSyncChange,
+    GoogleSheetSyncConfig,
+    GoogleSheetSyncRow,
+    GoogleSheetSyncRun,
+)
 
 
 APPLICATION_DEFAULT_MAPPING = {
@@ -89,6 +102,30 @@ STATUS_ALIASES = {
 ROUND_TONES = ['bg-amber-400', 'bg-amber-500', 'bg-orange-500', 'bg-orange-600', 'bg-red-500']
 CUSTOM_STAGE_TONES = ['bg-blue-500', 'bg-violet-500', 'bg-sky-500', 'bg-amber-500', 'bg-emerald-500']
 
+# Sheet rows diffed in memory before each bulk write transaction.
+SYNC_WRITE_CHUNK_SIZE = 500
+IMPORT_REVIEW_TTL = timedelta(hours=1)
+# A RUNNING run without a checkpoint for this long was killed and may be resumed.
+SYNC_RUN_STALE_AFTER = timedelta(minutes=2)
+LAST_RESULT_MAX_ERRORS = 20
+RUN_COMPACTION_BATCH_SIZE = 500
+# No new config starts this close to the deadline, so the syncs already running
+# reach their next chunk boundary and checkpoint before the function times out.
+SYNC_START_CUTOFF_SECONDS = 5
+APPLICATION_IDENTITY_FIELDS = ['salary_range', 'location', 'office_location', 'job_link']
+APPLICATION_SYNC_FIELDS = [
+    'company',
+    'role_title',
+    'status',
+    'job_link',
+    'salary_range',
+    'location',
+    'office_location',
+    'date_applied',
+    'notes',
+    'updated_at',
+]
+
 US_STATES = {
     'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC', 'PR'
 }
@@ -113,7 +150,62 @@ def get_service_account_email():
     return (info or {}).get('client_email', '')
 
 
-def fetch_sheet_rows(config):
+def fetch_sheet_rows(config, known_revision=''):
+    """Return the sheet's rows, or ``None`` if the public CSV still matches ``known_revision``.
+
+    The strategy that last worked for this config is tried first. When the
+    rows come from the public CSV export, its ETag or content hash is left on
+    ``config._fetched_revision`` for change detection.
+    """
+    _ensure_spreadsheet_id(config)
+    config._fetched_revision = None
+
+    fetchers = {
+        GoogleSheetSyncConfig.FETCH_OAUTH: (
+            'Google OAuth error',
+            lambda: _fetch_google_oauth_rows(config),
+        ),
+        GoogleSheetSyncConfig.FETCH_PUBLIC_CSV: (
+            'Public CSV error',
+            lambda: _fetch_public_csv_rows(config, known_revision=known_revision),
+        ),
+        GoogleSheetSyncConfig.FETCH_SERVICE_ACCOUNT: (
+            'Service account error',
+            lambda: _fetch_google_api_rows(config),
+        ),
+    }
+    strategies = list(fetchers)
+    if config.fetch_strategy in fetchers:
+        strategies.remove(config.fetch_strategy)
+        strategies.insert(0, config.fetch_strategy)
+
+    errors = []
+    for strategy in strategies:
+        label, fetch = fetchers[strategy]
+        try:
+            rows = fetch()
+        except Exception as exc:
+            errors.append(f'{label}: {exc}')
+            continue
+        _remember_fetch_strategy(config, strategy)
+        return rows
+
+    raise ValidationError(
+        'Could not read this sheet. Connect Google for private access, share it publicly as CSV, '
+        'or share it with the configured service account. '
+        + ' '.join(errors)
+    )
+
+
+def _remember_fetch_strategy(config, strategy):
+    if config.fetch_strategy == strategy:
+        return
+    config.fetch_strategy = strategy
+    if config.pk:
+        GoogleSheetSyncConfig.objects.filter(pk=config.pk).update(fetch_strategy=strategy)
+
+
+def _ensure_spreadsheet_id(config):
     if not config.spreadsheet_id:
         config.spreadsheet_id, parsed_gid = parse_google_sheet_url(config.sheet_url)
         if parsed_gid and not config.gid:
@@ -122,27 +214,6 @@ def fetch_sheet_rows(config):
     if not config.spreadsheet_id:
         raise ValidationError('Enter a valid Google Sheets link.')
 
-    errors = []
-    try:
-        return _fetch_google_oauth_rows(config)
-    except Exception as oauth_error:
-        errors.append(f'Google OAuth error: {oauth_error}')
-
-    try:
-        return _fetch_public_csv_rows(config)
-    except Exception as public_error:
-        errors.append(f'Public CSV error: {public_error}')
-
-    try:
-        return _fetch_google_api_rows(config)
-    except Exception as api_error:
-        errors.append(f'Service account error: {api_error}')
-        raise ValidationError(
-            'Could not read this sheet. Connect Google for private access, share it publicly as CSV, '
-            'or share it with the configured service account. '
-            + ' '.join(errors)
-        )
-
 
 def preview_sheet(config, limit=5):
     rows = fetch_sheet_rows(config)
@@ -154,15 +225,46 @@ def preview_sheet(config, limit=5):
     return {'headers': headers, 'rows': body}
 
 
-def sync_google_sheet(config, force=False):
-    run = GoogleSheetSyncRun.objects.create(
-        config=config,
-        status=GoogleSheetSyncRun.STATUS_ERROR, # Default to error until completion
-        started_at=timezone.now()
-    )
+def sync_google_sheet(config, force=False, deadline=None):
+    """Sync the sheet in chunks, checkpointing a row cursor on the run.
+
+    Once ``deadline`` (a ``monotonic()`` value) passes with rows left, the run
+    is left ``PARTIAL`` and the next call resumes after its cursor.
+    """
+    if deadline is None:
+        deadline = monotonic() + getattr(settings, 'GOOGLE_SHEET_SYNC_TIME_BUDGET_SECONDS', 20)
+    run = _claim_resumable_sync_run(config, force=force)
+    resuming = run is not None
+    if not resuming:
+        now = timezone.now()
+        run = GoogleSheetSyncRun.objects.create(
+            config=config,
+            status=GoogleSheetSyncRun.STATUS_RUNNING,
+            started_at=now,
+            checkpoint_at=now,
+            force=force,
+        )
+    force = run.force
 
     try:
-        rows = fetch_sheet_rows(config)
+        _ensure_spreadsheet_id(config)
+        settings_digest = _sync_settings_digest(config)
+        stored_digest, _sep, stored_revision = (config.source_revision or '').partition(':')
+        if stored_digest != settings_digest or force or resuming:
+            stored_revision = ''
+
+        # Probed before the download, so an edit made mid-sync is picked up next time.
+        revision = _probe_drive_revision(config)
+        if revision and revision == stored_revision:
+            return _record_unchanged_sync(config, run)
+
+        rows = fetch_sheet_rows(config, known_revision=stored_revision)
+        revision = revision or getattr(config, '_fetched_revision', None)
+        if rows is None or (revision and revision == stored_revision):
+            return _record_unchanged_sync(config, run)
+        if not resuming:
+            run.source_revision = (revision or '')[:255]
+
         header_index = max((config.header_row or 1) - 1, 0)
         if len(rows) <= header_index:
             raise ValidationError('No header row was found in this sheet.')
@@ -170,98 +272,270 @@ def sync_google_sheet(config, force=False):
         headers = [_dedupe_headers([_clean_cell(value) for value in rows[header_index]])]
         headers = headers[0]
         mapping = config.column_mapping or default_mapping_for_target(config.target_type)
+        previous = run.summary if resuming else {}
         result = {
             'target_type': config.target_type,
-            'created': 0,
-            'updated': 0,
-            'skipped': 0,
-            'errors': [],
+            'created': previous.get('created', 0),
+            'updated': previous.get('updated', 0),
+            'skipped': previous.get('skipped', 0),
+            'errors': list(previous.get('errors', [])),
             'history': [],
-            'scanned_rows': 0,
+            'scanned_rows': previous.get('scanned_rows', 0),
         }
 
-        changes_list = []
+        entries = []
+        pending_rows = [
+            (offset, _row_to_dict(headers, raw_row))
+            for offset, raw_row in enumerate(rows[header_index + 1:], start=header_index + 2)
+            if offset > run.cursor
+        ]
 
-        for offset, raw_row in enumerate(rows[header_index + 1:], start=header_index + 2):
-            row = _row_to_dict(headers, raw_row)
-            if not any(str(value).strip() for value in row.values()):
-                result['skipped'] += 1
-                continue
+        def record(action, row_number, history, diff, instance):
+            result[action] += 1
+            result['history'].extend(history)
+            entries.extend(_history_change_entries(run, history))
+            if action in ['created', 'updated']:
+                entries.append(GoogleSheetSyncChange(
+                    run=run,
+                    kind=GoogleSheetSyncChange.KIND_CHANGE,
+                    action=action,
+                    row_number=row_number,
+                    local_object_id=instance.id if isinstance(instance, Application) else None,
+                    data={'diff': diff},
+                ))
+
+        tracked_rows = None
+        if config.target_type != GoogleSheetSyncConfig.TARGET_APPLICATIONS:
+            tracked_rows = {tracked.external_key: tracked for tracked in GoogleSheetSyncRow.objects.filter(config=config)}
+
+        processed = 0
+        while processed < len(pending_rows):
+            if processed and monotonic() >= deadline:
+                break
+            chunk = pending_rows[processed:processed + SYNC_WRITE_CHUNK_SIZE]
+            sheet_rows = []
+            for offset, row in chunk:
+                if not any(str(value).strip() for value in row.values()):
+                    result['skipped'] += 1
+                    continue
+                result['scanned_rows'] += 1
+                sheet_rows.append((offset, row))
 
-            result['scanned_rows'] += 1
-            try:
-                action, history, diff = _sync_row_with_history(config, row, offset, mapping, force=force)
-                result[action] += 1
-                result['history'].extend(history)
-                if action in ['created', 'updated']:
-                    changes_list.append({
-                        'action': action,
-                        'row_number': offset,
-                        'diff': diff,
-                        'history_id': history[0].id if history else None,
-                        'local_object_id': history[0].application_id if history and config.target_type == GoogleSheetSyncConfig.TARGET_APPLICATIONS else None
-                    })
-            except Exception as exc:
-                result['errors'].append({'row': offset, 'error': str(exc)})
+            if config.target_type == GoogleSheetSyncConfig.TARGET_APPLICATIONS:
+                _sync_application_rows(config, sheet_rows, mapping, result, record, force=force)
+            else:
+                for offset, row in sheet_rows:
+                    try:
+                        action, history, diff = _sync_row_with_history(
+                            config, row, offset, mapping, force=force, tracked_rows=tracked_rows
+                        )
+                        record(action, offset, history, diff, None)
+                    except Exception as exc:
+                        result['errors'].append({'row': offset, 'error': str(exc)})
+
+            processed += len(chunk)
+            run.change_count += sum(entry.kind == GoogleSheetSyncChange.KIND_CHANGE for entry in entries)
+            GoogleSheetSyncChange.objects.bulk_create(entries, batch_size=SYNC_WRITE_CHUNK_SIZE)
+            entries.clear()
+            run.cursor = chunk[-1][0]
+            run.summary = {k: v for k, v in result.items() if k != 'history'}
+            run.checkpoint_at = timezone.now()
+            run.save(update_fields=['cursor', 'summary', 'change_count', 'checkpoint_at', 'source_revision'])
+
+        if processed < len(pending_rows):
+            run.status = GoogleSheetSyncRun.STATUS_PARTIAL
+            result['partial'] = True
+            result['cursor'] = run.cursor
+            result['remaining_rows'] = len(pending_rows) - processed
+            config.last_result = _compact_result(result, run)
+            config.save(update_fields=['last_result', 'spreadsheet_id', 'gid', 'updated_at'])
+            return result
 
         run.status = GoogleSheetSyncRun.STATUS_SUCCESS if not result['errors'] else GoogleSheetSyncRun.STATUS_ERROR
         run.summary = {k: v for k, v in result.items() if k != 'history'}
-        run.changes = changes_list
         if result['errors']:
             run.error_details = f"{len(result['errors'])} row(s) failed."
             
         config.last_synced_at = timezone.now()
-        config.last_result = result
+        config.last_result = _compact_result(result, run)
         if result['errors']:
             config.last_status = GoogleSheetSyncConfig.STATUS_ERROR
             config.last_error = f"{len(result['errors'])} row(s) failed."
+            # Failed rows must be retried even if the sheet is left untouched.
+            config.source_revision = ''
         else:
             config.last_status = GoogleSheetSyncConfig.STATUS_SUCCESS
             config.last_error = ''
-        config.save(update_fields=['last_synced_at', 'last_result', 'last_status', 'last_error', 'spreadsheet_id', 'gid', 'updated_at'])
+            # A run resumed across sheet edits read rows from more than one revision.
+            config.source_revision = (
+                f'{settings_digest}:{revision}'[:255] if revision and revision == run.source_revision else ''
+            )
+        config.save(update_fields=[
+            'last_synced_at', 'last_result', 'last_status', 'last_error',
+            'source_revision', 'spreadsheet_id', 'gid', 'updated_at',
+        ])
         
     except Exception as e:
+        # Only runs stopped by the deadline resume; a failure would otherwise be retried forever.
         run.status = GoogleSheetSyncRun.STATUS_ERROR
         run.error_details = str(e)
         
-        config.last_synced_at = timezone.now()
         config.last_status = GoogleSheetSyncConfig.STATUS_ERROR
         config.last_error = str(e)
-        config.save(update_fields=['last_synced_at', 'last_status', 'last_error', 'updated_at'])
+        config.save(update_fields=['last_status', 'last_error', 'updated_at'])
         raise e
     finally:
-        run.completed_at = timezone.now()
+        if run.status not in GoogleSheetSyncRun.RESUMABLE_STATUSES:
+            run.completed_at = timezone.now()
         run.save()
 
     return result
 
+
+def _claim_resumable_sync_run(config, force=False):
+    run = config.runs.filter(status__in=GoogleSheetSyncRun.RESUMABLE_STATUSES).order_by('-started_at').first()
+    if run is None:
+        return None
+    now = timezone.now()
+    if run.status == GoogleSheetSyncRun.STATUS_RUNNING and run.checkpoint_at and run.checkpoint_at > now - SYNC_RUN_STALE_AFTER:
+        raise ValidationError('This sheet is already syncing. Try again in a minute.')
+    if force and not run.force:
+        run.status = GoogleSheetSyncRun.STATUS_ERROR
+        run.error_details = 'Superseded by a forced resync.'
+        run.completed_at = now
+        run.save(update_fields=['status', 'error_details', 'completed_at'])
+        return None
+    # Only one worker may pick up a stalled or partial run.
+    claimed = GoogleSheetSyncRun.objects.filter(
+        pk=run.pk,
+        status=run.status,
+        checkpoint_at=run.checkpoint_at,
+    ).update(status=GoogleSheetSyncRun.STATUS_RUNNING, checkpoint_at=now)
+    if not claimed:
+        raise ValidationError('This sheet is already syncing. Try again in a minute.')
+    run.status = GoogleSheetSyncRun.STATUS_RUNNING
+    run.checkpoint_at = now
+    return run
+
+
+def _record_unchanged_sync(config, run):
+    result = {
+        'target_type': config.target_type,
+        'created': 0,
+        'updated': 0,
+        'skipped': 0,
+        'errors': [],
+        'history': [],
+        'scanned_rows': 0,
+        'unchanged': True,
+    }
+    run.status = GoogleSheetSyncRun.STATUS_UNCHANGED
+    run.summary = {k: v for k, v in result.items() if k != 'history'}
+
+    config.last_synced_at = timezone.now()
+    config.last_result = _compact_result(result, run)
+    config.last_status = GoogleSheetSyncConfig.STATUS_SUCCESS
+    config.last_error = ''
+    config.save(update_fields=['last_synced_at', 'last_result', 'last_status', 'last_error', 'spreadsheet_id', 'gid', 'updated_at'])
+    return result
+
+
+def _sync_settings_digest(config):
+    # A mapping or tab change must re-read the sheet even if the sheet itself is untouched.
+    settings_payload = [
+        config.target_type,
+        config.worksheet_name,
+        config.gid,
+        config.header_row,
+        config.column_mapping,
+        config.overwrite_strategies,
+    ]
+    return _row_hash(settings_payload)[:16]
+
+
+def _compact_result(result, run=None):
+    # Per-row history lives in GoogleSheetSyncChange; the config keeps counters only.
+    compact = {key: value for key, value in result.items() if key not in ('history', 'errors')}
+    compact['error_count'] = len(result.get('errors', []))
+    compact['errors'] = result.get('errors', [])[:LAST_RESULT_MAX_ERRORS]
+    if run is not None:
+        compact['run_id'] = run.id
+    return compact
+
+
+def _history_change_entries(run, history):
+    return [
+        GoogleSheetSyncChange(
+            run=run,
+            kind=GoogleSheetSyncChange.KIND_HISTORY,
+            action=entry.get('type') or '',
+            row_number=entry.get('row'),
+            local_object_id=entry.get('local_object_id'),
+            data=entry,
+        )
+        for entry in history
+        # One "no changes" entry per untouched row would dwarf everything else.
+        if entry.get('type') != 'skipped'
+    ]
+
+
+def compact_google_sheet_sync_runs(now=None, retention_days=None, batch_size=RUN_COMPACTION_BATCH_SIZE):
+    """Drop change logs of runs past the retention window and delete old no-op runs."""
+    now = now or timezone.now()
+    if retention_days is None:
+        retention_days = getattr(settings, 'GOOGLE_SHEET_SYNC_RUN_RETENTION_DAYS', 30)
+    old_runs = GoogleSheetSyncRun.objects.filter(
+        started_at__lt=now - timedelta(days=retention_days),
+    ).exclude(status__in=GoogleSheetSyncRun.RESUMABLE_STATUSES)
+
+    deleted_runs, _details = old_runs.filter(status=GoogleSheetSyncRun.STATUS_UNCHANGED).delete()
+    run_ids = list(old_runs.filter(compacted_at__isnull=True).values_list('id', flat=True)[:batch_size])
+    deleted_entries, _details = GoogleSheetSyncChange.objects.filter(run_id__in=run_ids).delete()
+    GoogleSheetSyncRun.objects.filter(id__in=run_ids).update(compacted_at=now)
+    return {
+        'deleted_runs': deleted_runs,
+        'compacted_runs': len(run_ids),
+        'deleted_entries': deleted_entries,
+    }
+
+
 def rollback_sync_run(run_id, user):
     run = GoogleSheetSyncRun.objects.select_related('config').filter(id=run_id, config__user=user).first()
     if not run:
         raise ValidationError('Sync run not found.')
     if run.status == GoogleSheetSyncRun.STATUS_ROLLED_BACK:
         raise ValidationError('This run is already rolled back.')
+    if run.status == GoogleSheetSyncRun.STATUS_RUNNING:
+        raise ValidationError('This run is still syncing.')
+    if run.compacted_at:
+        raise ValidationError('This run is past the retention window and can no longer be rolled back.')
         
     config = run.config
-    changes = run.changes
+    changes = run.change_entries.filter(kind=GoogleSheetSyncChange.KIND_CHANGE).order_by('-id')
     
     with transaction.atomic():
-        # Iterate in reverse to safely undo
-        for change in reversed(changes):
-            local_id = change.get('local_object_id')
-            if not local_id:
-                continue
-                
-            if config.target_type == GoogleSheetSyncConfig.TARGET_APPLICATIONS:
-                app = Application.objects.filter(id=local_id, user=user).first()
+        # Undo newest first, a page of the change log at a time.
+        last_id = None
+        while config.target_type == GoogleSheetSyncConfig.TARGET_APPLICATIONS:
+            page = list((changes.filter(id__lt=last_id) if last_id else changes)[:SYNC_WRITE_CHUNK_SIZE])
+            if not page:
+                break
+            last_id = page[-1].id
+            applications = Application.objects.filter(user=user).in_bulk(
+                [change.local_object_id for change in page if change.local_object_id]
+            )
+            for change in page:
+                app = applications.get(change.local_object_id)
                 if not app:
                     continue
-                    
-                if change['action'] == 'created':
+
+                diff = change.data.get('diff')
+                if change.action == 'created':
                     app.delete()
-                elif change['action'] == 'updated' and change.get('diff'):
+                    applications.pop(change.local_object_id)
+                elif change.action == 'updated' and diff:
                     # Revert diffs
-                    for field, values in change['diff'].items():
+                    for field, values in diff.items():
                         old_val = values.get('old')
                         
                         # Company requires special handling since it's an FK
@@ -278,6 +552,7 @@ def rollback_sync_run(run_id, user):
 
 
 def build_import_review(config, force=False):
+    """Review the sheet without writing records and keep a snapshot for ``apply_import_review``."""
     if config.target_type != GoogleSheetSyncConfig.TARGET_APPLICATIONS:
         raise ValidationError('Import review is currently available for application syncs.')
 
@@ -303,6 +578,8 @@ def build_import_review(config, force=False):
         'scanned_rows': 0,
     }
     seen_identities = {}
+    tracked_rows = {tracked.external_key: tracked for tracked in GoogleSheetSyncRow.objects.filter(config=config)}
+    reviewed_rows = {}
 
     for offset, raw_row in enumerate(rows[header_index + 1:], start=header_index + 2):
         row = _row_to_dict(headers, raw_row)
@@ -310,7 +587,9 @@ def build_import_review(config, force=False):
             continue
         review['scanned_rows'] += 1
         try:
-            item = _review_application_row(config, row, offset, mapping, seen_identities, force=force)
+            item = _review_application_row(
+                config, row, offset, mapping, seen_identities, force=force, tracked_rows=tracked_rows
+            )
         except Exception as exc:
             review['summary']['errors'] += 1
             review['errors'].append({'row': offset, 'error': str(exc)})
@@ -318,54 +597,83 @@ def build_import_review(config, force=False):
         if item:
             review['items'].append(item)
             review['summary'][_review_summary_key(item['action'])] += 1
+            reviewed_rows[str(offset)] = row
 
+    GoogleSheetImportReview.objects.filter(config=config).delete()
+    GoogleSheetImportReview.objects.filter(expires_at__lt=timezone.now()).delete()
+    snapshot = GoogleSheetImportReview.objects.create(
+        config=config,
+        force=force,
+        column_mapping=mapping,
+        summary=review['summary'],
+        items=review['items'],
+        errors=review['errors'],
+        rows=reviewed_rows,
+        scanned_rows=review['scanned_rows'],
+        expires_at=timezone.now() + IMPORT_REVIEW_TTL,
+    )
+    review['review_id'] = snapshot.id
+    review['expires_at'] = snapshot.expires_at
     return review
 
 
-def apply_import_review(config, approved_item_ids, duplicate_resolutions=None, force=False):
+def apply_import_review(config, approved_item_ids, duplicate_resolutions=None, force=False, review_id=None):
+    """Apply approved items from an import review.
+
+    With ``review_id`` the stored snapshot is applied as reviewed, even if the
+    sheet has changed since; the sheet is not read again. Without one the sheet
+    is reviewed afresh and its current rows are applied, so an older snapshot
+    is never applied without the caller naming it.
+    """
     approved_item_ids = set(approved_item_ids or [])
     duplicate_resolutions = duplicate_resolutions or {}
-    review = build_import_review(config, force=force)
-    rows = fetch_sheet_rows(config)
-    header_index = max((config.header_row or 1) - 1, 0)
-    headers = _dedupe_headers([_clean_cell(value) for value in rows[header_index]])
-    mapping = config.column_mapping or default_mapping_for_target(config.target_type)
-    approved_by_id = {item['id']: item for item in review['items'] if item['id'] in approved_item_ids}
+    if review_id:
+        snapshot = GoogleSheetImportReview.objects.filter(
+            config=config, id=review_id, expires_at__gt=timezone.now()
+        ).first()
+        if snapshot is None:
+            raise ValidationError('This import review has expired. Review the sheet again before applying.')
+    else:
+        review = build_import_review(config, force=force)
+        snapshot = GoogleSheetImportReview.objects.get(id=review['review_id'])
+
+    force = force or snapshot.force
+    mapping = snapshot.column_mapping or config.column_mapping or default_mapping_for_target(config.target_type)
+    approved_by_row = {item['row']: item for item in snapshot.items if item['id'] in approved_item_ids}
     result = {
         'target_type': config.target_type,
         'created': 0,
         'updated': 0,
         'skipped': 0,
-        'rejected': max(len(review['items']) - len(approved_by_id), 0),
-        'errors': list(review.get('errors', [])),
+        'rejected': max(len(snapshot.items) - len(approved_by_row), 0),
+        'errors': list(snapshot.errors or []),
         'history': [],
-        'scanned_rows': review.get('scanned_rows', 0),
-        'review': review['summary'],
+        'scanned_rows': snapshot.scanned_rows,
+        'review': snapshot.summary,
     }
 
-    row_numbers = {item['row'] for item in approved_by_id.values()}
-    for offset, raw_row in enumerate(rows[header_index + 1:], start=header_index + 2):
-        if offset not in row_numbers:
-            continue
-        row = _row_to_dict(headers, raw_row)
+    tracked_rows = {tracked.external_key: tracked for tracked in GoogleSheetSyncRow.objects.filter(config=config)}
+    for offset in sorted(approved_by_row):
+        item = approved_by_row[offset]
         try:
-            approved_item = next((item for item in approved_by_id.values() if item['row'] == offset), {})
-            resolution = duplicate_resolutions.get(approved_item.get('id'), 'merge')
+            # Rows a sync has brought in since the review match their tracked hash and are skipped.
             action, history, _diff = _sync_row_with_history(
                 config,
-                row,
+                snapshot.rows.get(str(offset)) or {},
                 offset,
                 mapping,
                 force=force,
-                duplicate_resolution=resolution,
+                duplicate_resolution=duplicate_resolutions.get(item['id'], 'merge'),
+                tracked_rows=tracked_rows,
             )
             result[action] += 1
             result['history'].extend(history)
         except Exception as exc:
             result['errors'].append({'row': offset, 'error': str(exc)})
+    snapshot.delete()
 
     config.last_synced_at = timezone.now()
-    config.last_result = result
+    config.last_result = _compact_result(result)
     if result['errors']:
         config.last_status = GoogleSheetSyncConfig.STATUS_ERROR
         config.last_error = f"{len(result['errors'])} row(s) failed."
@@ -376,35 +684,120 @@ def apply_import_review(config, approved_item_ids, duplicate_resolutions=None, f
     return result
 
 
-def sync_enabled_google_sheets(only_due=False, now=None):
+def sync_enabled_google_sheets(only_due=False, now=None, max_workers=None, time_budget=None, deadline=None):
+    """Sync every enabled config, several at a time, until ``deadline``.
+
+    ``deadline`` is a ``monotonic()`` value shared with the caller (the cron
+    request); without one the run gets ``time_budget`` seconds from now. Configs
+    that have not started by then are reported as deferred; the least recently
+    synced configs go first on the next tick. Started syncs always finish.
+    """
+    max_workers = max_workers or getattr(settings, 'GOOGLE_SHEET_SYNC_MAX_WORKERS', 4)
+    if deadline is None:
+        if time_budget is None:
+            time_budget = getattr(settings, 'GOOGLE_SHEET_SYNC_TIME_BUDGET_SECONDS', 20)
+        deadline = monotonic() + time_budget
+    start_cutoff = deadline - SYNC_START_CUTOFF_SECONDS
     summary = {
         'configs': 0,
         'created': 0,
         'updated': 0,
         'skipped': 0,
+        'unchanged': 0,
+        'partial': 0,
+        'deferred': 0,
         'errors': [],
+        'timings': [],
     }
-    for config in GoogleSheetSyncConfig.objects.filter(enabled=True).select_related('user'):
+    pending = []
+    # Runs cut short by an earlier budget resume on the next tick regardless of schedule.
+    resumable_config_ids = set(
+        GoogleSheetSyncRun.objects.filter(
+            status__in=GoogleSheetSyncRun.RESUMABLE_STATUSES,
+            config__enabled=True,
+        ).values_list('config_id', flat=True)
+    )
+    # ``last_synced_at`` only moves on success, so failed attempts are scheduled by their run.
+    configs = (
+        GoogleSheetSyncConfig.objects.filter(enabled=True)
+        .select_related('user')
+        .annotate(last_attempted_at=Max('runs__started_at'))
+        .order_by(F('last_attempted_at').asc(nulls_first=True), F('last_synced_at').asc(nulls_first=True), 'id')
+    )
+    for config in configs:
         summary['configs'] += 1
-        if only_due and not _is_sync_config_due(config, now=now):
+        if only_due and config.id not in resumable_config_ids and not _is_sync_config_due(config, now=now):
             summary['skipped'] += 1
             continue
-        try:
-            result = sync_google_sheet(config)
-            summary['created'] += result.get('created', 0)
-            summary['updated'] += result.get('updated', 0)
-            summary['skipped'] += result.get('skipped', 0)
-            for row_error in result.get('errors', []):
-                summary['errors'].append({'config': config.name, **row_error})
-        except Exception as exc:
-            config.last_synced_at = timezone.now()
-            config.last_status = GoogleSheetSyncConfig.STATUS_ERROR
-            config.last_error = str(exc)
-            config.save(update_fields=['last_synced_at', 'last_status', 'last_error', 'updated_at'])
-            summary['errors'].append({'config': config.name, 'error': str(exc)})
+        pending.append(config)
+
+    # SQLite serializes writers, so concurrent syncs would only contend for the lock.
+    workers = 1 if connection.vendor == 'sqlite' else max(1, min(max_workers, len(pending)))
+    if workers == 1:
+        for config in pending:
+            if monotonic() >= start_cutoff:
+                _record_deferred_config(summary, config)
+                continue
+            _record_config_sync(summary, config, *_sync_config_timed(config, deadline=deadline))
+        return summary
+
+    in_flight = {}
+    queue = list(pending)
+    # Running syncs stop at the deadline by themselves, so waiting for them is
+    # bounded and no worker thread outlives the request.
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='google-sheet-sync') as executor:
+        while queue or in_flight:
+            while queue and len(in_flight) < workers and monotonic() < start_cutoff:
+                config = queue.pop(0)
+                in_flight[executor.submit(_sync_config_timed, config, close_connections=True, deadline=deadline)] = config
+            if not in_flight:
+                break
+            done, _not_done = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                _record_config_sync(summary, in_flight.pop(future), *future.result())
+
+    for config in queue:
+        _record_deferred_config(summary, config)
     return summary
 
 
+def _sync_config_timed(config, close_connections=False, deadline=None):
+    started = monotonic()
+    try:
+        return sync_google_sheet(config, deadline=deadline), None, monotonic() - started
+    except Exception as exc:
+        config.last_status = GoogleSheetSyncConfig.STATUS_ERROR
+        config.last_error = str(exc)
+        config.save(update_fields=['last_status', 'last_error', 'updated_at'])
+        return None, exc, monotonic() - started
+    finally:
+        if close_connections:
+            connections.close_all()
+
+
+def _record_config_sync(summary, config, result, error, seconds):
+    summary['timings'].append({
+        'config': config.name,
+        'status': 'error' if error else ('partial' if result.get('partial') else 'success'),
+        'seconds': round(seconds, 3),
+    })
+    if error:
+        summary['errors'].append({'config': config.name, 'error': str(error)})
+        return
+    summary['created'] += result.get('created', 0)
+    summary['updated'] += result.get('updated', 0)
+    summary['skipped'] += result.get('skipped', 0)
+    summary['unchanged'] += 1 if result.get('unchanged') else 0
+    summary['partial'] += 1 if result.get('partial') else 0
+    for row_error in result.get('errors', []):
+        summary['errors'].append({'config': config.name, **row_error})
+
+
+def _record_deferred_config(summary, config):
+    summary['deferred'] += 1
+    summary['timings'].append({'config': config.name, 'status': 'deferred', 'seconds': None})
+
+
 def _is_sync_config_due(config, now=None):
     now = now or timezone.now()
     try:
@@ -417,45 +810,88 @@ def _is_sync_config_due(config, now=None):
     if local_now.time() < scheduled_time:
         return False
 
-    if not config.last_synced_at:
+    last_attempt = max(
+        filter(None, [config.last_synced_at, getattr(config, 'last_attempted_at', None)]),
+        default=None,
+    )
+    if not last_attempt:
         return True
 
-    last_local = config.last_synced_at.astimezone(sync_timezone)
+    last_local = last_attempt.astimezone(sync_timezone)
     return not (last_local.date() == local_now.date() and last_local.time() >= scheduled_time)
 
 
-def _fetch_public_csv_rows(config):
+def _fetch_public_csv_rows(config, known_revision=''):
     query = {'format': 'csv'}
     if config.gid:
         query['gid'] = config.gid
     url = f"https://docs.google.com/spreadsheets/d/{config.spreadsheet_id}/export?{urlencode(query)}"
-    request = Request(url, headers={'User-Agent': 'CareerHub Google Sheets Sync'})
+    headers = {'User-Agent': 'CareerHub Google Sheets Sync'}
+    if known_revision.startswith('etag:'):
+        headers['If-None-Match'] = known_revision[len('etag:'):]
+    request = Request(url, headers=headers)
     try:
         with urlopen(request, timeout=15) as response:
+            etag = response.headers.get('ETag') or ''
             data = response.read().decode('utf-8-sig')
     except HTTPError as exc:
+        if exc.code == 304 and 'If-None-Match' in headers:
+            config._fetched_revision = known_revision
+            return None
         raise ValidationError(f'Google returned HTTP {exc.code}.')
     except URLError as exc:
         raise ValidationError(str(exc.reason))
 
     if '<html' in data[:200].lower():
         raise ValidationError('Google returned an HTML page instead of CSV.')
+    if etag:
+        config._fetched_revision = f'etag:{etag}'
+    else:
+        config._fetched_revision = f"sha256:{hashlib.sha256(data.encode('utf-8')).hexdigest()}"
     return list(csv.reader(io.StringIO(data)))
 
 
+def _probe_drive_revision(config):
+    """Return the spreadsheet's Drive version and ``modifiedTime``, or ``None`` if unavailable."""
+    # Public CSV reads detect changes with a conditional GET instead.
+    if config.fetch_strategy == GoogleSheetSyncConfig.FETCH_PUBLIC_CSV:
+        return None
+
+    loaders = []
+    if config.fetch_strategy in ('', GoogleSheetSyncConfig.FETCH_OAUTH):
+        loaders.append(lambda: _google_oauth_service(config, 'drive', 'v3', require_drive_scope=True))
+    if config.fetch_strategy in ('', GoogleSheetSyncConfig.FETCH_SERVICE_ACCOUNT):
+        loaders.append(lambda: _service_account_service('drive', 'v3', silent=True))
+
+    for load_service in loaders:
+        try:
+            service = load_service()
+            if service is None:
+                continue
+            metadata = service.files().get(
+                fileId=config.spreadsheet_id,
+                fields='version,modifiedTime',
+                supportsAllDrives=True,
+            ).execute()
+        except Exception:
+            continue
+        if metadata.get('version') or metadata.get('modifiedTime'):
+            return f"drive:{metadata.get('version', '')}:{metadata.get('modifiedTime', '')}"
+    return None
+
+
 def _fetch_google_api_rows(config):
-    info = _load_service_account_info()
-    try:
-        from google.oauth2 import service_account
-        from googleapiclient.discovery import build
-    except ImportError as exc:
-        raise ValidationError('Install google-api-python-client and google-auth to read private sheets.') from exc
+    return _read_sheet_values(_service_account_service('sheets', 'v4'), config)
 
-    credentials = service_account.Credentials.from_service_account_info(
-        info,
-        scopes=['https://www.googleapis.com/auth/spreadsheets.readonly'],
-    )
-    service = build('sheets', 'v4', credentials=credentials, cache_discovery=False)
+
+def _fetch_google_oauth_rows(config):
+    service = _google_oauth_service(config, 'sheets', 'v4')
+    if service is None:
+        raise ValidationError('Google is not connected.')
+    return _read_sheet_values(service, config)
+
+
+def _read_sheet_values(service, config):
     range_name = f"'{config.worksheet_name}'" if config.worksheet_name else 'A:ZZ'
     response = service.spreadsheets().values().get(
         spreadsheetId=config.spreadsheet_id,
@@ -465,25 +901,35 @@ def _fetch_google_api_rows(config):
     return response.get('values', [])
 
 
-def _fetch_google_oauth_rows(config):
-    from .google_oauth import get_google_oauth_credentials
+def _google_oauth_service(config, api, version, require_drive_scope=False):
+    from .google_oauth import GOOGLE_DRIVE_METADATA_READONLY_SCOPE, get_google_oauth_credentials, get_google_service
 
     credentials = get_google_oauth_credentials(config.user)
     if not credentials:
-        raise ValidationError('Google is not connected.')
+        return None
+    if require_drive_scope and GOOGLE_DRIVE_METADATA_READONLY_SCOPE not in (credentials.scopes or []):
+        return None
+    return get_google_service(api, version, credentials, (f'oauth:{config.user_id}', credentials.token))
+
+
+def _service_account_service(api, version, silent=False):
+    from .google_oauth import GOOGLE_DRIVE_METADATA_READONLY_SCOPE, GOOGLE_SHEETS_READONLY_SCOPE, get_google_service
+
+    info = _load_service_account_info(silent=silent)
+    if not info:
+        return None
     try:
-        from googleapiclient.discovery import build
+        from google.oauth2 import service_account
     except ImportError as exc:
-        raise ValidationError('Install google-api-python-client to read private sheets.') from exc
+        raise ValidationError('Install google-api-python-client and google-auth to read private sheets.') from exc
 
-    service = build('sheets', 'v4', credentials=credentials, cache_discovery=False)
-    range_name = f"'{config.worksheet_name}'" if config.worksheet_name else 'A:ZZ'
-    response = service.spreadsheets().values().get(
-        spreadsheetId=config.spreadsheet_id,
-        range=range_name,
-        majorDimension='ROWS',
-    ).execute()
-    return response.get('values', [])
+    credentials = service_account.Credentials.from_service_account_info(
+        info,
+        scopes=[GOOGLE_SHEETS_READONLY_SCOPE, GOOGLE_DRIVE_METADATA_READONLY_SCOPE],
+    )
+    # Service account clients refresh their own token, so the key only tracks the key pair.
+    cache_key = (f"service-account:{info.get('client_email', '')}", info.get('private_key_id', ''))
+    return get_google_service(api, version, credentials, cache_key)
 
 
 def _load_service_account_info(silent=False):
@@ -514,12 +960,19 @@ def _sync_row(config, row, row_number, mapping, force=False):
     return action
 
 
-def _sync_row_with_history(config, row, row_number, mapping, force=False, duplicate_resolution='merge'):
+def _row_hash(payload):
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def _sync_row_with_history(config, row, row_number, mapping, force=False, duplicate_resolution='merge', tracked_rows=None):
     payload = _mapped_payload(row, mapping)
     external_key = _external_key(payload, row_number)
-    row_hash = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    row_hash = _row_hash(payload)
     payload['_user'] = config.user
-    tracked = GoogleSheetSyncRow.objects.filter(config=config, external_key=external_key).first()
+    if tracked_rows is None:
+        tracked = GoogleSheetSyncRow.objects.filter(config=config, external_key=external_key).first()
+    else:
+        tracked = tracked_rows.get(external_key)
     if tracked and tracked.row_hash == row_hash and not force and not _needs_application_date_backfill(config, payload, tracked):
         return 'skipped', [_history_entry('skipped', row_number, payload, 'No changes detected since the last sync.')]
 
@@ -539,7 +992,7 @@ def _sync_row_with_history(config, row, row_number, mapping, force=False, duplic
             )
             local_type = 'career.Application'
 
-        GoogleSheetSyncRow.objects.update_or_create(
+        tracked_row, _ = GoogleSheetSyncRow.objects.update_or_create(
             config=config,
             external_key=external_key,
             defaults={
@@ -549,17 +1002,255 @@ def _sync_row_with_history(config, row, row_number, mapping, force=False, duplic
                 'local_object_id': instance.id,
             },
         )
+    if tracked_rows is not None:
+        tracked_rows[external_key] = tracked_row
     action = 'created' if created else 'updated'
     history = _history_for_sync_result(action, row_number, payload, instance, history_context)
     return action, history, diff
 
 
-def _review_application_row(config, row, row_number, mapping, seen_identities, force=False):
+class _ApplicationSyncBatch:
+    """In-memory diff of application rows against preloaded companies and applications.
+
+    Rows are applied to Python objects as they are read; ``flush`` writes the
+    pending companies, applications and tracked rows with bulk queries in one
+    transaction and returns the per-row results.
+    """
+
+    def __init__(self, config, mapping, company_names):
+        self.config = config
+        self.user = config.user
+        self.strategies = getattr(config, 'overwrite_strategies', {}) or {}
+        self.identity_fields = [field for field in APPLICATION_IDENTITY_FIELDS if mapping.get(field)]
+        self.settings_profile, _ = UserSettings.objects.get_or_create(user=self.user)
+        self.saved_stages = list(self.settings_profile.application_stages or [])
+        self.tracked = {row.external_key: row for row in GoogleSheetSyncRow.objects.filter(config=config)}
+        self.companies = {company.name: company for company in Company.objects.filter(user=self.user)}
+
+        tracked_ids = [row.local_object_id for row in self.tracked.values()]
+        self.applications = {}
+        self.identities = {}
+        for application in (
+            Application.objects
+            .filter(Q(id__in=tracked_ids) | Q(company__name__in=company_names), user=self.user)
+            .select_related('company')
+            .order_by('id')
+        ):
+            self.applications[application.id] = application
+            self.identities.setdefault(self._identity(application.company.name, application.role_title, vars(application)), application)
+        # Applications linked during this sync, by external key, before they have ids.
+        self.linked = {}
+        self._reset_pending()
+
+    def _reset_pending(self):
+        self.new_companies = []
+        self.new_applications = []
+        self.dirty_applications = {}
+        self.new_rows = []
+        self.dirty_rows = []
+        self.row_links = []
+        self.results = []
+
+    def __len__(self):
+        return len(self.results)
+
+    def _identity(self, company_name, role_title, values):
+        return (company_name, role_title, *(values.get(field) for field in self.identity_fields))
+
+    def _tracked_application(self, tracked, external_key):
+        if external_key in self.linked:
+            return self.linked[external_key]
+        return self.applications.get(tracked.local_object_id) if tracked else None
+
+    def _company(self, name):
+        company = self.companies.get(name)
+        if company is None:
+            company = Company(user=self.user, name=name)
+            self.companies[name] = company
+            self.new_companies.append(company)
+        return company
+
+    def sync_row(self, row, row_number, mapping, force=False):
+        payload = _mapped_payload(row, mapping)
+        external_key = _external_key(payload, row_number)
+        row_hash = _row_hash(payload)
+        payload['_user'] = self.user
+        tracked = self.tracked.get(external_key)
+        tracked_application = self._tracked_application(tracked, external_key)
+        needs_backfill = bool(tracked_application and not payload.get('date_applied') and not tracked_application.date_applied)
+        if tracked and tracked.row_hash == row_hash and not force and not needs_backfill:
+            history = [_history_entry('skipped', row_number, payload, 'No changes detected since the last sync.')]
+            self.results.append(('skipped', row_number, payload, None, history, {}))
+            return
+
+        company_name = payload.get('company_name') or payload.get('company') or ''
+        role_title = payload.get('role_title') or ''
+        if not company_name or not role_title:
+            raise ValidationError('Application rows need Company and Role values.')
+
+        context = {
+            'row_number': row_number,
+            'tracked': bool(tracked),
+            'date_backfilled': False,
+            'matched_duplicate': False,
+            'duplicate_resolution': 'merge',
+            'created_stages': [],
+            'before': None,
+            'changes': {},
+        }
+        tracked_created_on = timezone.localtime(tracked.created_at).date() if tracked and tracked.created_at else timezone.localdate()
+        application = tracked_application
+        if not tracked:
+            preview_defaults = _application_defaults_from_payload(payload, apply_create_defaults=True, ensure_stages=False)
+            if company_name in self.companies:
+                application = self.identities.get(self._identity(company_name, role_title, preview_defaults))
+                context['matched_duplicate'] = bool(application)
+        if application:
+            context['before'] = _application_snapshot(application)
+            preview_defaults = _application_defaults_from_payload(
+                payload,
+                apply_create_defaults=tracked is None,
+                ensure_stages=False,
+            )
+            if tracked and not payload.get('date_applied') and not application.date_applied:
+                preview_defaults['date_applied'] = tracked_created_on
+                context['date_backfilled'] = True
+            context['changes'] = _application_changes(application, company_name, role_title, preview_defaults)
+
+        defaults = _application_defaults_from_payload(
+            payload,
+            apply_create_defaults=tracked is None,
+            stage_events=context['created_stages'],
+            settings_profile=self.settings_profile,
+        )
+        company = self._company(company_name)
+        if not tracked_application:
+            application = self.identities.get(self._identity(company_name, role_title, defaults))
+        created = application is None
+        if created:
+            application = Application(user=self.user, company=company, role_title=role_title)
+            self.new_applications.append(application)
+        if not payload.get('date_applied') and not application.date_applied:
+            defaults['date_applied'] = tracked_created_on
+
+        previous_identity = self._identity(application.company.name, application.role_title, vars(application))
+        diff = _apply_field_updates(application, company, role_title, defaults, self.strategies, is_new=created)
+        if diff and application.pk:
+            self.dirty_applications[application.pk] = application
+        identity = self._identity(company.name, application.role_title, vars(application))
+        if identity != previous_identity and self.identities.get(previous_identity) is application:
+            del self.identities[previous_identity]
+        self.identities.setdefault(identity, application)
+
+        if tracked is None:
+            tracked = GoogleSheetSyncRow(config=self.config, external_key=external_key)
+            self.tracked[external_key] = tracked
+            self.new_rows.append(tracked)
+        elif tracked.pk:
+            self.dirty_rows.append(tracked)
+        tracked.row_number = row_number
+        tracked.row_hash = row_hash
+        tracked.local_object_type = 'career.Application'
+        self.row_links.append((tracked, application))
+        self.linked[external_key] = application
+
+        self.results.append(('created' if created else 'updated', row_number, payload, application, context, diff))
+
+    def has_writes(self):
+        return any(action != 'skipped' for action, *_rest in self.results)
+
+    def flush(self):
+        if not self.results:
+            return []
+        now = timezone.now()
+        with transaction.atomic():
+            if self.new_companies:
+                Company.objects.bulk_create(self.new_companies)
+            if self.settings_profile.application_stages != self.saved_stages:
+                self.settings_profile.save(update_fields=['application_stages', 'updated_at'])
+                self.saved_stages = list(self.settings_profile.application_stages or [])
+            if self.new_applications:
+                Application.objects.bulk_create(self.new_applications)
+            if self.dirty_applications:
+                for application in self.dirty_applications.values():
+                    application.updated_at = now
+                Application.objects.bulk_update(self.dirty_applications.values(), APPLICATION_SYNC_FIELDS)
+            for tracked, application in self.row_links:
+                tracked.local_object_id = application.id
+            if self.new_rows:
+                GoogleSheetSyncRow.objects.bulk_create(self.new_rows)
+            if self.dirty_rows:
+                for tracked in self.dirty_rows:
+                    tracked.last_seen_at = now
+                GoogleSheetSyncRow.objects.bulk_update(
+                    {id(tracked): tracked for tracked in self.dirty_rows}.values(),
+                    ['row_number', 'row_hash', 'local_object_type', 'local_object_id', 'last_seen_at'],
+                )
+        for application in self.new_applications:
+            self.applications[application.id] = application
+
+        stages = self.settings_profile.application_stages
+        results = [
+            (
+                action,
+                row_number,
+                context if action == 'skipped' else _history_for_sync_result(
+                    action, row_number, payload, application, context, stages=stages
+                ),
+                diff,
+                application,
+            )
+            for action, row_number, payload, application, context, diff in self.results
+        ]
+        self._reset_pending()
+        return results
+
+
+def _sync_application_rows(config, sheet_rows, mapping, result, record, force=False):
+    company_columns = [mapping.get('company_name'), mapping.get('company')]
+    company_names = {row.get(column) for _row_number, row in sheet_rows for column in company_columns if column}
+    company_names.discard('')
+    batch = _ApplicationSyncBatch(config, mapping, company_names)
+    wrote = False
+
+    def flush():
+        nonlocal batch, wrote
+        pending_rows = [row_number for _action, row_number, *_rest in batch.results]
+        has_writes = batch.has_writes()
+        try:
+            written = batch.flush()
+        except Exception as exc:
+            result['errors'].extend({'row': row_number, 'error': str(exc)} for row_number in pending_rows)
+            # The in-memory state may reference objects that were never written.
+            batch = _ApplicationSyncBatch(config, mapping, company_names)
+            return
+        wrote = wrote or has_writes
+        for action, row_number, history, diff, application in written:
+            record(action, row_number, history, diff, application)
+
+    for row_number, row in sheet_rows:
+        try:
+            batch.sync_row(row, row_number, mapping, force=force)
+        except Exception as exc:
+            result['errors'].append({'row': row_number, 'error': str(exc)})
+            continue
+        if len(batch) >= SYNC_WRITE_CHUNK_SIZE:
+            flush()
+    flush()
+    if wrote:
+        # Bulk writes skip the Application post_save hook that busts dashboard caches.
+        bump_widget_generation(config.user_id)
+
+
+def _review_application_row(config, row, row_number, mapping, seen_identities, force=False, tracked_rows=None):
     payload = _mapped_payload(row, mapping)
     external_key = _external_key(payload, row_number)
-    row_hash = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    row_hash = _row_hash(payload)
     payload['_user'] = config.user
-    tracked = GoogleSheetSyncRow.objects.filter(config=config, external_key=external_key).first()
+    if tracked_rows is None:
+        tracked = GoogleSheetSyncRow.objects.filter(config=config, external_key=external_key).first()
+    else:
+        tracked = tracked_rows.get(external_key)
     if tracked and tracked.row_hash == row_hash and not force and not _needs_application_date_backfill(config, payload, tracked):
         return None
 
@@ -784,7 +1475,7 @@ def _application_snapshot(application):
     }
 
 
-def _history_for_sync_result(action, row_number, payload, instance, context):
+def _history_for_sync_result(action, row_number, payload, instance, context, stages=None):
     if not isinstance(instance, Application):
         return [_history_entry(action, row_number, payload, f'{instance.name} synced.')]
 
@@ -823,8 +1514,8 @@ def _history_for_sync_result(action, row_number, payload, instance, context):
 
     for field, change in (context.get('changes') or {}).items():
         if field == 'status':
-            before = _application_stage_label(instance.user, change.get('from'))
-            after = _application_stage_label(instance.user, change.get('to'))
+            before = _application_stage_label(instance.user_id, change.get('from'), stages=stages)
+            after = _application_stage_label(instance.user_id, change.get('to'), stages=stages)
             history.append(_history_entry(
                 'status_changed',
                 row_number,
@@ -896,11 +1587,13 @@ def _history_entry(kind, row_number, payload, message, field='', before='', afte
     }
 
 
-def _application_stage_label(user, key):
+def _application_stage_label(user_id, key, stages=None):
     if not key:
         return 'blank'
-    settings_profile = UserSettings.objects.filter(user=user).first()
-    stages = (settings_profile.application_stages if settings_profile and settings_profile.application_stages else DEFAULT_APPLICATION_STAGES)
+    if stages is None:
+        settings_profile = UserSettings.objects.filter(user_id=user_id).first()
+        stages = settings_profile.application_stages if settings_profile else None
+    stages = stages or DEFAULT_APPLICATION_STAGES
     stage = next((candidate for candidate in stages if candidate.get('key') == key), None)
     return stage.get('label') if stage else _title_status(str(key).replace('_', ' ').lower())
 
@@ -1031,7 +1724,13 @@ def _find_existing_application_by_sheet_identity(config, company, role_title, pa
     return Application.objects.filter(**filters).order_by('id').first()
 
 
-def _application_defaults_from_payload(payload, apply_create_defaults=False, ensure_stages=True, stage_events=None):
+def _application_defaults_from_payload(
+    payload,
+    apply_create_defaults=False,
+    ensure_stages=True,
+    stage_events=None,
+    settings_profile=None,
+):
     defaults = {}
     if apply_create_defaults:
         defaults['status'] = 'APPLIED'
@@ -1043,6 +1742,7 @@ def _application_defaults_from_payload(payload, apply_create_defaults=False, ens
             payload.get('_user'),
             ensure_stage=ensure_stages,
             stage_events=stage_events,
+            settings_profile=settings_profile,
         )
     if 'job_link' in payload:
         defaults['job_link'] = payload.get('job_link') or None
@@ -1061,7 +1761,7 @@ def _application_defaults_from_payload(payload, apply_create_defaults=False, ens
     return defaults
 
 
-def _normalize_application_status(value, user, ensure_stage=True, stage_events=None):
+def _normalize_application_status(value, user, ensure_stage=True, stage_events=None, settings_profile=None):
     cleaned = _clean_status_text(value)
     if not cleaned:
         return 'APPLIED'
@@ -1071,19 +1771,35 @@ def _normalize_application_status(value, user, ensure_stage=True, stage_events=N
         round_number = int(round_match.group(1))
         key = f'ROUND_{round_number}'
         if ensure_stage:
-            _ensure_application_stage(user, key, _round_label(round_number), f'R{round_number}', _round_tone(round_number), stage_events=stage_events)
+            _ensure_application_stage(
+                user,
+                key,
+                _round_label(round_number),
+                f'R{round_number}',
+                _round_tone(round_number),
+                stage_events=stage_events,
+                settings_profile=settings_profile,
+            )
         return key
 
     alias_key = STATUS_ALIASES.get(cleaned)
     if alias_key:
         if ensure_stage:
-            _ensure_known_stage(user, alias_key, stage_events=stage_events)
+            _ensure_known_stage(user, alias_key, stage_events=stage_events, settings_profile=settings_profile)
         return alias_key
 
     key = re.sub(r'[^A-Z0-9]+', '_', cleaned.upper()).strip('_') or 'APPLIED'
     label = _title_status(cleaned)
     if ensure_stage:
-        _ensure_application_stage(user, key, label, _short_label(label), _custom_stage_tone(user), stage_events=stage_events)
+        _ensure_application_stage(
+            user,
+            key,
+            label,
+            _short_label(label),
+            _custom_stage_tone(user, settings_profile=settings_profile),
+            stage_events=stage_events,
+            settings_profile=settings_profile,
+        )
     return key
 
 
@@ -1094,26 +1810,40 @@ def _clean_status_text(value):
     return text.strip().lower()
 
 
-def _ensure_known_stage(user, key, stage_events=None):
+def _ensure_known_stage(user, key, stage_events=None, settings_profile=None):
     known = {stage['key']: stage for stage in DEFAULT_APPLICATION_STAGES}
     stage = known.get(key)
     if stage:
-        _ensure_application_stage(user, stage['key'], stage['label'], stage['shortLabel'], stage['tone'], stage_events=stage_events)
+        _ensure_application_stage(
+            user,
+            stage['key'],
+            stage['label'],
+            stage['shortLabel'],
+            stage['tone'],
+            stage_events=stage_events,
+            settings_profile=settings_profile,
+        )
 
 
-def _ensure_application_stage(user, key, label, short_label, tone, stage_events=None):
+def _ensure_application_stage(user, key, label, short_label, tone, stage_events=None, settings_profile=None):
+    # A preloaded ``settings_profile`` is only updated in memory; the batch
+    # sync saves it once per chunk.
     if not user:
         return
-    settings_profile, _ = UserSettings.objects.get_or_create(user=user)
+    persist = settings_profile is None
+    if persist:
+        settings_profile, _ = UserSettings.objects.get_or_create(user=user)
     stages = settings_profile.application_stages or [stage.copy() for stage in DEFAULT_APPLICATION_STAGES]
     if any(stage.get('key') == key for stage in stages):
         if not settings_profile.application_stages:
             settings_profile.application_stages = stages
-            settings_profile.save(update_fields=['application_stages', 'updated_at'])
+            if persist:
+                settings_profile.save(update_fields=['application_stages', 'updated_at'])
         return
     stages.append({'key': key, 'label': label, 'shortLabel': short_label, 'tone': tone})
     settings_profile.application_stages = stages
-    settings_profile.save(update_fields=['application_stages', 'updated_at'])
+    if persist:
+        settings_profile.save(update_fields=['application_stages', 'updated_at'])
     if stage_events is not None:
         stage_events.append({'key': key, 'label': label, 'shortLabel': short_label, 'tone': tone})
 
@@ -1130,10 +1860,11 @@ def _round_tone(round_number):
     return ROUND_TONES[min(max(round_number, 1), len(ROUND_TONES)) - 1]
 
 
-def _custom_stage_tone(user):
+def _custom_stage_tone(user, settings_profile=None):
     if not user:
         return CUSTOM_STAGE_TONES[0]
-    settings_profile = UserSettings.objects.filter(user=user).first()
+    if settings_profile is None:
+        settings_profile = UserSettings.objects.filter(user=user).first()
     existing_count = len(settings_profile.application_stages or []) if settings_profile else 0
     return CUSTOM_STAGE_TONES[existing_count % len(CUSTOM_STAGE_TONES)]
 
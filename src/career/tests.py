@@ -1,18 +1,38 @@
 import json
-from datetime import datetime, time, timezone as dt_timezone
+import zipfile
+from datetime import datetime, time, timedelta, timezone as dt_timezone
 from io import BytesIO
+from time import monotonic
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django.core.files.uploadedfile import SimpleUploadedFile
 from PIL import Image
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.test import APITestCase
 
+from availability.ai_provider import encrypt_ai_provider_secret
+from availability.availability_engine import get_day_states
 from availability.models import UserSettings
-from .models import Application, ApplicationTimelineEntry, Company, Document, Experience, GoogleSheetSyncConfig, GoogleSheetSyncRow, Offer
+from .models import Application, ApplicationTimelineEntry, Company, Document, Experience, GoogleOAuthCredential, GoogleSheetImportReview, GoogleSheetSyncChange, GoogleSheetSyncConfig, GoogleSheetSyncRow, GoogleSheetSyncRun, Offer
 from .serializers import ExperienceSerializer
-from .services.google_sheets import _is_sync_config_due, _upsert_application, apply_import_review, build_import_review, sync_google_sheet
+from .services.google_oauth import GOOGLE_OAUTH_SCOPES, get_google_oauth_credentials
+from .services.google_sheets import (
+    SYNC_START_CUTOFF_SECONDS,
+    _is_sync_config_due,
+    _upsert_application,
+    apply_import_review,
+    build_import_review,
+    compact_google_sheet_sync_runs,
+    fetch_sheet_rows,
+    rollback_sync_run,
+    sync_enabled_google_sheets,
+    sync_google_sheet,
+)
 from .services.timeline_analytics import build_application_timeline_analytics
 
 
@@ -192,12 +212,18 @@ class AIArtifactAPITests(APITestCase):
 
         export_response = self.client.get('/api/user-settings/account-export/', {'fmt': 'json'})
         self.assertEqual(export_response.status_code, status.HTTP_200_OK)
-        payload = json.loads(export_response.content.decode('utf-8'))
+        payload = json.loads(export_response.getvalue().decode('utf-8'))
         artifacts = payload['career']['ai_artifacts']
         self.assertEqual(len(artifacts), 1)
         self.assertEqual(artifacts[0]['client_id'], 'letter-export')
         self.assertEqual(artifacts[0]['payload']['coverLetter'], 'Dear team...')
 
+        zip_response = self.client.get('/api/user-settings/account-export/', {'fmt': 'zip'})
+        self.assertTrue(zip_response.streaming)
+        with zipfile.ZipFile(BytesIO(zip_response.getvalue())) as archive:
+            zipped = json.loads(archive.read('careerhub-account-export.json'))
+        self.assertEqual(zipped['career'], payload['career'])
+
         backup_file = SimpleUploadedFile(
             'careerhub-account-export.json',
             json.dumps(payload).encode('utf-8'),
@@ -367,7 +393,7 @@ class OfferDecisionSnapshotAPITests(APITestCase):
 
         export_response = self.client.get("/api/user-settings/account-export/", {"fmt": "json"})
         self.assertEqual(export_response.status_code, status.HTTP_200_OK)
-        payload = json.loads(export_response.content.decode("utf-8"))
+        payload = json.loads(export_response.getvalue().decode("utf-8"))
         snapshots = payload["career"]["offer_decision_snapshots"]
         self.assertEqual(len(snapshots), 1)
         self.assertEqual(snapshots[0]["offer_company"], "Acme")
@@ -651,6 +677,197 @@ class GoogleSheetApplicationStatusSyncTests(APITestCase):
             any(entry['type'] == 'date_applied_backfilled' for entry in result['history'])
         )
 
+    @patch("career.services.google_sheets._probe_drive_revision")
+    @patch("career.services.google_sheets.fetch_sheet_rows")
+    def test_unchanged_drive_revision_skips_download_and_row_loop(self, mock_fetch_sheet_rows, mock_probe):
+        mock_fetch_sheet_rows.return_value = [
+            ['Company', 'Role'],
+            ['Stripe', 'Software Engineer'],
+        ]
+        mock_probe.return_value = 'drive:12:2026-01-02T03:04:05.000Z'
+        config = GoogleSheetSyncConfig.objects.create(
+            user=self.user,
+            name='Applications',
+            sheet_url='https://docs.google.com/spreadsheets/d/test/edit',
+            spreadsheet_id='test',
+            target_type=GoogleSheetSyncConfig.TARGET_APPLICATIONS,
+            column_mapping={'company_name': 'Company', 'role_title': 'Role'},
+        )
+
+        self.assertEqual(sync_google_sheet(config)['created'], 1)
+        result = sync_google_sheet(config)
+
+        self.assertTrue(result['unchanged'])
+        self.assertEqual(mock_fetch_sheet_rows.call_count, 1)
+        self.assertEqual(config.runs.first().status, GoogleSheetSyncRun.STATUS_UNCHANGED)
+
+        config.column_mapping = {'company_name': 'Company', 'role_title': 'Role', 'notes': 'Notes'}
+        config.save(update_fields=['column_mapping'])
+        self.assertNotIn('unchanged', sync_google_sheet(config))
+        self.assertNotIn('unchanged', sync_google_sheet(config, force=True))
+        self.assertEqual(mock_fetch_sheet_rows.call_count, 3)
+
+    @patch("career.services.google_sheets.fetch_sheet_rows")
+    def test_sync_leaves_other_users_cached_availability_in_place(self, mock_fetch_sheet_rows):
+        mock_fetch_sheet_rows.return_value = [['Company', 'Role'], ['Stripe', 'Software Engineer']]
+        config = GoogleSheetSyncConfig.objects.create(
+            user=self.user,
+            name='Applications',
+            sheet_url='https://docs.google.com/spreadsheets/d/test/edit',
+            spreadsheet_id='test',
+            target_type=GoogleSheetSyncConfig.TARGET_APPLICATIONS,
+            column_mapping={'company_name': 'Company', 'role_title': 'Role'},
+        )
+        other = get_user_model().objects.create_user(username='other-host', email='other-host@example.com', password='x')
+        today = timezone.localdate()
+        get_day_states(other, [today])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(sync_google_sheet(config)['created'], 1)
+
+        with patch('availability.availability_engine._build_day_states') as rebuild:
+            get_day_states(other, [today])
+        rebuild.assert_not_called()
+
+    @patch("career.services.google_sheets.SYNC_WRITE_CHUNK_SIZE", 2)
+    @patch("career.services.google_sheets.fetch_sheet_rows")
+    def test_sync_stops_at_the_deadline_and_resumes_from_the_run_cursor(self, mock_fetch_sheet_rows):
+        mock_fetch_sheet_rows.return_value = [
+            ['Company', 'Role'],
+            ['Stripe', 'Software Engineer'],
+            ['Plaid', 'Software Engineer'],
+            ['', ''],
+            ['Ramp', 'Backend Engineer'],
+            ['Figma', 'Frontend Engineer'],
+        ]
+        config = GoogleSheetSyncConfig.objects.create(
+            user=self.user,
+            name='Applications',
+            sheet_url='https://docs.google.com/spreadsheets/d/test/edit',
+            spreadsheet_id='test',
+            target_type=GoogleSheetSyncConfig.TARGET_APPLICATIONS,
+            column_mapping={'company_name': 'Company', 'role_title': 'Role'},
+        )
+
+        first = sync_google_sheet(config, deadline=monotonic() - 1)
+
+        run = config.runs.get()
+        self.assertTrue(first['partial'])
+        self.assertEqual(first['created'], 2)
+        self.assertEqual(run.status, GoogleSheetSyncRun.STATUS_PARTIAL)
+        self.assertEqual(run.cursor, 3)
+
+        second = sync_google_sheet(config)
+
+        run.refresh_from_db()
+        self.assertNotIn('partial', second)
+        self.assertEqual(second['created'], 4)
+        self.assertEqual(second['skipped'], 1)
+        self.assertEqual(run.status, GoogleSheetSyncRun.STATUS_SUCCESS)
+        self.assertEqual(config.runs.count(), 1)
+        self.assertEqual(run.change_count, 4)
+        self.assertEqual(Application.objects.filter(user=self.user).count(), 4)
+
+    @patch("career.services.google_sheets.SYNC_WRITE_CHUNK_SIZE", 2)
+    @patch("career.services.google_sheets.fetch_sheet_rows")
+    def test_failed_resume_ends_the_run_instead_of_leaving_it_resumable(self, mock_fetch_sheet_rows):
+        mock_fetch_sheet_rows.return_value = [
+            ['Company', 'Role'],
+            ['Stripe', 'Software Engineer'],
+            ['Plaid', 'Software Engineer'],
+            ['Ramp', 'Backend Engineer'],
+        ]
+        config = GoogleSheetSyncConfig.objects.create(
+            user=self.user,
+            name='Applications',
+            sheet_url='https://docs.google.com/spreadsheets/d/test/edit',
+            spreadsheet_id='test',
+            target_type=GoogleSheetSyncConfig.TARGET_APPLICATIONS,
+            column_mapping={'company_name': 'Company', 'role_title': 'Role'},
+        )
+        sync_google_sheet(config, deadline=monotonic() - 1)
+        run = config.runs.get()
+
+        mock_fetch_sheet_rows.side_effect = ValidationError('The sheet could not be read.')
+        with self.assertRaises(ValidationError):
+            sync_google_sheet(config)
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, GoogleSheetSyncRun.STATUS_ERROR)
+        self.assertIsNotNone(run.completed_at)
+        mock_fetch_sheet_rows.side_effect = None
+        sync_google_sheet(config)
+        self.assertEqual(config.runs.count(), 2)
+
+    @patch("career.services.google_sheets.SYNC_WRITE_CHUNK_SIZE", 2)
+    @patch("career.services.google_sheets.fetch_sheet_rows")
+    def test_scheduled_cron_ticks_resume_partial_runs_before_the_config_is_due(self, mock_fetch_sheet_rows):
+        mock_fetch_sheet_rows.return_value = [
+            ['Company', 'Role'],
+            ['Stripe', 'Software Engineer'],
+            ['Plaid', 'Software Engineer'],
+            ['Ramp', 'Backend Engineer'],
+        ]
+        config = GoogleSheetSyncConfig.objects.create(
+            user=self.user,
+            name='Applications',
+            sheet_url='https://docs.google.com/spreadsheets/d/test/edit',
+            spreadsheet_id='test',
+            target_type=GoogleSheetSyncConfig.TARGET_APPLICATIONS,
+            column_mapping={'company_name': 'Company', 'role_title': 'Role'},
+        )
+        sync_google_sheet(config, deadline=monotonic() - 1)
+        config.refresh_from_db()
+        self.assertFalse(_is_sync_config_due(config))
+
+        summary = sync_enabled_google_sheets(only_due=True)
+
+        self.assertEqual((summary['skipped'], summary['created']), (0, 3))
+        self.assertEqual(config.runs.get().status, GoogleSheetSyncRun.STATUS_SUCCESS)
+        self.assertEqual(sync_enabled_google_sheets(only_due=True)['skipped'], 1)
+
+    @patch("career.services.google_sheets._fetch_google_api_rows")
+    @patch("career.services.google_sheets._fetch_public_csv_rows")
+    @patch("career.services.google_sheets._fetch_google_oauth_rows")
+    def test_fetch_remembers_the_strategy_that_worked(self, mock_oauth, mock_csv, mock_service_account):
+        mock_oauth.side_effect = ValidationError('Google is not connected.')
+        mock_csv.return_value = [['Company', 'Role']]
+        config = GoogleSheetSyncConfig.objects.create(
+            user=self.user,
+            name='Applications',
+            sheet_url='https://docs.google.com/spreadsheets/d/test/edit',
+            spreadsheet_id='test',
+            target_type=GoogleSheetSyncConfig.TARGET_APPLICATIONS,
+        )
+
+        fetch_sheet_rows(config)
+        config.refresh_from_db()
+        self.assertEqual(config.fetch_strategy, GoogleSheetSyncConfig.FETCH_PUBLIC_CSV)
+
+        fetch_sheet_rows(config)
+        self.assertEqual(mock_oauth.call_count, 1)
+        self.assertEqual(mock_csv.call_count, 2)
+        mock_service_account.assert_not_called()
+
+    @patch("career.services.google_oauth._refresh_and_store_access_token")
+    def test_oauth_credentials_reuse_cached_access_token_until_expiry(self, mock_refresh):
+        credential = GoogleOAuthCredential.objects.create(
+            user=self.user,
+            scopes=GOOGLE_OAUTH_SCOPES,
+            refresh_token_encrypted=encrypt_ai_provider_secret('refresh-token'),
+            access_token_encrypted=encrypt_ai_provider_secret('access-token'),
+            access_token_expires_at=timezone.now() + timedelta(minutes=30),
+        )
+
+        credentials = get_google_oauth_credentials(self.user)
+        self.assertEqual(credentials.token, 'access-token')
+        mock_refresh.assert_not_called()
+
+        credential.access_token_expires_at = timezone.now() + timedelta(minutes=1)
+        credential.save(update_fields=['access_token_expires_at'])
+        get_google_oauth_credentials(self.user)
+        mock_refresh.assert_called_once()
+
     def test_sync_config_due_respects_local_time_and_same_day_sync(self):
         config = GoogleSheetSyncConfig.objects.create(
             user=self.user,
@@ -672,6 +889,63 @@ class GoogleSheetApplicationStatusSyncTests(APITestCase):
         self.assertFalse(_is_sync_config_due(config, now=datetime(2026, 5, 2, 18, 30, tzinfo=dt_timezone.utc)))
         self.assertTrue(_is_sync_config_due(config, now=datetime(2026, 5, 3, 17, 30, tzinfo=dt_timezone.utc)))
 
+    @patch("career.services.google_sheets.fetch_sheet_rows")
+    def test_failed_syncs_keep_the_last_successful_sync_time(self, mock_fetch_sheet_rows):
+        synced_at = timezone.now() - timedelta(days=2)
+        config = GoogleSheetSyncConfig.objects.create(
+            user=self.user,
+            name='Applications',
+            sheet_url='https://docs.google.com/spreadsheets/d/test/edit',
+            spreadsheet_id='test',
+            target_type=GoogleSheetSyncConfig.TARGET_APPLICATIONS,
+            sync_time=time(0, 0),
+            sync_timezone='UTC',
+            last_synced_at=synced_at,
+        )
+        mock_fetch_sheet_rows.side_effect = ValidationError('The sheet could not be read.')
+
+        summary = sync_enabled_google_sheets(only_due=True)
+
+        config.refresh_from_db()
+        self.assertEqual(len(summary['errors']), 1)
+        self.assertEqual(config.last_synced_at, synced_at)
+        self.assertEqual(config.last_status, GoogleSheetSyncConfig.STATUS_ERROR)
+        self.assertIn('could not be read', config.last_error)
+        # The failed attempt still counts for today's schedule.
+        self.assertEqual(sync_enabled_google_sheets(only_due=True)['skipped'], 1)
+        self.assertEqual(mock_fetch_sheet_rows.call_count, 1)
+
+    @patch("career.services.google_sheets.sync_google_sheet")
+    def test_enabled_sheet_syncs_report_timings_and_defer_past_the_time_budget(self, mock_sync_google_sheet):
+        mock_sync_google_sheet.return_value = {'created': 1, 'updated': 0, 'skipped': 0, 'errors': []}
+        for name, last_synced_at in [('Recent', timezone.now()), ('Never synced', None)]:
+            GoogleSheetSyncConfig.objects.create(
+                user=self.user,
+                name=name,
+                sheet_url='https://docs.google.com/spreadsheets/d/test/edit',
+                spreadsheet_id='test',
+                target_type=GoogleSheetSyncConfig.TARGET_APPLICATIONS,
+                last_synced_at=last_synced_at,
+            )
+
+        summary = sync_enabled_google_sheets()
+
+        self.assertEqual(summary['created'], 2)
+        self.assertEqual([timing['config'] for timing in summary['timings']], ['Never synced', 'Recent'])
+        self.assertTrue(all(timing['status'] == 'success' for timing in summary['timings']))
+
+        mock_sync_google_sheet.reset_mock()
+        summary = sync_enabled_google_sheets(time_budget=0)
+
+        mock_sync_google_sheet.assert_not_called()
+        self.assertEqual(summary['deferred'], 2)
+        self.assertEqual({timing['status'] for timing in summary['timings']}, {'deferred'})
+
+        # A deadline shared with the caller stops new syncs well before it passes.
+        summary = sync_enabled_google_sheets(deadline=monotonic() + SYNC_START_CUTOFF_SECONDS - 1)
+        mock_sync_google_sheet.assert_not_called()
+        self.assertEqual(summary['deferred'], 2)
+
     @patch("career.services.google_sheets.fetch_sheet_rows")
     def test_import_review_detects_new_status_changes_and_possible_duplicates(self, mock_fetch_sheet_rows):
         company = Company.objects.create(user=self.user, name='Acme')
@@ -745,10 +1019,14 @@ class GoogleSheetApplicationStatusSyncTests(APITestCase):
         review = build_import_review(config)
         plaid_item = next(item for item in review['items'] if item['company_name'] == 'Plaid')
 
-        result = apply_import_review(config, approved_item_ids=[plaid_item['id']])
+        result = apply_import_review(config, approved_item_ids=[plaid_item['id']], review_id=review['review_id'])
 
         self.assertEqual(result['created'], 1)
         self.assertEqual(result['rejected'], 1)
+        self.assertEqual(mock_fetch_sheet_rows.call_count, 1)
+        self.assertFalse(GoogleSheetImportReview.objects.filter(id=review['review_id']).exists())
+        with self.assertRaises(ValidationError):
+            apply_import_review(config, approved_item_ids=[plaid_item['id']], review_id=review['review_id'])
         self.assertTrue(Application.objects.filter(user=self.user, company__name='Plaid').exists())
         self.assertFalse(Application.objects.filter(user=self.user, company__name='Stripe').exists())
 
@@ -790,6 +1068,8 @@ class GoogleSheetApplicationStatusSyncTests(APITestCase):
             duplicate_resolutions={duplicate_item['id']: 'keep_separate'},
         )
 
+        # Without a review_id the sheet is reviewed again rather than reusing the stored snapshot.
+        self.assertEqual(mock_fetch_sheet_rows.call_count, 2)
         self.assertEqual(result['created'], 1)
         self.assertEqual(
             Application.objects.filter(
@@ -851,6 +1131,89 @@ class GoogleSheetApplicationStatusSyncTests(APITestCase):
         self.assertTrue(any(entry['type'] == 'custom_stage_created' and entry['after'] == 'ROUND_10' for entry in result['history']))
         self.assertTrue(any(entry['type'] == 'duplicate_matched' for entry in result['history']))
 
+    @patch("career.services.google_sheets.fetch_sheet_rows")
+    def test_sync_change_log_is_paged_rolled_back_and_compacted(self, mock_fetch_sheet_rows):
+        mock_fetch_sheet_rows.return_value = [
+            ['Company', 'Role'],
+            ['Stripe', 'Software Engineer'],
+            ['Plaid', 'Software Engineer'],
+            ['Ramp', 'Backend Engineer'],
+        ]
+        config = GoogleSheetSyncConfig.objects.create(
+            user=self.user,
+            name='Applications',
+            sheet_url='https://docs.google.com/spreadsheets/d/test/edit',
+            spreadsheet_id='test',
+            target_type=GoogleSheetSyncConfig.TARGET_APPLICATIONS,
+            column_mapping={'company_name': 'Company', 'role_title': 'Role'},
+        )
+        sync_google_sheet(config)
+        run = config.runs.get()
+        config.refresh_from_db()
+        self.assertNotIn('history', config.last_result)
+        self.assertEqual(config.last_result['run_id'], run.id)
+
+        self.client.force_authenticate(self.user)
+        url = f'/api/career/google-sheet-syncs/{config.id}/runs/{run.id}/changes/'
+        first_page = self.client.get(url, {'limit': 2}).data
+        second_page = self.client.get(url, {'limit': 2, 'after': first_page['next_after']}).data
+        self.assertEqual(len(first_page['changes']), 2)
+        self.assertEqual(len(second_page['changes']), 1)
+        self.assertIsNone(second_page['next_after'])
+        runs = self.client.get(f'/api/career/google-sheet-syncs/{config.id}/runs/').data['runs']
+        self.assertEqual(runs[0]['change_count'], 3)
+
+        rollback_sync_run(run.id, self.user)
+        self.assertFalse(Application.objects.filter(user=self.user).exists())
+
+        GoogleSheetSyncRun.objects.filter(id=run.id).update(started_at=timezone.now() - timedelta(days=45))
+        summary = compact_google_sheet_sync_runs(retention_days=30)
+        run.refresh_from_db()
+        self.assertEqual(summary['compacted_runs'], 1)
+        self.assertIsNotNone(run.compacted_at)
+        self.assertFalse(GoogleSheetSyncChange.objects.filter(run=run).exists())
+
+
+    @patch("career.services.google_sheets.fetch_sheet_rows")
+    def test_application_sync_query_count_does_not_grow_with_rows(self, mock_fetch_sheet_rows):
+        config = GoogleSheetSyncConfig.objects.create(
+            user=self.user,
+            name='Applications',
+            sheet_url='https://docs.google.com/spreadsheets/d/test/edit',
+            spreadsheet_id='test',
+            target_type=GoogleSheetSyncConfig.TARGET_APPLICATIONS,
+            column_mapping={'company_name': 'Company', 'role_title': 'Role', 'status': 'Status'},
+        )
+
+        def sync(row_count):
+            mock_fetch_sheet_rows.return_value = [['Company', 'Role', 'Status']] + [
+                [f'Company {index}', 'Engineer', '1st Round'] for index in range(row_count)
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                result = sync_google_sheet(config, force=True)
+            return result, len(queries)
+
+        def reset():
+            GoogleSheetSyncRow.objects.filter(config=config).delete()
+            Application.objects.filter(user=self.user).delete()
+
+        sync(1)
+        reset()
+        small_result, small_queries = sync(5)
+        reset()
+        large_result, large_queries = sync(60)
+
+        self.assertEqual(small_result['created'], 5)
+        self.assertEqual(large_result['created'], 60)
+        self.assertEqual(large_result['errors'], [])
+        # Bulk inserts may be split by the backend's parameter limit, nothing per row.
+        self.assertLessEqual(large_queries, small_queries + 2)
+
+        updated_result, _queries = sync(60)
+        self.assertEqual(updated_result['updated'], 60)
+        self.assertEqual(GoogleSheetSyncRow.objects.filter(config=config).count(), 60)
+        self.assertEqual(Application.objects.filter(user=self.user, status='ROUND_1').count(), 60)
+
 
 class ExperienceLogoUploadTests(APITestCase):
     def setUp(self):
@@ -914,6 +1277,52 @@ class ExperienceLogoUploadTests(APITestCase):
         self.assertEqual(serializer.data["logo"], "/media/experience_logos/legacy-logo.png")
 
 
+class ExperienceImportTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="import-user@example.com",
+            email="import-user@example.com",
+            password="StrongPassw0rd!",
+        )
+        self.client.force_authenticate(self.user)
+
+    def _import(self, payload):
+        upload = SimpleUploadedFile(
+            "experiences.json",
+            json.dumps(payload).encode("utf-8"),
+            content_type="application/json",
+        )
+        return self.client.post("/api/career/experiences/import/", {"file": upload}, format="multipart")
+
+    def test_json_import_streams_records_from_experiences_key(self):
+        response = self._import(
+            {
+                "exported_at": "2026-01-01",
+                "experiences": [
+                    {"title": "Engineer", "company": "Acme", "skills": ["Python"]},
+                    {"title": "Analyst", "company": "Globex"},
+                ],
+            }
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            sorted(Experience.objects.filter(user=self.user).values_list("title", flat=True)),
+            ["Analyst", "Engineer"],
+        )
+
+    def test_json_import_rejects_empty_and_oversized_files(self):
+        response = self._import({"items": []})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"], "No experiences found in import file")
+
+        with self.settings(MAX_IMPORT_ROWS=2):
+            response = self._import([{"title": f"Role {index}"} for index in range(3)])
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Experience.objects.filter(user=self.user).exists())
+
+
 class JobBoardImportTests(APITestCase):
     def setUp(self):
         self.user = get_user_model().objects.create_user(
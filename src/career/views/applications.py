@@ -9,8 +9,9 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from availability.models import UserSettings
+from availability.models import ExportJob, UserSettings
 from availability.utils import export_data
+from availability.views.exports import queued_export_response, wants_async_export
 from ..models import Application, Company
 from ..serializers import ApplicationExportSerializer, ApplicationSerializer
 from ..services.offers import ensure_offer_for_application
@@ -118,6 +119,8 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def export(self, request):
         fmt = request.query_params.get('fmt', 'csv')
+        if wants_async_export(request):
+            return queued_export_response(request, ExportJob.SCOPE_APPLICATIONS, fmt)
         return export_data(self.get_queryset(), ApplicationExportSerializer, fmt, 'applications')
 
 
@@ -8,7 +8,9 @@ from rest_framework.decorators import action
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.response import Response
 
+from availability.models import ExportJob
 from availability.utils import export_data
+from availability.views.exports import queued_export_response, wants_async_export
 
 from ..models import Application, Document
 from ..serializers import DocumentExportSerializer, DocumentSerializer
@@ -131,6 +133,8 @@ class DocumentViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def export(self, request):
         fmt = request.query_params.get('fmt', 'csv')
+        if wants_async_export(request):
+            return queued_export_response(request, ExportJob.SCOPE_DOCUMENTS, fmt)
         return export_data(self.get_queryset(), DocumentExportSerializer, fmt, 'documents')
 
     @action(detail=True, methods=['get'])
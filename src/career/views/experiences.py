@@ -14,7 +14,10 @@ from rest_framework.exceptions import ValidationError as DRFValidationError
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from availability.json_stream import iter_json_items
+from availability.models import ExportJob
 from availability.utils import export_data
+from availability.views.exports import queued_export_response, wants_async_export
 from ..models import Application, Company, Experience, Offer
 from ..services import delete_logo_asset, store_logo_file
 from ..serializers import ExperienceExportSerializer, ExperienceSerializer
@@ -262,6 +265,8 @@ class ExperienceViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def export(self, request):
         fmt = request.query_params.get('fmt', 'csv')
+        if wants_async_export(request):
+            return queued_export_response(request, ExportJob.SCOPE_EXPERIENCES, fmt)
         return export_data(self.get_queryset(), ExperienceExportSerializer, fmt, 'experiences')
 
     @action(detail=True, methods=['post'], url_path='upload-logo', parser_classes=[MultiPartParser])
@@ -306,9 +311,6 @@ class ImportExperiencesView(APIView):
                 'Experience import file',
             )
             records = self._load_records(file_obj)
-            if not isinstance(records, list) or not records:
-                return Response({'error': 'No experiences found in import file'}, status=status.HTTP_400_BAD_REQUEST)
-
             created_count = 0
             offer_map = {}
 
@@ -336,6 +338,9 @@ class ImportExperiencesView(APIView):
 
                     created_count += 1
 
+                if not created_count:
+                    return Response({'error': 'No experiences found in import file'}, status=status.HTTP_400_BAD_REQUEST)
+
             return Response({'message': f'Successfully imported {created_count} experiences'})
         except DRFValidationError as exc:
             detail = exc.detail[0] if isinstance(exc.detail, list) else exc.detail
@@ -346,13 +351,7 @@ class ImportExperiencesView(APIView):
     def _load_records(self, file_obj):
         file_name = file_obj.name.lower()
         if file_name.endswith('.json'):
-            payload = json.loads(file_obj.read().decode('utf-8'))
-            if isinstance(payload, dict):
-                records = payload.get('experiences') or payload.get('items') or []
-            else:
-                records = payload
-            validate_import_row_count(len(records), 'Experience import file')
-            return records
+            return self._iter_json_records(file_obj)
         if file_name.endswith('.csv'):
             df = pd.read_csv(file_obj, nrows=settings.MAX_IMPORT_ROWS + 1)
             validate_import_row_count(len(df.index), 'Experience import file')
@@ -362,3 +361,19 @@ class ImportExperiencesView(APIView):
             validate_import_row_count(len(df.index), 'Experience import file')
             return df.where(pd.notna(df), None).to_dict(orient='records')
         raise ValueError('Unsupported file format')
+
+    def _iter_json_records(self, file_obj):
+        # Records stream straight into the import; the first of a top-level list,
+        # "experiences" or "items" to produce a record is the one that is read.
+        records_path = None
+        row_count = 0
+        for path, record in iter_json_items(file_obj, depth=1):
+            if path not in {(), ('experiences',), ('items',)}:
+                continue
+            if records_path is None:
+                records_path = path
+            elif path != records_path:
+                continue
+            row_count += 1
+            validate_import_row_count(row_count, 'Experience import file')
+            yield record
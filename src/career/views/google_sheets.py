@@ -2,10 +2,21 @@ from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
-from ..models import GoogleSheetSyncConfig, GoogleSheetSyncRun
-from ..serializers import GoogleSheetSyncConfigSerializer, GoogleSheetSyncRunSerializer
+from ..models import GoogleSheetSyncChange, GoogleSheetSyncConfig, GoogleSheetSyncRun
+from ..serializers import GoogleSheetSyncChangeSerializer, GoogleSheetSyncConfigSerializer, GoogleSheetSyncRunSerializer
 from ..services.google_sheets import apply_import_review, build_import_review, parse_google_sheet_url, preview_sheet, sync_google_sheet, rollback_sync_run
 
+RUNS_PAGE_SIZE = 50
+CHANGES_PAGE_SIZE = 200
+
+
+def _page_limit(request, default):
+    try:
+        limit = int(request.query_params.get('limit') or default)
+    except (TypeError, ValueError):
+        limit = default
+    return max(1, min(limit, default))
+
 
 class GoogleSheetSyncConfigViewSet(viewsets.ModelViewSet):
     serializer_class = GoogleSheetSyncConfigSerializer
@@ -83,20 +94,64 @@ class GoogleSheetSyncConfigViewSet(viewsets.ModelViewSet):
                 {'duplicate_resolutions': ['Expected an object keyed by review item ID.']},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        review_id = request.data.get('review_id')
+        if review_id is not None and not str(review_id).isdigit():
+            return Response(
+                {'review_id': ['Expected the review_id returned by import-review.']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
         result = apply_import_review(
             config,
             approved_item_ids=approved_item_ids,
             duplicate_resolutions=duplicate_resolutions,
             force=bool(request.data.get('force', False)),
+            review_id=review_id,
         )
         return Response({'ok': True, 'result': result}, status=status.HTTP_200_OK)
 
     @action(detail=True, methods=['get'], url_path='runs')
     def get_runs(self, request, pk=None):
         config = self.get_object()
-        runs = config.runs.all().order_by('-started_at')[:50]
-        serializer = GoogleSheetSyncRunSerializer(runs, many=True)
-        return Response({'ok': True, 'runs': serializer.data}, status=status.HTTP_200_OK)
+        limit = _page_limit(request, RUNS_PAGE_SIZE)
+        runs = config.runs.all().order_by('-id')
+        before = request.query_params.get('before')
+        if before and before.isdigit():
+            runs = runs.filter(id__lt=int(before))
+        runs = list(runs[:limit + 1])
+        serializer = GoogleSheetSyncRunSerializer(runs[:limit], many=True)
+        return Response(
+            {
+                'ok': True,
+                'runs': serializer.data,
+                'next_before': runs[limit - 1].id if len(runs) > limit else None,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @action(detail=True, methods=['get'], url_path=r'runs/(?P<run_id>\d+)/changes')
+    def get_run_changes(self, request, pk=None, run_id=None):
+        config = self.get_object()
+        run = config.runs.filter(id=run_id).first()
+        if not run:
+            return Response({'error': 'Sync run not found.'}, status=status.HTTP_404_NOT_FOUND)
+        kind = (request.query_params.get('kind') or GoogleSheetSyncChange.KIND_CHANGE).upper()
+        if kind not in {GoogleSheetSyncChange.KIND_CHANGE, GoogleSheetSyncChange.KIND_HISTORY}:
+            return Response({'kind': ['Expected change or history.']}, status=status.HTTP_400_BAD_REQUEST)
+        limit = _page_limit(request, CHANGES_PAGE_SIZE)
+        entries = run.change_entries.filter(kind=kind).order_by('id')
+        after = request.query_params.get('after')
+        if after and after.isdigit():
+            entries = entries.filter(id__gt=int(after))
+        entries = list(entries[:limit + 1])
+        serializer = GoogleSheetSyncChangeSerializer(entries[:limit], many=True)
+        return Response(
+            {
+                'ok': True,
+                'changes': serializer.data,
+                'next_after': entries[limit - 1].id if len(entries) > limit else None,
+            },
+            status=status.HTTP_200_OK,
+        )
 
     @action(detail=True, methods=['post'], url_path='rollback')
     def rollback(self, request, pk=None):
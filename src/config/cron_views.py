@@ -1,13 +1,23 @@
 import os
+from time import monotonic
 
+from django.conf import settings
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from availability.tasks import expire_stale_share_links, purge_expired_account_deletions
+from availability.tasks import (
+    dispatch_booking_emails,
+    expire_stale_share_links,
+    extend_event_occurrence_horizon,
+    purge_expired_account_deletions,
+    purge_expired_export_jobs,
+    purge_stale_booking_inventory,
+    run_export_jobs,
+)
 from career.tasks import auto_ghost_stale_applications
-from career.services.google_sheets import sync_enabled_google_sheets
+from career.services.google_sheets import compact_google_sheet_sync_runs, sync_enabled_google_sheets
 
 
 class AuthenticatedCronView(APIView):
@@ -22,17 +32,29 @@ class AuthenticatedCronView(APIView):
         return None
 
 
+def _sheet_sync_deadline():
+    # Measured from the start of the request, so work done before the sheet
+    # syncs comes out of the same budget under the function's maxDuration.
+    return monotonic() + getattr(settings, "GOOGLE_SHEET_SYNC_TIME_BUDGET_SECONDS", 20)
+
+
 class DailyMaintenanceCronView(AuthenticatedCronView):
     def get(self, request):
         unauthorized = self._unauthorized_response(request)
         if unauthorized:
             return unauthorized
 
+        deadline = _sheet_sync_deadline()
         results = {
             "applications": auto_ghost_stale_applications(),
             "share_links": expire_stale_share_links(),
+            "booking_inventory": purge_stale_booking_inventory(),
             "account_deletions": purge_expired_account_deletions(),
-            "google_sheet_syncs": sync_enabled_google_sheets(),
+            "event_occurrences": extend_event_occurrence_horizon(),
+            "booking_emails": dispatch_booking_emails(),
+            "google_sheet_syncs": sync_enabled_google_sheets(deadline=deadline),
+            "google_sheet_runs": compact_google_sheet_sync_runs(),
+            "export_jobs": purge_expired_export_jobs(),
         }
         return Response({"ok": True, "results": results}, status=status.HTTP_200_OK)
 
@@ -43,5 +65,28 @@ class GoogleSheetSyncCronView(AuthenticatedCronView):
         if unauthorized:
             return unauthorized
 
-        results = sync_enabled_google_sheets(only_due=True)
+        results = {
+            "google_sheet_syncs": sync_enabled_google_sheets(only_due=True, deadline=_sheet_sync_deadline()),
+            "google_sheet_runs": compact_google_sheet_sync_runs(),
+        }
+        return Response({"ok": True, "results": results}, status=status.HTTP_200_OK)
+
+
+class BookingEmailDispatchCronView(AuthenticatedCronView):
+    def get(self, request):
+        unauthorized = self._unauthorized_response(request)
+        if unauthorized:
+            return unauthorized
+
+        results = dispatch_booking_emails()
+        return Response({"ok": True, "results": results}, status=status.HTTP_200_OK)
+
+
+class ExportJobCronView(AuthenticatedCronView):
+    def get(self, request):
+        unauthorized = self._unauthorized_response(request)
+        if unauthorized:
+            return unauthorized
+
+        results = run_export_jobs()
         return Response({"ok": True, "results": results}, status=status.HTTP_200_OK)
@@ -357,6 +357,24 @@ AI_PROVIDER_REQUEST_TIMEOUT_SECONDS = int(
 GOOGLE_OAUTH_CLIENT_ID = os.environ.get("GOOGLE_OAUTH_CLIENT_ID", "")
 GOOGLE_OAUTH_CLIENT_SECRET = os.environ.get("GOOGLE_OAUTH_CLIENT_SECRET", "")
 GOOGLE_OAUTH_SUCCESS_REDIRECT_URL = os.environ.get("GOOGLE_OAUTH_SUCCESS_REDIRECT_URL", "")
+# Cron-driven sheet syncs run on a small thread pool and checkpoint once the
+# budget, counted from the start of the cron request, is spent, leaving
+# headroom under Vercel's 30s limit.
+GOOGLE_SHEET_SYNC_MAX_WORKERS = int(os.environ.get("GOOGLE_SHEET_SYNC_MAX_WORKERS", "4"))
+GOOGLE_SHEET_SYNC_TIME_BUDGET_SECONDS = float(
+    os.environ.get("GOOGLE_SHEET_SYNC_TIME_BUDGET_SECONDS", "20")
+)
+GOOGLE_SHEET_SYNC_RUN_RETENTION_DAYS = int(os.environ.get("GOOGLE_SHEET_SYNC_RUN_RETENTION_DAYS", "30"))
+# Export jobs are built by the export-jobs cron or `manage.py run_export_jobs`;
+# finished artifacts are kept (and reused while the data is unchanged) this long.
+EXPORT_JOB_TIME_BUDGET_SECONDS = float(os.environ.get("EXPORT_JOB_TIME_BUDGET_SECONDS", "20"))
+EXPORT_JOB_RETENTION_DAYS = int(os.environ.get("EXPORT_JOB_RETENTION_DAYS", "7"))
+# Daily maintenance extends recurring series toward the occurrence horizon for
+# this long; series it does not reach are picked up first on the next run.
+EVENT_OCCURRENCE_TIME_BUDGET_SECONDS = float(os.environ.get("EVENT_OCCURRENCE_TIME_BUDGET_SECONDS", "5"))
+# Bounds each SMTP call made by the booking-emails cron so one slow mail
+# server cannot use up the function's time limit.
+EMAIL_TIMEOUT = int(os.environ.get("EMAIL_TIMEOUT", "10"))
 
 # Cache TTL used across the project (in seconds)
 CACHE_TTL = 300  # 5 minutes
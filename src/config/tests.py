@@ -1,7 +1,14 @@
+import os
+from datetime import timedelta
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
 from django.test import override_settings
+from django.utils import timezone
 from rest_framework.test import APITestCase
 
+from career.models import GoogleSheetSyncConfig, GoogleSheetSyncRun
+
 
 class SecurityDashboardTests(APITestCase):
     def test_security_dashboard_requires_authentication(self):
@@ -37,3 +44,36 @@ class PublicBookingRedirectTests(APITestCase):
             response['Location'],
             'https://careerhub-frontend-eight.vercel.app/book/link-uuid/booking-uuid/reschedule?timezone=PT',
         )
+
+
+class GoogleSheetSyncCronTests(APITestCase):
+    @patch.dict(os.environ, {"CRON_SECRET": "cron-secret"})
+    def test_sheet_sync_cron_compacts_run_logs_past_retention(self):
+        user = get_user_model().objects.create_user(
+            username='sheet-cron@example.com',
+            email='sheet-cron@example.com',
+            password='pass12345',
+        )
+        config = GoogleSheetSyncConfig.objects.create(
+            user=user,
+            name='Applications',
+            sheet_url='https://docs.google.com/spreadsheets/d/test/edit',
+            spreadsheet_id='test',
+            enabled=False,
+        )
+        run = GoogleSheetSyncRun.objects.create(
+            config=config,
+            status=GoogleSheetSyncRun.STATUS_SUCCESS,
+            started_at=timezone.now() - timedelta(days=45),
+        )
+
+        unauthorized = self.client.get('/api/internal/cron/google-sheet-syncs/')
+        response = self.client.get(
+            '/api/internal/cron/google-sheet-syncs/', HTTP_AUTHORIZATION='Bearer cron-secret'
+        )
+
+        self.assertEqual(unauthorized.status_code, 401)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results']['google_sheet_runs']['compacted_runs'], 1)
+        run.refresh_from_db()
+        self.assertIsNotNone(run.compacted_at)
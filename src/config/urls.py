@@ -3,7 +3,12 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
-from .cron_views import DailyMaintenanceCronView, GoogleSheetSyncCronView
+from .cron_views import (
+    BookingEmailDispatchCronView,
+    DailyMaintenanceCronView,
+    ExportJobCronView,
+    GoogleSheetSyncCronView,
+)
 from .public_redirect_views import redirect_public_booking
 from .security_views import SecurityDashboardView
 
@@ -24,6 +29,16 @@ urlpatterns = [
         GoogleSheetSyncCronView.as_view(),
         name="google-sheet-sync-cron",
     ),
+    path(
+        "api/internal/cron/booking-emails/",
+        BookingEmailDispatchCronView.as_view(),
+        name="booking-email-cron",
+    ),
+    path(
+        "api/internal/cron/export-jobs/",
+        ExportJobCronView.as_view(),
+        name="export-job-cron",
+    ),
     path("api/auth/", include("config.auth_urls")),
     path('api/', include('availability.urls')),
     path('api/career/', include('career.urls')),